@@ -0,0 +1,114 @@
+"""Cache of serialized historical states for the history stream."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import math
+import threading
+
+from homeassistant.core import callback
+
+from .const import HISTORY_STREAM_CACHE_BUCKET, HISTORY_STREAM_CACHE_MAX_BYTES
+
+type HistoryStreamCacheKey = tuple[tuple[str, ...], bool, bool, bool, float]
+type SerializedChunk = tuple[bytes, float]
+
+# Rough size of the bookkeeping of a bucket so buckets
+# without any states still count towards the limit
+BUCKET_OVERHEAD_BYTES = 256
+
+
+class HistoryStreamCache:
+    """Cache already serialized compressed states of closed time buckets.
+
+    A bucket can only be cached once the recorder has committed every
+    state inside of it, so a cached bucket never changes. The cache is
+    sealed up to the committed watermark of the recorder after a history
+    stream synchronized with it.
+
+    Buckets are evicted least recently used first once the total size of
+    the serialized states exceeds max_bytes. All buckets are dropped when
+    the recorder deletes states.
+
+    Lookups and stores happen in the executor so they are guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = HISTORY_STREAM_CACHE_BUCKET,
+        max_bytes: int = HISTORY_STREAM_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache."""
+        self.bucket_seconds = bucket_seconds
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.sealed_ts = 0.0
+        # Increased when the cache is cleared so buckets read from the
+        # database before states were deleted are not stored
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict[
+            HistoryStreamCacheKey, tuple[list[SerializedChunk], int]
+        ] = OrderedDict()
+
+    @callback
+    def async_seal(self, committed_ts: float) -> None:
+        """Mark all buckets that end before committed_ts as cacheable.
+
+        Must only be called once the recorder has committed all
+        states up to committed_ts.
+        """
+        self.sealed_ts = max(self.sealed_ts, committed_ts)
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all buckets."""
+        with self._lock:
+            self._buckets.clear()
+            self.size = 0
+            self.generation += 1
+
+    def sealed_buckets(self, start_ts: float, end_ts: float) -> list[float]:
+        """Return the start of the sealed buckets that fit between start and end."""
+        bucket_seconds = self.bucket_seconds
+        first = math.ceil(start_ts / bucket_seconds) * bucket_seconds
+        last_end = min(end_ts, self.sealed_ts)
+        return [
+            float(bucket_start)
+            for bucket_start in range(
+                first, int(last_end) - bucket_seconds + 1, bucket_seconds
+            )
+        ]
+
+    def get(self, key: HistoryStreamCacheKey) -> list[SerializedChunk] | None:
+        """Return the serialized chunks of a bucket."""
+        with self._lock:
+            if (cached := self._buckets.get(key)) is None:
+                return None
+            self._buckets.move_to_end(key)
+            return cached[0]
+
+    def put(
+        self,
+        key: HistoryStreamCacheKey,
+        chunks: list[SerializedChunk],
+        generation: int | None = None,
+    ) -> None:
+        """Store the serialized chunks of a bucket.
+
+        The chunks are not stored if the cache was cleared since generation.
+        """
+        size = BUCKET_OVERHEAD_BYTES + sum(len(payload) for payload, _ in chunks)
+        if size > self.max_bytes // 4:
+            # A single bucket should never push out most of the cache
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if (replaced := self._buckets.pop(key, None)) is not None:
+                self.size -= replaced[1]
+            self._buckets[key] = (chunks, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size) = self._buckets.popitem(last=False)
+                self.size -= evicted_size
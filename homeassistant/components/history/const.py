@@ -1,7 +1,29 @@
 """History integration constants."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.util.hass_dict import HassKey
+
+if TYPE_CHECKING:
+    from .cache import HistoryStreamCache
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Number of states sent in each message when streaming historical states
+HISTORY_STREAM_CHUNK_SIZE = 5000
+
+# Historical states are cached in buckets of this many seconds
+HISTORY_STREAM_CACHE_BUCKET = 3600
+
+# Total size of the serialized states that are kept in the cache
+HISTORY_STREAM_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+DATA_HISTORY_STREAM_CACHE: HassKey[HistoryStreamCache] = HassKey(
+    f"{DOMAIN}_stream_cache"
+)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.const import SIGNAL_RECORDER_STATES_PURGED
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -30,6 +31,7 @@ from homeassistant.core import (
     is_callback,
     valid_entity_id,
 )
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
     async_track_state_change_event,
@@ -38,7 +40,13 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .cache import HistoryStreamCache, SerializedChunk
+from .const import (
+    DATA_HISTORY_STREAM_CACHE,
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_CHUNK_SIZE,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,6 +66,8 @@ class HistoryLiveStream:
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history websocket API."""
+    cache = hass.data[DATA_HISTORY_STREAM_CACHE] = HistoryStreamCache()
+    async_dispatcher_connect(hass, SIGNAL_RECORDER_STATES_PURGED, cache.async_clear)
     websocket_api.async_register_command(hass, ws_get_history_during_period)
     websocket_api.async_register_command(hass, ws_stream)
 
@@ -213,58 +223,196 @@ def _generate_websocket_response(
     )
 
 
-def _generate_historical_response(
+def _construct_stream_message(
+    msg_id: int, states_json: bytes, start_time_ts: float, end_time_ts: float
+) -> bytes:
+    """Construct a history stream message from serialized states."""
+    return b"".join(
+        (
+            b'{"id":',
+            str(msg_id).encode(),
+            b',"type":"event","event":{"states":',
+            states_json,
+            b',"start_time":',
+            json_bytes(start_time_ts),
+            b',"end_time":',
+            json_bytes(end_time_ts),
+            b"}}",
+        )
+    )
+
+
+def _serialized_historical_chunks(
     hass: HomeAssistant,
-    msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
-    send_empty: bool,
-) -> tuple[float, dt | None, bytes | None]:
-    """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
+) -> Generator[SerializedChunk]:
+    """Yield serialized chunks of historical states with their newest timestamp."""
+    for states in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        HISTORY_STREAM_CHUNK_SIZE,
+    ):
+        chunk_last_time_ts = 0.0
+        for state_list in states.values():
+            if (
+                state_list
+                and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
+                > chunk_last_time_ts
+            ):
+                chunk_last_time_ts = cast(float, state_last_time)
+        if chunk_last_time_ts != 0:
+            yield json_bytes(states), chunk_last_time_ts
+
+
+def _historical_chunks(
+    hass: HomeAssistant,
+    cache: HistoryStreamCache | None,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> Generator[SerializedChunk]:
+    """Yield serialized chunks of historical states.
+
+    Whole buckets that have been sealed are served from the cache and
+    only the partial buckets at the start and end of the window are
+    fetched from the database.
+    """
+    if cache is None or not (
+        buckets := cache.sealed_buckets(start_time.timestamp(), end_time.timestamp())
+    ):
+        yield from _serialized_historical_chunks(
             hass,
             start_time,
             end_time,
             entity_ids,
-            None,
             include_start_time_state,
             significant_changes_only,
             minimal_response,
             no_attributes,
-            True,
-        ),
+        )
+        return
+
+    bucket_seconds = cache.bucket_seconds
+    # The queries exclude states at the start time so move the start of
+    # each bucket back by one microsecond to include states at its start
+    before_bucket = timedelta(microseconds=1)
+    yield from _serialized_historical_chunks(
+        hass,
+        start_time,
+        dt_util.utc_from_timestamp(buckets[0]),
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
+    entities = tuple(sorted(set(entity_ids)))
+    for bucket_start_ts in buckets:
+        key = (
+            entities,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            bucket_start_ts,
+        )
+        if (chunks := cache.get(key)) is None:
+            generation = cache.generation
+            chunks = list(
+                _serialized_historical_chunks(
+                    hass,
+                    dt_util.utc_from_timestamp(bucket_start_ts) - before_bucket,
+                    dt_util.utc_from_timestamp(bucket_start_ts + bucket_seconds),
+                    entity_ids,
+                    False,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                )
+            )
+            cache.put(key, chunks, generation)
+        yield from chunks
+    yield from _serialized_historical_chunks(
+        hass,
+        dt_util.utc_from_timestamp(buckets[-1] + bucket_seconds) - before_bucket,
+        end_time,
+        entity_ids,
+        False,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+
+
+def _stream_historical_response(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    cache: HistoryStreamCache | None,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    send_empty: bool,
+) -> float:
+    """Stream historical states to the client in chunks.
+
+    Each chunk is serialized in the executor and handed to the event loop
+    as soon as it is ready so the full history of a long time window is
+    never held in memory at once. Returns the timestamp of the newest
+    state that was sent, or 0 if no states were sent.
+    """
+    start_time_ts = start_time.timestamp()
     last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
+    for states_json, chunk_last_time_ts in _historical_chunks(
+        hass,
+        cache,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    ):
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while streaming historical states
+            return last_time_ts
+        last_time_ts = max(last_time_ts, chunk_last_time_ts)
+        hass.loop.call_soon_threadsafe(
+            connection.send_message,
+            _construct_stream_message(
+                msg_id, states_json, start_time_ts, chunk_last_time_ts
+            ),
+        )
 
-    if last_time_ts == 0:
+    if last_time_ts == 0 and send_empty:
         # If we did not send any states ever, we need to send an empty response
         # so the websocket client knows it should render/process/consume the
         # data.
-        if not send_empty:
-            return last_time_ts, None, None
-        last_time_dt = end_time
-    else:
-        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
-
-    return (
-        last_time_ts,
-        last_time_dt,
-        _generate_websocket_response(msg_id, start_time, last_time_dt, states),
-    )
+        hass.loop.call_soon_threadsafe(
+            connection.send_message,
+            _generate_websocket_response(msg_id, start_time, end_time, {}),
+        )
+    return last_time_ts
 
 
 async def _async_send_historical_states(
@@ -273,18 +421,21 @@ async def _async_send_historical_states(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    cache: HistoryStreamCache | None = None,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
+    last_time_ts = await instance.async_add_executor_job(
+        _stream_historical_response,
         hass,
+        connection,
+        cache,
         msg_id,
         start_time,
         end_time,
@@ -295,9 +446,7 @@ async def _async_send_historical_states(
         no_attributes,
         send_empty,
     )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    return dt_util.utc_from_timestamp(last_time_ts) if last_time_ts != 0 else None
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -306,7 +455,7 @@ def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, An
     if not no_attributes or state.domain in history.NEED_ATTRIBUTE_DOMAINS:
         comp_state[COMPRESSED_STATE_ATTRIBUTES] = state.attributes
     comp_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated_timestamp
-    if state.last_changed != state.last_updated:
+    if state.last_changed_timestamp != state.last_updated_timestamp:
         comp_state[COMPRESSED_STATE_LAST_CHANGED] = state.last_changed_timestamp
     return comp_state
 
@@ -472,6 +621,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            hass.data[DATA_HISTORY_STREAM_CACHE],
         )
         return
 
@@ -536,6 +686,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        hass.data[DATA_HISTORY_STREAM_CACHE],
     )
 
     if msg_id not in connection.subscriptions:
@@ -553,9 +704,22 @@ async def ws_stream(
     )
 
     live_stream.wait_sync_task = create_eager_task(
-        get_instance(hass).async_block_till_done()
+        get_instance(hass).async_block_till_committed()
     )
-    await live_stream.wait_sync_task
+    committed = await live_stream.wait_sync_task
+    # The buckets before the time the recorder has committed
+    # every state up to will never change again. Nothing is sealed
+    # while events are spooled since they are committed later.
+    if (
+        committed
+        and (
+            committed_ts := get_instance(hass).async_committed_watermark(
+                subscriptions_setup_complete_time.timestamp()
+            )
+        )
+        is not None
+    ):
+        hass.data[DATA_HISTORY_STREAM_CACHE].async_seal(committed_ts)
 
     #
     # Fetch any states from the database that have
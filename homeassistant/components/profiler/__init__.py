@@ -17,13 +17,14 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.loop_monitor import async_get_loop_monitor
 from homeassistant.helpers.service import async_register_admin_service
 
 from .const import DOMAIN
@@ -40,6 +41,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_EVENT_BUS_PROFILE = "start_event_bus_profile"
+SERVICE_STOP_EVENT_BUS_PROFILE = "stop_event_bus_profile"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,12 +66,18 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_EVENT_BUS_PROFILE,
+    SERVICE_STOP_EVENT_BUS_PROFILE,
 )
 
+PLATFORMS = [Platform.SENSOR]
+
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+EVENT_BUS_PROFILE_LOG_LISTENERS = 25
+
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
@@ -273,6 +282,43 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    async def _async_start_event_bus_profile(call: ServiceCall) -> None:
+        """Start profiling the event bus."""
+        if hass.bus.async_profile() is not None:
+            raise HomeAssistantError("Event bus profiling already started")
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Event bus profiling has started. Event listener timing is"
+                " available in the Profiler diagnostics until profiling is stopped."
+            ),
+            title="Event bus profiling started",
+            notification_id="profile_event_bus",
+        )
+        hass.bus.async_start_profile()
+
+    async def _async_stop_event_bus_profile(call: ServiceCall) -> None:
+        """Stop profiling the event bus and log the slowest listeners."""
+        if (profile := hass.bus.async_stop_profile()) is None:
+            raise HomeAssistantError("Event bus profiling not running")
+
+        persistent_notification.async_dismiss(hass, "profile_event_bus")
+        for listener in profile["listeners"][:EVENT_BUS_PROFILE_LOG_LISTENERS]:
+            _LOGGER.critical(
+                (
+                    "Event listener %s (%s) for %s: %s calls, %s filtered,"
+                    " total %.6fs, max %.6fs"
+                ),
+                listener["name"],
+                listener["target"],
+                listener["event_type"],
+                listener["count"],
+                listener["filtered"],
+                listener["total"],
+                listener["max"],
+            )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,19 +428,83 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_EVENT_BUS_PROFILE,
+        _async_start_event_bus_profile,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_EVENT_BUS_PROFILE,
+        _async_stop_event_bus_profile,
+    )
+
+    websocket_api.async_register_command(hass, websocket_event_bus_profile)
+    websocket_api.async_register_command(hass, websocket_subscribe_loop_monitor)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
     hass.data.pop(DOMAIN)
+    hass.bus.async_stop_profile()
+    persistent_notification.async_dismiss(hass, "profile_event_bus")
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/event_bus_profile"})
+@callback
+def websocket_event_bus_profile(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the event bus profile recorded so far."""
+    if (profile := hass.bus.async_profile()) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Event bus profiling not running"
+        )
+        return
+    connection.send_result(msg["id"], profile)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "profiler/subscribe_loop_monitor"}
+)
+@callback
+def websocket_subscribe_loop_monitor(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the samples of the event loop monitor."""
+    monitor = async_get_loop_monitor(hass)
+
+    @callback
+    def forward_loop_monitor() -> None:
+        """Forward loop monitor samples to websocket."""
+        connection.send_message(
+            websocket_api.event_message(msg["id"], monitor.as_dict())
+        )
+
+    connection.subscriptions[msg["id"]] = monitor.async_add_listener(
+        forward_loop_monitor
+    )
+
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], monitor.as_dict()))
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
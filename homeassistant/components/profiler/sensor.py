@@ -0,0 +1,113 @@
+"""Sensors for the event loop health monitored by the Profiler."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.loop_monitor import (
+    EXECUTOR_QUEUE,
+    LOOP_LAG,
+    READY_QUEUE,
+    LoopMonitor,
+    async_get_loop_monitor,
+)
+from homeassistant.helpers.typing import StateType
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoopMonitorSensorEntityDescription(SensorEntityDescription):
+    """Describes a loop monitor sensor."""
+
+    value_fn: Callable[[LoopMonitor], StateType]
+
+
+def _recent_max_ms(monitor: LoopMonitor) -> StateType:
+    """Return the largest recent loop lag in milliseconds."""
+    if (lag := monitor.async_recent_max(LOOP_LAG)) is None:
+        return None
+    return round(lag * 1000, 1)
+
+
+SENSORS: tuple[LoopMonitorSensorEntityDescription, ...] = (
+    LoopMonitorSensorEntityDescription(
+        key=LOOP_LAG,
+        translation_key=LOOP_LAG,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_recent_max_ms,
+    ),
+    LoopMonitorSensorEntityDescription(
+        key=READY_QUEUE,
+        translation_key=READY_QUEUE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda monitor: monitor.async_recent_max(READY_QUEUE),
+    ),
+    LoopMonitorSensorEntityDescription(
+        key=EXECUTOR_QUEUE,
+        translation_key=EXECUTOR_QUEUE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda monitor: monitor.async_recent_max(EXECUTOR_QUEUE),
+    ),
+    LoopMonitorSensorEntityDescription(
+        key="long_callbacks",
+        translation_key="long_callbacks",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda monitor: monitor.long_callbacks,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the loop monitor sensors."""
+    monitor = async_get_loop_monitor(hass)
+    async_add_entities(
+        LoopMonitorSensor(monitor, entry, description) for description in SENSORS
+    )
+
+
+class LoopMonitorSensor(SensorEntity):
+    """Sensor with the largest recent sample of an event loop metric."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    entity_description: LoopMonitorSensorEntityDescription
+
+    def __init__(
+        self,
+        monitor: LoopMonitor,
+        entry: ConfigEntry,
+        description: LoopMonitorSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Sample the event loop while the sensor is added."""
+        self.async_on_remove(self._monitor.async_hold())
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self._monitor)
@@ -8,6 +8,8 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.const import (
+    CONF_DOMAINS,
+    CONF_ENTITIES,
     CONF_EXCLUDE,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,  # noqa: F401
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,  # noqa: F401
@@ -16,8 +18,16 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
+    CONF_ENTITY_GLOBS,
+    CONF_EXCLUDE_DOMAINS,
+    CONF_EXCLUDE_ENTITIES,
+    CONF_EXCLUDE_ENTITY_GLOBS,
+    CONF_INCLUDE_DOMAINS,
+    CONF_INCLUDE_ENTITIES,
+    CONF_INCLUDE_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER,
+    convert_filter,
     convert_include_exclude_filter,
 )
 from homeassistant.helpers.integration_platform import (
@@ -54,20 +64,31 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_URL = "sqlite:///{hass_config_path}"
 DEFAULT_DB_FILE = "home-assistant_v2.db"
+DEFAULT_SPOOL_DIR = "recorder_spool"
 DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
+DEFAULT_DB_OUTAGE_SPOOL = False
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_ADAPTIVE_COMMIT_INTERVAL = False
+DEFAULT_BULK_INSERT_STATES = False
+DEFAULT_PURGE_BY_DAY = False
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_DB_OUTAGE_SPOOL = "db_outage_spool"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_PURGE_BY_DAY = "purge_by_day"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_ADAPTIVE_COMMIT_INTERVAL = "adaptive_commit_interval"
+CONF_BULK_INSERT_STATES = "bulk_insert_states"
+CONF_MIN_RECORDED_INTERVAL = "min_recorded_interval"
+CONF_INTERVAL = "interval"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -78,6 +99,10 @@ FILTER_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {vol.Optional(CONF_EXCLUDE, default=EXCLUDE_SCHEMA({})): EXCLUDE_SCHEMA}
 )
 
+MIN_RECORDED_INTERVAL_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
+    {vol.Required(CONF_INTERVAL): vol.All(cv.time_period, cv.positive_timedelta)}
+)
+
 
 ALLOW_IN_MEMORY_DB = False
 
@@ -107,16 +132,32 @@ CONFIG_SCHEMA = vol.Schema(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
+                    vol.Optional(
+                        CONF_PURGE_BY_DAY, default=DEFAULT_PURGE_BY_DAY
+                    ): cv.boolean,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_ADAPTIVE_COMMIT_INTERVAL,
+                        default=DEFAULT_ADAPTIVE_COMMIT_INTERVAL,
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_BULK_INSERT_STATES, default=DEFAULT_BULK_INSERT_STATES
+                    ): cv.boolean,
+                    vol.Optional(CONF_MIN_RECORDED_INTERVAL, default=[]): vol.All(
+                        cv.ensure_list, [MIN_RECORDED_INTERVAL_SCHEMA]
+                    ),
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
                     vol.Optional(
                         CONF_DB_RETRY_WAIT, default=DEFAULT_DB_RETRY_WAIT
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_DB_OUTAGE_SPOOL, default=DEFAULT_DB_OUTAGE_SPOOL
+                    ): cv.boolean,
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
@@ -146,9 +187,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
+    purge_by_day = conf[CONF_PURGE_BY_DAY]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    adaptive_commit_interval = conf[CONF_ADAPTIVE_COMMIT_INTERVAL]
+    bulk_insert_states = conf[CONF_BULK_INSERT_STATES]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    spool_dir = (
+        hass.config.path(DEFAULT_SPOOL_DIR) if conf[CONF_DB_OUTAGE_SPOOL] else None
+    )
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -156,6 +203,22 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     exclude_event_types: set[EventType[Any] | str] = set(
         exclude.get(CONF_EVENT_TYPES, [])
     )
+    min_recorded_intervals = [
+        (
+            convert_filter(
+                {
+                    CONF_INCLUDE_DOMAINS: interval_conf[CONF_DOMAINS],
+                    CONF_INCLUDE_ENTITY_GLOBS: interval_conf[CONF_ENTITY_GLOBS],
+                    CONF_INCLUDE_ENTITIES: interval_conf[CONF_ENTITIES],
+                    CONF_EXCLUDE_DOMAINS: [],
+                    CONF_EXCLUDE_ENTITY_GLOBS: [],
+                    CONF_EXCLUDE_ENTITIES: [],
+                }
+            ).get_filter(),
+            interval_conf[CONF_INTERVAL].total_seconds(),
+        )
+        for interval_conf in conf[CONF_MIN_RECORDED_INTERVAL]
+    ]
     if EVENT_STATE_CHANGED in exclude_event_types:
         _LOGGER.error("State change events cannot be excluded, use a filter instead")
         exclude_event_types.remove(EVENT_STATE_CHANGED)
@@ -164,12 +227,17 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         auto_purge=auto_purge,
         auto_repack=auto_repack,
         keep_days=keep_days,
+        purge_by_day=purge_by_day,
         commit_interval=commit_interval,
+        adaptive_commit_interval=adaptive_commit_interval,
+        bulk_insert_states=bulk_insert_states,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        min_recorded_intervals=min_recorded_intervals,
+        spool_dir=spool_dir,
     )
     get_instance.cache_clear()
     instance.async_initialize()
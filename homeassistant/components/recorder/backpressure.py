@@ -0,0 +1,175 @@
+"""Adaptive commit interval and backpressure for the recorder queue."""
+
+from __future__ import annotations
+
+import threading
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, callback
+
+from .const import MAX_QUEUE_BACKLOG_MIN_VALUE
+
+# Widen the commit window while the queue is deeper than this
+BACKLOG_WIDEN_THRESHOLD = 1000
+
+# Shrink the commit window and stop coalescing once
+# the queue has drained below this
+BACKLOG_SHRINK_THRESHOLD = 100
+
+# Start coalescing superseded state changes in the queue
+# well before the backlog reaches the point where the
+# recorder would have to stop recording
+COALESCE_BACKLOG_THRESHOLD = MAX_QUEUE_BACKLOG_MIN_VALUE // 4
+
+# A commit that takes longer than this fraction of the
+# commit window means the database is the bottleneck
+SLOW_COMMIT_RATIO = 0.5
+
+# A commit that takes less than this fraction of the
+# commit window means the database has headroom
+FAST_COMMIT_RATIO = 0.1
+
+MAX_COMMIT_INTERVAL_MULTIPLIER = 8
+
+
+def merge_state_changed_events(
+    superseded: Event[EventStateChangedData], newer: Event[EventStateChangedData]
+) -> Event[EventStateChangedData]:
+    """Return an event that records a newer state in place of a superseded one.
+
+    The old_state is kept from the superseded event so the last reported
+    time of the previously recorded state is not moved forward to the time
+    of a state that was never recorded.
+    """
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": newer.data["entity_id"],
+            "old_state": superseded.data["old_state"],
+            "new_state": newer.data["new_state"],
+        },
+        newer.origin,
+        newer.time_fired_timestamp,
+        newer.context,
+    )
+
+
+class CommitIntervalController:
+    """Adjust the commit window from the queue depth and commit latency.
+
+    Larger transactions amortize the cost of syncing the database to disk
+    which lets the recorder keep up during event storms on slow storage.
+    """
+
+    def __init__(self, commit_interval: int) -> None:
+        """Initialize the controller."""
+        self.commit_interval = commit_interval
+        self.multiplier = 1
+        self.coalesce = False
+        self.last_commit_time = 0.0
+        self._ticks = 0
+
+    @property
+    def current_commit_interval(self) -> int:
+        """Return the current commit window in seconds."""
+        return self.commit_interval * self.multiplier
+
+    def record_commit_time(self, commit_time: float) -> None:
+        """Record how long the last commit took including retries and lock waits.
+
+        This is called from the recorder thread.
+        """
+        self.last_commit_time = commit_time
+
+    @callback
+    def async_commit_due(self, backlog: int) -> bool:
+        """Update the commit window and return if a commit is due.
+
+        Called every commit_interval seconds from the event loop.
+        """
+        window = self.current_commit_interval
+        last_commit_time = self.last_commit_time
+        if (
+            backlog >= BACKLOG_WIDEN_THRESHOLD
+            or last_commit_time >= window * SLOW_COMMIT_RATIO
+        ):
+            self.multiplier = min(self.multiplier * 2, MAX_COMMIT_INTERVAL_MULTIPLIER)
+        elif (
+            backlog <= BACKLOG_SHRINK_THRESHOLD
+            and last_commit_time <= window * FAST_COMMIT_RATIO
+        ):
+            self.multiplier = max(self.multiplier // 2, 1)
+
+        if backlog >= COALESCE_BACKLOG_THRESHOLD:
+            self.coalesce = True
+        elif backlog <= BACKLOG_SHRINK_THRESHOLD:
+            self.coalesce = False
+
+        self._ticks += 1
+        if self._ticks < self.multiplier:
+            return False
+        self._ticks = 0
+        return True
+
+
+class StateChangedCoalescer:
+    """Collapse superseded state_changed events while they wait in the queue.
+
+    When a state_changed event arrives for an entity that already has an
+    event waiting in the queue, the newer event replaces the queued one
+    instead of being added to the queue. The recorder thread records the
+    newest event in place of the queued one when it reaches it.
+
+    Events that remove an entity are never merged so the removal is always
+    recorded in order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        self._lock = threading.Lock()
+        # entity_id -> the queued event that newer events can replace
+        self._open: dict[str, Event[EventStateChangedData]] = {}
+        # id of the queued event -> the newest event to record in its place
+        self._replacements: dict[int, Event[EventStateChangedData]] = {}
+
+    @callback
+    def async_coalesce(
+        self, event: Event[EventStateChangedData], replace: bool = True
+    ) -> bool:
+        """Track a state_changed event that is about to be queued.
+
+        Returns True if the event replaced one that is already in the
+        queue and must not be queued. Every queued state_changed event must
+        be tracked, with replace False while not coalescing, so a newer
+        event never replaces one queued before events that were not.
+        """
+        entity_id = event.data["entity_id"]
+        with self._lock:
+            if event.data["new_state"] is None:
+                # Changes after a removal must be queued after it
+                self._open.pop(entity_id, None)
+                return False
+            if replace and (queued := self._open.get(entity_id)) is not None:
+                self._replacements[id(queued)] = merge_state_changed_events(
+                    queued, event
+                )
+                return True
+            self._open[entity_id] = event
+            return False
+
+    def resolve(
+        self, event: Event[EventStateChangedData]
+    ) -> Event[EventStateChangedData]:
+        """Return the event to record for an event taken off the queue.
+
+        This is called from the recorder thread.
+        """
+        # An event is always tracked before it is queued so if there is
+        # nothing tracked the event cannot have been replaced
+        if not self._open and not self._replacements:
+            return event
+        with self._lock:
+            entity_id = event.data["entity_id"]
+            if self._open.get(entity_id) is event:
+                del self._open[entity_id]
+            return self._replacements.pop(id(event), event)
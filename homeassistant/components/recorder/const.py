@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 from typing import TYPE_CHECKING
 
 from homeassistant.const import (
@@ -25,6 +25,9 @@ MYSQLDB_URL_PREFIX = "mysql://"
 MYSQLDB_PYMYSQL_URL_PREFIX = "mysql+pymysql://"
 DOMAIN = "recorder"
 
+# Sent after states have been deleted from the database
+SIGNAL_RECORDER_STATES_PURGED = "recorder_states_purged"
+
 CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
@@ -48,6 +51,12 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+LAST_USED_SCHEMA_VERSION = 49
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 50
+
+# The last_used_ts of shared state attributes and event data rows is only
+# written when it moves forward by more than this many seconds
+LAST_USED_UPDATE_INTERVAL = 3600
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
@@ -64,6 +73,14 @@ INTEGRATION_PLATFORM_METHODS = {
 }
 
 
+class StatisticsRollupPeriod(IntEnum):
+    """Periods long term statistics are rolled up to."""
+
+    DAY = 1
+    WEEK = 2
+    MONTH = 3
+
+
 class SupportedDialect(StrEnum):
     """Supported dialects."""
 
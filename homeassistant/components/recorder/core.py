@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .backpressure import CommitIntervalController, StateChangedCoalescer
 from .const import (
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
@@ -78,13 +79,16 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .min_interval import MinRecordedIntervalLimiter
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .queries import update_event_data_last_used, update_state_attributes_last_used
+from .spool import EventSpool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import BulkStatesBuffer, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -100,6 +104,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    ReplaySpoolTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -132,6 +137,7 @@ SHUTDOWN_TASK = object()
 
 COMMIT_TASK = CommitTask()
 KEEP_ALIVE_TASK = KeepAliveTask()
+REPLAY_SPOOL_TASK = ReplaySpoolTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
 
@@ -158,12 +164,17 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         auto_repack: bool,
         keep_days: int,
+        purge_by_day: bool,
         commit_interval: int,
+        adaptive_commit_interval: bool,
+        bulk_insert_states: bool,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        min_recorded_intervals: list[tuple[Callable[[str], bool], float]],
+        spool_dir: str | None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -174,13 +185,27 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_by_day = purge_by_day
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self._commit_controller: CommitIntervalController | None = None
+        self._state_changed_coalescer: StateChangedCoalescer | None = None
+        if adaptive_commit_interval and commit_interval:
+            self._commit_controller = CommitIntervalController(commit_interval)
+            self._state_changed_coalescer = StateChangedCoalescer()
+        self.bulk_insert_states = bulk_insert_states
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self._spool: EventSpool | None = None
+        if spool_dir is not None:
+            self._spool = EventSpool(spool_dir)
+        # Events in the event session that are spooled if the database
+        # goes away before they are committed, or processed again to
+        # rebuild the bulk states rows when a commit is retried
+        self._uncommitted_events: list[Event] = []
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -199,6 +224,8 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        self.min_recorded_intervals = min_recorded_intervals
+        self._min_interval_limiter: MinRecordedIntervalLimiter | None = None
 
         self.schema_version = 0
         self._commits_without_expire = 0
@@ -206,6 +233,7 @@ class Recorder(threading.Thread):
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
+        self._bulk_states: BulkStatesBuffer | None = None
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -218,6 +246,7 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.use_statistics_rollups = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
@@ -256,6 +285,22 @@ class Recorder(threading.Thread):
         """Return if the recorder is recording."""
         return self._event_listener is not None
 
+    @callback
+    def async_committed_watermark(self, synced_timestamp: float) -> float | None:
+        """Return the time before which all states have been committed.
+
+        synced_timestamp is a time before the recorder was last synchronized.
+        States held back by a minimum recorded interval are committed after
+        the newer states, so the watermark is moved back by the longest
+        interval. Returns None while the recorder is not recording since
+        states may be dropped.
+        """
+        if not self.recording:
+            return None
+        return synced_timestamp - max(
+            (seconds for _, seconds in self.min_recorded_intervals), default=0
+        )
+
     def get_session(self) -> Session:
         """Get a new sqlalchemy session."""
         if self._get_session is None:
@@ -290,7 +335,15 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        queue_put: Callable[[Event], None] = self._queue.put_nowait
+        if self._state_changed_coalescer is not None:
+            queue_put = self._async_queue_put_coalesced
+        if self.min_recorded_intervals:
+            if self._min_interval_limiter is None:
+                self._min_interval_limiter = MinRecordedIntervalLimiter(
+                    self.hass, self.min_recorded_intervals, queue_put
+                )
+            queue_put = self._min_interval_limiter.async_queue_put
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -330,6 +383,20 @@ class Recorder(threading.Thread):
             name="Recorder queue watcher",
         )
 
+    @callback
+    def _async_queue_put_coalesced(self, event: Event) -> None:
+        """Put an event in the queue unless it replaced a queued state change."""
+        if (
+            event.event_type == EVENT_STATE_CHANGED
+            and self._commit_controller is not None
+            and self._state_changed_coalescer is not None
+            and self._state_changed_coalescer.async_coalesce(
+                event, self._commit_controller.coalesce
+            )
+        ):
+            return
+        self._queue.put_nowait(event)
+
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
         """Queue a keep alive."""
@@ -339,6 +406,11 @@ class Recorder(threading.Thread):
     @callback
     def _async_commit(self, now: datetime) -> None:
         """Queue a commit."""
+        if (
+            self._commit_controller is not None
+            and not self._commit_controller.async_commit_due(self.backlog)
+        ):
+            return
         if (
             self._event_listener
             and not self._database_lock_task
@@ -362,6 +434,17 @@ class Recorder(threading.Thread):
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
         if not self._reached_max_backlog():
             return
+        if (
+            controller := self._commit_controller
+        ) is not None and not controller.coalesce:
+            _LOGGER.warning(
+                "The recorder backlog queue reached the maximum size of %s events; "
+                "state changes that are superseded while waiting in the queue "
+                "will no longer be recorded until the backlog is reduced",
+                self.backlog,
+            )
+            controller.coalesce = True
+            return
         _LOGGER.error(
             (
                 "The recorder backlog queue reached the maximum size of %s events; "
@@ -438,6 +521,8 @@ class Recorder(threading.Thread):
         """Shut down the Recorder at final write."""
         if not self._hass_started.done():
             self._hass_started.set_result(SHUTDOWN_TASK)
+        if self._min_interval_limiter is not None:
+            self._min_interval_limiter.async_release_all()
         self.queue_task(StopTask())
         self._async_stop_listeners()
         await self.hass.async_add_executor_job(self.join)
@@ -622,8 +707,9 @@ class Recorder(threading.Thread):
             return
 
         # If the db is using a socket connection, we need to keep alive
-        # to prevent errors from unexpected disconnects
-        if self.dialect_name != SupportedDialect.SQLITE:
+        # to prevent errors from unexpected disconnects, the keep alive
+        # also replays spooled events once the database is back
+        if self.dialect_name != SupportedDialect.SQLITE or self._spool is not None:
             self._keep_alive_listener = async_track_time_interval(
                 self.hass,
                 self._async_keep_alive,
@@ -713,6 +799,9 @@ class Recorder(threading.Thread):
             # Give up if we could not connect
             return
 
+        if self._spool is not None:
+            self._spool.load()
+
         schema_status = migration.validate_db_schema(self.hass, self, self.get_session)
         if schema_status is None:
             # Give up if we could not validate the schema
@@ -792,6 +881,11 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        if self._spool is not None and self._spool.has_events:
+            # Replay events spooled before the last shutdown
+            # before any of the newer events are recorded
+            self._spool.active = True
+            self.queue_task(REPLAY_SPOOL_TASK)
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
@@ -1024,15 +1118,29 @@ class Recorder(threading.Thread):
         )
 
     def _process_one_event(self, event: Event[Any]) -> None:
+        if (
+            coalescer := self._state_changed_coalescer
+        ) is not None and event.event_type == EVENT_STATE_CHANGED:
+            # Record the newest state that replaced this event in the queue
+            event = coalescer.resolve(event)
         if not self.enabled:
             return
+        if (spool := self._spool) is not None and spool.active:
+            spool.append(event)
+            return
+        if spool is not None or self._bulk_states is not None:
+            self._uncommitted_events.append(event)
+        self._process_event_into_session(event)
+        # Commit if the commit interval is zero
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _process_event_into_session(self, event: Event[Any]) -> None:
+        """Process an event into the session."""
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
-        # Commit if the commit interval is zero
-        if not self.commit_interval:
-            self._commit_event_session_or_retry()
 
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
@@ -1062,18 +1170,25 @@ class Recorder(threading.Thread):
 
         # Map the event data to the EventData table
         shared_data = shared_data_bytes.decode("utf-8")
+        time_fired_ts = event.time_fired_timestamp
         # Matching attributes found in the pending commit
         if pending_event_data := event_data_manager.get_pending(shared_data):
             dbevent.event_data_rel = pending_event_data
+            pending_event_data.last_used_ts = max(
+                pending_event_data.last_used_ts or 0, time_fired_ts
+            )
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
             (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
+            event_data_manager.mark_used(data_id, time_fired_ts)
         else:
             # No matching attributes found, save them in the DB
-            dbevent_data = EventData(shared_data=shared_data, hash=hash_)
+            dbevent_data = EventData(
+                shared_data=shared_data, hash=hash_, last_used_ts=time_fired_ts
+            )
             event_data_manager.add_pending(dbevent_data)
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
@@ -1084,6 +1199,9 @@ class Recorder(threading.Thread):
         self, event: Event[EventStateChangedData]
     ) -> None:
         """Process a state_changed event into the session."""
+        if self._bulk_states is not None:
+            self._process_state_changed_event_into_bulk_states(event)
+            return
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
         entity_removed = not event.data.get("new_state")
@@ -1138,9 +1256,13 @@ class Recorder(threading.Thread):
 
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
+        last_updated_ts = cast(float, dbstate.last_updated_ts)
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
             dbstate.state_attributes = pending_event_data
+            pending_event_data.last_used_ts = max(
+                pending_event_data.last_used_ts or 0, last_updated_ts
+            )
         # Matching attributes id found in the cache
         elif (
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
@@ -1153,15 +1275,109 @@ class Recorder(threading.Thread):
             )
         ):
             dbstate.attributes_id = attributes_id
+            state_attributes_manager.mark_used(attributes_id, last_updated_ts)
         else:
             # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
+            dbstate_attributes = StateAttributes(
+                shared_attrs=shared_attrs, hash=hash_, last_used_ts=last_updated_ts
+            )
             state_attributes_manager.add_pending(dbstate_attributes)
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
         self._add_to_session(session, dbstate)
 
+    def _process_state_changed_event_into_bulk_states(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Process a state_changed event into the bulk states buffer."""
+        bulk_states = self._bulk_states
+        assert bulk_states is not None
+        state_attributes_manager = self.state_attributes_manager
+        states_meta_manager = self.states_meta_manager
+        states_manager = self.states_manager
+        entity_removed = not event.data.get("new_state")
+        entity_id = event.data["entity_id"]
+        old_state = event.data["old_state"]
+
+        assert self.event_session is not None
+        session = self.event_session
+
+        old_state_id: int | None = None
+        if (old_state_idx := bulk_states.pop_pending(entity_id)) is not None:
+            if old_state:
+                bulk_states.update_pending_last_reported(
+                    old_state_idx, old_state.last_reported_timestamp
+                )
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+
+        if entity_id is None or not (
+            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
+        ):
+            return
+
+        # Map the entity_id to the StatesMeta table
+        states_meta: int | StatesMeta
+        if pending_states_meta := states_meta_manager.get_pending(entity_id):
+            states_meta = pending_states_meta
+        elif metadata_id := states_meta_manager.get(entity_id, session, True):
+            states_meta = metadata_id
+        elif states_meta_manager.active and entity_removed:
+            # If the entity was removed, we don't need to add it to the
+            # StatesMeta table if it does not have a metadata_id allocated
+            return
+        else:
+            states_meta = StatesMeta(entity_id=entity_id)
+            states_meta_manager.add_pending(states_meta)
+            self._add_to_session(session, states_meta)
+
+        # Map the event data to the StateAttributes table
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        last_updated_ts = (
+            state.last_updated_timestamp
+            if (state := event.data["new_state"])
+            else event.time_fired_timestamp
+        )
+        state_attributes: int | StateAttributes
+        if pending_attributes := state_attributes_manager.get_pending(shared_attrs):
+            state_attributes = pending_attributes
+            pending_attributes.last_used_ts = max(
+                pending_attributes.last_used_ts or 0, last_updated_ts
+            )
+        elif (
+            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
+        ) or (
+            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
+            and (
+                attributes_id := state_attributes_manager.get(
+                    shared_attrs, hash_, session
+                )
+            )
+        ):
+            state_attributes = attributes_id
+            state_attributes_manager.mark_used(attributes_id, last_updated_ts)
+        else:
+            state_attributes = StateAttributes(
+                shared_attrs=shared_attrs, hash=hash_, last_used_ts=last_updated_ts
+            )
+            state_attributes_manager.add_pending(state_attributes)
+            self._add_to_session(session, state_attributes)
+
+        bulk_states.append_from_event(
+            event,
+            None if states_meta_manager.active else entity_id,
+            states_meta,
+            state_attributes,
+            old_state_id,
+            old_state_idx,
+        )
+        states_manager.update_oldest_ts(bulk_states.last_updated_ts[-1])
+        self._event_session_has_pending_writes = True
+
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if (
@@ -1183,12 +1399,19 @@ class Recorder(threading.Thread):
     def _commit_event_session_or_retry(self) -> None:
         """Commit the event session if there is work to do."""
         if not self._event_session_has_pending_writes:
+            self._uncommitted_events.clear()
             return
         tries = 1
+        start = time.monotonic()
         while tries <= self.db_max_retries:
             try:
+                if tries > 1 and self._bulk_states is not None:
+                    self._rebuild_event_session()
                 self._commit_event_session()
             except (exc.InternalError, exc.OperationalError) as err:
+                if self._spool is not None:
+                    self._start_spooling(err)
+                    return
                 _LOGGER.error(
                     "%s: Error executing query: %s. (retrying in %s seconds)",
                     INVALIDATED_ERR if err.connection_invalidated else CONNECTIVITY_ERR,
@@ -1201,13 +1424,101 @@ class Recorder(threading.Thread):
                 tries += 1
                 time.sleep(self.db_retry_wait)
             else:
+                self._uncommitted_events.clear()
+                if self._commit_controller is not None:
+                    self._commit_controller.record_commit_time(time.monotonic() - start)
                 return
 
+    def _rebuild_event_session(self) -> None:
+        """Roll back the event session and process the uncommitted events again.
+
+        The bulk states rows of a failed commit may reference rows that
+        were rolled back, so they are built again from the events. The
+        states committed before the failure are still linked as old states.
+        """
+        self._reopen_event_session(keep_committed_states=True)
+        for event in self._uncommitted_events:
+            self._process_event_into_session(event)
+
+    def _start_spooling(self, err: SQLAlchemyError) -> None:
+        """Spool events to disk until the database can be reached again.
+
+        The events of the failed commit are spooled first so they are
+        replayed before the events that arrive while the database is away.
+        """
+        spool = self._spool
+        assert spool is not None
+        if not spool.active:
+            _LOGGER.error(
+                "%s: Error executing query: %s; spooling events to %s until "
+                "the database is available again",
+                CONNECTIVITY_ERR,
+                err,
+                spool.path,
+            )
+            spool.active = True
+        for event in self._uncommitted_events:
+            spool.append(event)
+        self._uncommitted_events.clear()
+        spool.flush()
+        self._event_session_has_pending_writes = False
+        self._reopen_event_session()
+
+    def _replay_spool(self) -> None:
+        """Replay the oldest segment of spooled events into the database.
+
+        Events keep going to the spool until all segments have been
+        replayed so they are recorded in order.
+        """
+        spool = self._spool
+        assert spool is not None
+        assert self.event_session is not None
+        spool.flush()
+        try:
+            self.event_session.connection().scalar(select(1))
+        except (exc.InternalError, exc.OperationalError) as err:
+            _LOGGER.debug("Database is still not available: %s", err)
+            self._reopen_event_session()
+            return
+
+        if (events := spool.read_oldest()) is None:
+            spool.active = False
+            return
+
+        try:
+            for event in events:
+                self._process_event_into_session(event)
+            self._commit_event_session()
+        except (exc.InternalError, exc.OperationalError) as err:
+            # Keep the segment and try again at the next keep alive
+            _LOGGER.error(
+                "%s: Error replaying spooled events: %s", CONNECTIVITY_ERR, err
+            )
+            self._event_session_has_pending_writes = False
+            self._reopen_event_session()
+            return
+        except SQLAlchemyError:
+            _LOGGER.exception(
+                "Error replaying spooled events, discarding %s events", len(events)
+            )
+            self._event_session_has_pending_writes = False
+            self._reopen_event_session()
+
+        spool.remove_oldest()
+        if spool.has_events:
+            self.queue_task(REPLAY_SPOOL_TASK)
+            return
+        spool.active = False
+        _LOGGER.info("All spooled events have been recorded")
+
     def _commit_event_session(self) -> None:
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._bulk_states is not None:
+            self._bulk_states.write(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1223,6 +1534,24 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        for pending_last_used, update_last_used in (
+            (
+                self.state_attributes_manager.get_pending_last_used(),
+                update_state_attributes_last_used,
+            ),
+            (
+                self.event_data_manager.get_pending_last_used(),
+                update_event_data_last_used,
+            ),
+        ):
+            if pending_last_used:
+                session.execute(
+                    update_last_used(),
+                    [
+                        {"b_id": row_id, "b_last_used_ts": last_used_ts}
+                        for row_id, last_used_ts in pending_last_used.items()
+                    ],
+                )
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1231,6 +1560,10 @@ class Recorder(threading.Thread):
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
+        if self._bulk_states is not None:
+            self.states_manager.post_commit_bulk_pending(
+                self._bulk_states.post_commit_pending()
+            )
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
@@ -1255,9 +1588,14 @@ class Recorder(threading.Thread):
         if setup_run:
             self._setup_run()
 
-    def _close_event_session(self) -> None:
+    def _close_event_session(self, keep_committed_states: bool = False) -> None:
         """Close the event session."""
-        self.states_manager.reset()
+        if keep_committed_states:
+            self.states_manager.rollback_pending()
+        else:
+            self.states_manager.reset()
+        if self._bulk_states is not None:
+            self._bulk_states.clear()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -1273,9 +1611,9 @@ class Recorder(threading.Thread):
         except SQLAlchemyError:
             _LOGGER.exception("Error while rolling back and closing the event session")
 
-    def _reopen_event_session(self) -> None:
+    def _reopen_event_session(self, keep_committed_states: bool = False) -> None:
         """Rollback the event session and reopen it after a failure."""
-        self._close_event_session()
+        self._close_event_session(keep_committed_states)
         self._open_event_session()
 
     def _open_event_session(self) -> None:
@@ -1285,6 +1623,9 @@ class Recorder(threading.Thread):
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
+        if self._spool is not None and self._spool.active:
+            self._replay_spool()
+            return
         assert self.event_session is not None
         _LOGGER.debug("Sending keepalive")
         self.event_session.connection().scalar(select(1))
@@ -1297,6 +1638,31 @@ class Recorder(threading.Thread):
         self.queue_task(SynchronizeTask(event))
         await event.wait()
 
+    async def async_block_till_committed(self) -> bool:
+        """Block till all events are processed and return if they were committed.
+
+        Returns False if events are spooled to disk because the database
+        is not available.
+        """
+        if (
+            self._spool is None
+            and self._queue.empty()
+            and not self._event_session_has_pending_writes
+        ):
+            return True
+        task = SynchronizeTask(asyncio.Event())
+        self.queue_task(task)
+        await task.event.wait()
+        return not task.spooled
+
+    def _has_spooled_events(self) -> bool:
+        """Return if events are spooled to disk instead of committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return (spool := self._spool) is not None and (spool.active or spool.has_events)
+
     def block_till_done(self) -> None:
         """Block till all events processed.
 
@@ -1421,6 +1787,7 @@ class Recorder(threading.Thread):
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
         self.__dict__.pop("dialect_name", None)
+        self._setup_bulk_insert_states()
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         migration.pre_migrate_schema(self.engine)
@@ -1428,6 +1795,25 @@ class Recorder(threading.Thread):
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_bulk_insert_states(self) -> None:
+        """Enable the bulk states buffer if requested and supported."""
+        assert self.engine is not None
+        if not self.bulk_insert_states:
+            self._bulk_states = None
+            return
+        # The old_state_id of entities that change more than once
+        # in the same commit are linked by the order of the returned
+        # state_ids, which requires INSERT .. RETURNING support.
+        if not self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            _LOGGER.warning(
+                "The database engine %s does not support returning rows from "
+                "bulk inserts in order; bulk insert of states is disabled",
+                self.engine.dialect.name,
+            )
+            self._bulk_states = None
+            return
+        self._bulk_states = BulkStatesBuffer()
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
@@ -1486,6 +1872,8 @@ class Recorder(threading.Thread):
                 # to cleanly close the connection.
                 self._db_executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
+            if self._spool is not None:
+                self._spool.close()
             if self._db_executor:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 48
+SCHEMA_VERSION = 50
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -94,6 +94,7 @@ TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 TABLE_MIGRATION_CHANGES = "migration_changes"
+TABLE_STATISTICS_ROLLUPS = "statistics_rollups"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -116,6 +117,7 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_ROLLUPS,
 ]
 
 TABLES_TO_CHECK = [
@@ -377,6 +379,9 @@ class EventData(Base):
     shared_data: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The newest time_fired_ts of the events using the row, only updated
+    # when it moves forward by more than LAST_USED_UPDATE_INTERVAL
+    last_used_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -525,11 +530,11 @@ class States(Base):
         else:
             state_value = state.state
             last_updated_ts = state.last_updated_timestamp
-            if state.last_updated == state.last_changed:
+            if last_updated_ts == state.last_changed_timestamp:
                 last_changed_ts = None
             else:
                 last_changed_ts = state.last_changed_timestamp
-            if state.last_updated == state.last_reported:
+            if last_updated_ts == state.last_reported_timestamp:
                 last_reported_ts = None
             else:
                 last_reported_ts = state.last_reported_timestamp
@@ -624,6 +629,9 @@ class StateAttributes(Base):
     shared_attrs: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The newest last_updated_ts of the states using the row, only updated
+    # when it moves forward by more than LAST_USED_UPDATE_INTERVAL
+    last_used_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -790,6 +798,47 @@ class Statistics(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS
 
 
+class StatisticsRollups(Base):
+    """Long term statistics rolled up to days, weeks and months.
+
+    Maintained from the hourly statistics so statistics for long periods
+    can be read without reducing every hourly row. The periods follow the
+    local time zone at the time the rollup was made.
+    """
+
+    __table_args__ = (
+        # Used for fetching the rollups of statistics during a period
+        Index(
+            "ix_statistics_rollups_metadata_id_period_start_ts",
+            "metadata_id",
+            "period",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_ROLLUPS
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+    )
+    period: Mapped[int] = mapped_column(SmallInteger)
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE, index=True)
+    mean: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    # Number of hourly means the mean was calculated from
+    mean_weight: Mapped[int | None] = mapped_column(Integer)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    last_reset_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    state: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+    # The end of a rollup depends on its period and
+    # is calculated when the rollup is read
+    duration = timedelta(0)
+
+
 class _StatisticsShortTerm(StatisticsBase):
     """Short term statistics."""
 
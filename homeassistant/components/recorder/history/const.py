@@ -19,3 +19,6 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+# Number of states in each chunk when streaming history
+DEFAULT_STREAM_CHUNK_SIZE = 5000
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -43,6 +44,7 @@ from ..models import (
 )
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
+    DEFAULT_STREAM_CHUNK_SIZE,
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
@@ -232,6 +234,120 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        prepared := _prepare_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, include_start_time_state = prepared
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time.timestamp() if include_start_time_state else None,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Wrap stream_significant_states_with_session with an sql session."""
+    with session_scope(hass=hass, read_only=True) as session:
+        yield from stream_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_size,
+        )
+
+
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Yield significant states in the compressed state format in chunks.
+
+    Works like get_significant_states_with_session but each yielded
+    dict holds at most chunk_size states, and rows are fetched with
+    yield_per when the time window is longer than a day, so memory
+    use is bounded by the chunk size instead of the size of the window.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        prepared := _prepare_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return
+    stmt, entity_id_to_metadata_id, include_start_time_state = prepared
+    yield from _sorted_states_to_compressed_chunks(
+        execute_stmt_lambda_element(
+            session, stmt, start_time, end_time, chunk_size, orm_rows=False
+        ),
+        start_time.timestamp() if include_start_time_state else None,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+    )
+
+
+def _prepare_significant_states_stmt(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], bool] | None:
+    """Return the significant states statement for the entities.
+
+    Returns None if none of the entities have states.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -240,7 +356,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -278,15 +394,7 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
-    )
+    return stmt, entity_id_to_metadata_id, include_start_time_state
 
 
 def get_full_significant_states_with_session(
@@ -669,6 +777,92 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+def _sorted_states_to_compressed_chunks(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Convert SQL results into chunks in the compressed state format.
+
+    Each chunk is structured like the result of _sorted_states_to_dict
+    with compressed_state_format but only contains the entities that
+    have states in the chunk. The states of an entity may be split
+    over several consecutive chunks.
+
+    States must be sorted by entity_id and last_updated
+    """
+    field_map = _FIELD_MAP
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    if len(entity_ids) == 1:
+        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
+        assert metadata_id is not None  # should not be possible if we got here
+        states_iter: Iterable[tuple[int, Iterator[Row]]] = (
+            (metadata_id, iter(states)),
+        )
+    else:
+        states_iter = groupby(states, itemgetter(field_map["metadata_id"]))
+
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    chunk: dict[str, list[dict[str, Any]]] = {}
+    chunk_states = 0
+
+    for metadata_id, group in states_iter:
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        full_states = (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        )
+        prev_state: str | None = None
+        first = True
+        ent_results = chunk.setdefault(entity_id, [])
+        for row in group:
+            state: str = row[state_idx]
+            if full_states or first:
+                ent_results.append(
+                    row_to_compressed_state(
+                        row,
+                        attr_cache,
+                        start_time_ts,
+                        entity_id,
+                        state,
+                        row[last_updated_ts_idx],
+                        no_attributes and not full_states,
+                    )
+                )
+                first = False
+            elif state != prev_state:
+                # With minimal response we do not care about attribute
+                # changes so we can filter out duplicate states
+                ent_results.append(
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: row[last_updated_ts_idx],
+                    }
+                )
+            else:
+                continue
+            prev_state = state
+            chunk_states += 1
+            if chunk_states >= chunk_size:
+                yield chunk
+                chunk = {}
+                chunk_states = 0
+                ent_results = chunk.setdefault(entity_id, [])
+        if not ent_results:
+            del chunk[entity_id]
+
+    if chunk:
+        yield chunk
+
+
 def _sorted_states_to_dict(
     states: Iterable[Row],
     start_time_ts: float | None,
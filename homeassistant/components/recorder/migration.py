@@ -54,6 +54,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -90,6 +91,7 @@ from .queries import (
     find_event_type_to_migrate,
     find_events_context_ids_to_migrate,
     find_states_context_ids_to_migrate,
+    find_statistics_metadata_ids_to_roll_up,
     find_unmigrated_short_term_statistics_rows,
     find_unmigrated_statistics_rows,
     get_migration_changes,
@@ -102,7 +104,11 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import cleanup_statistics_timestamp_migration, get_start_time
+from .statistics import (
+    cleanup_statistics_timestamp_migration,
+    get_start_time,
+    rebuild_statistics_rollups,
+)
 from .tasks import RecorderTask
 from .util import (
     database_job_retry_wrapper,
@@ -121,6 +127,10 @@ if TYPE_CHECKING:
 # Schema version 42 was introduced in HA Core 2023.11
 LIVE_MIGRATION_MIN_SCHEMA_VERSION = 42
 
+# Number of statistic_ids rolled up per live migration task, each one
+# reads all hourly statistics of the statistic_id
+STATISTICS_ROLLUPS_BATCH_SIZE = 10
+
 MIGRATION_NOTE_OFFLINE = (
     "Note: this may take several hours on large databases and slow machines. "
     "Home Assistant will not start until the upgrade is completed. Please be patient "
@@ -1987,6 +1997,29 @@ class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
         _migrate_columns_to_timestamp(self.instance, self.session_maker, self.engine)
 
 
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # Existing rows are left without a last_used_ts, purge falls back
+        # to checking them against the states and events that use them
+        for table in ("state_attributes", "event_data"):
+            _add_columns(
+                self.session_maker,
+                table,
+                [f"last_used_ts {self.column_types.timestamp_type}"],
+            )
+            _create_index(
+                self.instance, self.session_maker, table, f"ix_{table}_last_used_ts"
+            )
+
+
+class _SchemaVersion50Migrator(_SchemaVersionMigrator, target_version=50):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The statistics_rollups table is created when the recorder connects,
+        # the existing statistics are rolled up by StatisticsRollupsMigration
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2971,6 +3004,48 @@ class EntityIDPostMigration(BaseMigrationWithQuery, BaseOffLineMigration):
         return has_used_states_entity_ids()
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigration):
+    """Migration to roll up the existing long term statistics."""
+
+    migration_id = "statistics_rollups"
+    max_initial_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION - 1
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize a new StatisticsRollupsMigration."""
+        super().__init__(**kwargs)
+        self._last_metadata_id = 0
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Roll up the statistics of some statistic_ids, return True if completed."""
+        _LOGGER.debug("Rolling up statistics")
+        with session_scope(session=instance.get_session()) as session:
+            metadata_ids: list[int] = list(
+                session.execute(
+                    find_statistics_metadata_ids_to_roll_up(
+                        self._last_metadata_id, STATISTICS_ROLLUPS_BATCH_SIZE
+                    )
+                ).scalars()
+            )
+            for metadata_id in metadata_ids:
+                rebuild_statistics_rollups(session, metadata_id)
+        if metadata_ids:
+            self._last_metadata_id = metadata_ids[-1]
+        is_done = not metadata_ids
+
+        _LOGGER.debug("Rolling up statistics: done=%s", is_done)
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Start reading statistics from the rollups."""
+        instance.use_statistics_rollups = True
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        return DataMigrationStatus(needs_migrate=True, migration_done=False)
+
+
 NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
     StatesContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
     EventsContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
@@ -2981,6 +3056,7 @@ NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
 
 LIVE_DATA_MIGRATORS: tuple[type[BaseRunTimeMigration], ...] = (
     EventIDPostMigration,  # Introduced in HA Core 2023.4 by PR #89901
+    StatisticsRollupsMigration,
 )
 
 
@@ -0,0 +1,115 @@
+"""Limit how often state changes of high frequency entities are recorded."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+
+from .backpressure import merge_state_changed_events
+
+
+class MinRecordedIntervalLimiter:
+    """Record the state of matching entities at most once per interval.
+
+    The first state change of an entity is queued for recording right away
+    and opens a window. State changes inside the window are held back and
+    collapsed so only the newest one is queued when the window closes. The
+    newest state keeps its own last_changed so state history stays correct,
+    only the superseded intermediate states are not recorded.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        intervals: list[tuple[Callable[[str], bool], float]],
+        queue_put: Callable[[Event], None],
+    ) -> None:
+        """Initialize the limiter.
+
+        The first matching entity filter in intervals sets the minimum
+        number of seconds between recorded states of an entity.
+        """
+        self._loop = hass.loop
+        self._intervals = intervals
+        self._queue_put = queue_put
+        self._interval_cache: dict[str, float | None] = {}
+        self._window_end: dict[str, float] = {}
+        self._held: dict[str, Event[EventStateChangedData]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+
+    def _interval(self, entity_id: str) -> float | None:
+        """Return the minimum recorded interval for an entity_id."""
+        try:
+            return self._interval_cache[entity_id]
+        except KeyError:
+            pass
+        interval: float | None = None
+        for entity_filter, seconds in self._intervals:
+            if entity_filter(entity_id):
+                interval = seconds
+                break
+        self._interval_cache[entity_id] = interval
+        return interval
+
+    @callback
+    def async_queue_put(self, event: Event) -> None:
+        """Queue an event for recording or hold it back until its window closes."""
+        if event.event_type != EVENT_STATE_CHANGED:
+            self._queue_put(event)
+            return
+        entity_id: str = event.data["entity_id"]
+        if (interval := self._interval(entity_id)) is None:
+            self._queue_put(event)
+            return
+
+        if event.data["new_state"] is None:
+            # Record the held state before the removal
+            self._async_release(entity_id)
+            self._window_end.pop(entity_id, None)
+            self._queue_put(event)
+            return
+
+        now = self._loop.time()
+        if now >= self._window_end.get(entity_id, 0):
+            self._window_end[entity_id] = now + interval
+            self._queue_put(event)
+            return
+
+        if (held := self._held.get(entity_id)) is not None:
+            self._held[entity_id] = merge_state_changed_events(held, event)
+            return
+
+        self._held[entity_id] = event
+        self._timers[entity_id] = self._loop.call_at(
+            self._window_end[entity_id], self._async_window_closed, entity_id
+        )
+
+    @callback
+    def _async_window_closed(self, entity_id: str) -> None:
+        """Queue the newest held state and open the next window."""
+        self._timers.pop(entity_id, None)
+        if (held := self._held.pop(entity_id, None)) is None:
+            return
+        if (interval := self._interval(entity_id)) is not None:
+            self._window_end[entity_id] = self._loop.time() + interval
+        self._queue_put(held)
+
+    @callback
+    def _async_release(self, entity_id: str) -> None:
+        """Queue the held state of an entity right away."""
+        if timer := self._timers.pop(entity_id, None):
+            timer.cancel()
+        if (held := self._held.pop(entity_id, None)) is not None:
+            self._queue_put(held)
+
+    @callback
+    def async_release_all(self) -> None:
+        """Queue all held states right away.
+
+        Called before the recorder shuts down so no state is lost.
+        """
+        for entity_id in list(self._held):
+            self._async_release(entity_id)
@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 import logging
 from typing import TYPE_CHECKING, Any
 
-from propcache import cached_property
 from sqlalchemy.engine.row import Row
 
 from homeassistant.const import (
@@ -16,7 +14,6 @@ from homeassistant.const import (
     COMPRESSED_STATE_STATE,
 )
 from homeassistant.core import Context, State
-import homeassistant.util.dt as dt_util
 
 from .state_attributes import decode_attributes_from_source
 
@@ -37,7 +34,13 @@ def extract_metadata_ids(
 
 
 class LazyState(State):
-    """A lazy version of core State after schema 31."""
+    """A lazy version of core State after schema 31.
+
+    Only the timestamps are read from the row, the attributes are
+    decoded and the datetimes are created when they are accessed.
+    """
+
+    __slots__ = ("_row", "_attributes", "attr_cache")
 
     def __init__(  # pylint: disable=super-init-not-called
         self,
@@ -50,74 +53,41 @@ class LazyState(State):
         no_attributes: bool,
     ) -> None:
         """Init the lazy state."""
-        self._row = row
+        # The row is only kept until the attributes are decoded
+        self._row: Row | None = None if no_attributes else row
         self.entity_id = entity_id
         self.state = state or ""
         self._attributes: dict[str, Any] | None = None
-        self._last_updated_ts: float | None = last_updated_ts or start_time_ts
         self.attr_cache = attr_cache
         self.context = EMPTY_CONTEXT
-
-    @cached_property
-    def attributes(self) -> dict[str, Any]:  # type: ignore[override]
-        """State attributes."""
-        return decode_attributes_from_source(
-            getattr(self._row, "attributes", None), self.attr_cache
-        )
-
-    @cached_property
-    def _last_changed_ts(self) -> float | None:
-        """Last changed timestamp."""
-        return getattr(self._row, "last_changed_ts", None)
-
-    @cached_property
-    def last_changed(self) -> datetime:  # type: ignore[override]
-        """Last changed datetime."""
-        return dt_util.utc_from_timestamp(
-            self._last_changed_ts or self._last_updated_ts  # type: ignore[arg-type]
+        last_updated_ts = last_updated_ts or start_time_ts
+        if TYPE_CHECKING:
+            assert last_updated_ts is not None
+        self.last_updated_timestamp = last_updated_ts
+        self.last_changed_timestamp = (
+            getattr(row, "last_changed_ts", None) or last_updated_ts
         )
-
-    @cached_property
-    def _last_reported_ts(self) -> float | None:
-        """Last reported timestamp."""
-        return getattr(self._row, "last_reported_ts", None)
-
-    @cached_property
-    def last_reported(self) -> datetime:  # type: ignore[override]
-        """Last reported datetime."""
-        return dt_util.utc_from_timestamp(
-            self._last_reported_ts or self._last_updated_ts  # type: ignore[arg-type]
+        self.last_reported_timestamp = (
+            getattr(row, "last_reported_ts", None) or last_updated_ts
         )
+        self._last_changed = None
+        self._last_reported = None
+        self._last_updated = None
 
-    @cached_property
-    def last_updated(self) -> datetime:  # type: ignore[override]
-        """Last updated datetime."""
-        if TYPE_CHECKING:
-            assert self._last_updated_ts is not None
-        return dt_util.utc_from_timestamp(self._last_updated_ts)
-
-    @cached_property
-    def last_updated_timestamp(self) -> float:  # type: ignore[override]
-        """Last updated timestamp."""
-        if TYPE_CHECKING:
-            assert self._last_updated_ts is not None
-        return self._last_updated_ts
-
-    @cached_property
-    def last_changed_timestamp(self) -> float:  # type: ignore[override]
-        """Last changed timestamp."""
-        ts = self._last_changed_ts or self._last_updated_ts
-        if TYPE_CHECKING:
-            assert ts is not None
-        return ts
-
-    @cached_property
-    def last_reported_timestamp(self) -> float:  # type: ignore[override]
-        """Last reported timestamp."""
-        ts = self._last_reported_ts or self._last_updated_ts
-        if TYPE_CHECKING:
-            assert ts is not None
-        return ts
+    @property
+    def attributes(self) -> dict[str, Any]:  # type: ignore[override]
+        """State attributes."""
+        if (attributes := self._attributes) is None:
+            attributes = self._attributes = decode_attributes_from_source(
+                getattr(self._row, "attributes", None), self.attr_cache
+            )
+            self._row = None
+        return attributes
+
+    @attributes.setter
+    def attributes(self, value: dict[str, Any]) -> None:
+        """Set attributes."""
+        self._attributes = value
 
     def as_dict(self) -> dict[str, Any]:  # type: ignore[override]
         """Return a dict representation of the LazyState.
@@ -127,14 +97,14 @@ class LazyState(State):
         To be used for JSON serialization.
         """
         last_updated_isoformat = self.last_updated.isoformat()
-        if self._last_changed_ts == self._last_updated_ts:
+        if self.last_changed_timestamp == self.last_updated_timestamp:
             last_changed_isoformat = last_updated_isoformat
         else:
             last_changed_isoformat = self.last_changed.isoformat()
         return {
             "entity_id": self.entity_id,
             "state": self.state,
-            "attributes": self._attributes or self.attributes,
+            "attributes": self.attributes,
             "last_changed": last_changed_isoformat,
             "last_updated": last_updated_isoformat,
         }
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import time
 from typing import TYPE_CHECKING
@@ -12,6 +12,7 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
+from .const import LAST_USED_UPDATE_INTERVAL
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
@@ -26,9 +27,15 @@ from .queries import (
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_before,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
+    delete_statistics_short_term_rows_before,
     disconnect_states_rows,
+    disconnect_states_rows_before,
+    find_attributes_ids_of_states_before,
+    find_attributes_ids_without_last_used,
+    find_data_ids_without_last_used,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -36,9 +43,16 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_linked_old_state_ids_before,
+    find_oldest_event,
+    find_oldest_short_term_statistic,
+    find_oldest_state,
     find_short_term_statistics_to_purge,
+    find_state_ids_before,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_unused_attributes_ids,
+    find_unused_data_ids,
 )
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
@@ -52,6 +66,8 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+PURGE_DAY_SECONDS = timedelta(days=1).total_seconds()
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -85,19 +101,36 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+            if instance.purge_by_day:
+                has_more_to_purge |= _purge_states_by_day(
+                    instance, session, purge_before
+                )
+            else:
+                has_more_to_purge |= _purge_states_and_attributes_ids(
+                    instance, session, states_batch_size, purge_before
+                )
+            has_more_to_purge |= _purge_unused_attributes_ids_by_last_used(
+                instance, session, purge_before
             )
             has_more_to_purge |= _purge_events_and_data_ids(
                 instance, session, events_batch_size, purge_before
             )
+            has_more_to_purge |= _purge_unused_data_ids_by_last_used(
+                instance, session, purge_before
+            )
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
         )
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
+        if instance.purge_by_day:
+            has_more_to_purge |= _purge_short_term_statistics_by_day(
+                session, purge_before
+            )
+            short_term_statistics: list[int] = []
+        else:
+            short_term_statistics = _select_short_term_statistics_to_purge(
+                session, purge_before, instance.max_bind_vars
+            )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
@@ -203,7 +236,9 @@ def _purge_states_and_attributes_ids(
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    _purge_unused_attributes_ids_without_last_used(
+        instance, session, attributes_ids_batch
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -211,6 +246,102 @@ def _purge_states_and_attributes_ids(
     return has_remaining_state_ids_to_purge
 
 
+def _day_purge_end_ts(oldest_ts: float | None, purge_before_ts: float) -> float | None:
+    """Return the end of the day of the oldest row if it needs to be purged.
+
+    The end is capped at purge_before_ts so rows that have
+    not reached the retention period are never purged.
+    """
+    if oldest_ts is None or oldest_ts >= purge_before_ts:
+        return None
+    day_end_ts = (oldest_ts // PURGE_DAY_SECONDS + 1) * PURGE_DAY_SECONDS
+    return min(day_end_ts, purge_before_ts)
+
+
+def _purge_states_by_day(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge the oldest day of states and the attributes only it used.
+
+    The day is removed with range statements on the last_updated_ts
+    index instead of selecting and deleting state_ids in batches so
+    the cost does not depend on the size of the retention window.
+
+    Returns true if there are more states to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    purge_end_ts = _day_purge_end_ts(
+        session.execute(find_oldest_state()).scalar(), purge_before_ts
+    )
+    if purge_end_ts is None:
+        return False
+
+    attributes_ids: set[int] = {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            find_attributes_ids_of_states_before(purge_end_ts)
+        )
+    }
+    linked_old_state_ids: list[int] = [
+        old_state_id
+        for (old_state_id,) in session.execute(
+            find_linked_old_state_ids_before(purge_end_ts)
+        )
+    ]
+    last_committed_state_ids = instance.states_manager.last_committed_state_ids()
+    purged_state_ids: set[int] = set()
+    for state_ids_chunk in chunked_or_all(
+        last_committed_state_ids, instance.max_bind_vars
+    ):
+        purged_state_ids.update(
+            state_id
+            for (state_id,) in session.execute(
+                find_state_ids_before(state_ids_chunk, purge_end_ts)
+            )
+        )
+
+    # Update old_state_id to NULL before deleting to ensure
+    # the delete does not fail due to a foreign key constraint
+    # both for the states that link into the day and the states
+    # inside the day since some databases check the constraint
+    # row by row.
+    for state_ids_chunk in chunked_or_all(linked_old_state_ids, instance.max_bind_vars):
+        session.execute(disconnect_states_rows(state_ids_chunk))
+    session.execute(disconnect_states_rows_before(purge_end_ts))
+    deleted_rows = session.execute(delete_states_rows_before(purge_end_ts))
+    _LOGGER.debug("Deleted %s states before %s", deleted_rows.rowcount, purge_end_ts)
+
+    # Evict any entries in the old_states cache referring to a purged state
+    instance.states_manager.evict_purged_state_ids(purged_state_ids)
+    _purge_unused_attributes_ids_without_last_used(instance, session, attributes_ids)
+    return purge_end_ts < purge_before_ts
+
+
+def _purge_short_term_statistics_by_day(
+    session: Session, purge_before: datetime
+) -> bool:
+    """Purge the oldest day of short term statistics.
+
+    Returns true if there are more short term statistics to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    purge_end_ts = _day_purge_end_ts(
+        session.execute(find_oldest_short_term_statistic()).scalar(),
+        purge_before_ts,
+    )
+    if purge_end_ts is None:
+        return False
+    deleted_rows = session.execute(
+        delete_statistics_short_term_rows_before(purge_end_ts)
+    )
+    _LOGGER.debug(
+        "Deleted %s short term statistics before %s",
+        deleted_rows.rowcount,
+        purge_end_ts,
+    )
+    return purge_end_ts < purge_before_ts
+
+
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
@@ -238,7 +369,7 @@ def _purge_events_and_data_ids(
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    _purge_unused_data_ids_without_last_used(instance, session, data_ids_batch)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -367,6 +498,101 @@ def _purge_unused_data_ids(
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
 
 
+def _unused_before(oldest_ts: float | None, purge_before: datetime) -> float:
+    """Return the last_used_ts that shared rows used before are no longer used.
+
+    The last_used_ts is only written when it moves forward by more than
+    LAST_USED_UPDATE_INTERVAL so a shared row can still be used by rows
+    up to that long after its last_used_ts.
+    """
+    purge_before_ts = purge_before.timestamp()
+    if oldest_ts is None:
+        # Nothing uses the shared rows anymore
+        return purge_before_ts
+    return min(oldest_ts, purge_before_ts) - LAST_USED_UPDATE_INTERVAL
+
+
+def _purge_unused_attributes_ids_by_last_used(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge attributes ids that are no longer used by any state.
+
+    Every state uses attributes that were last used at most
+    LAST_USED_UPDATE_INTERVAL before it so attributes last used
+    before that are no longer used without having to check
+    the states table.
+
+    Returns true if there are more attributes ids to purge.
+    """
+    used_before = _unused_before(
+        session.execute(find_oldest_state()).scalar(), purge_before
+    )
+    if not (
+        attributes_ids := {
+            attributes_id
+            for (attributes_id,) in session.execute(
+                find_unused_attributes_ids(used_before, instance.max_bind_vars)
+            )
+        }
+    ):
+        return False
+    _purge_batch_attributes_ids(instance, session, attributes_ids)
+    return True
+
+
+def _purge_unused_data_ids_by_last_used(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge event data ids that are no longer used by any event.
+
+    Returns true if there are more event data ids to purge.
+    """
+    used_before = _unused_before(
+        session.execute(find_oldest_event()).scalar(), purge_before
+    )
+    if not (
+        data_ids := {
+            data_id
+            for (data_id,) in session.execute(
+                find_unused_data_ids(used_before, instance.max_bind_vars)
+            )
+        }
+    ):
+        return False
+    _purge_batch_data_ids(instance, session, data_ids)
+    return True
+
+
+def _purge_unused_attributes_ids_without_last_used(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Purge unused attributes ids that were written before last_used_ts existed."""
+    legacy_attributes_ids: set[int] = set()
+    for attributes_ids_chunk in chunked_or_all(attributes_ids, instance.max_bind_vars):
+        legacy_attributes_ids.update(
+            attributes_id
+            for (attributes_id,) in session.execute(
+                find_attributes_ids_without_last_used(attributes_ids_chunk)
+            )
+        )
+    _purge_unused_attributes_ids(instance, session, legacy_attributes_ids)
+
+
+def _purge_unused_data_ids_without_last_used(
+    instance: Recorder, session: Session, data_ids: set[int]
+) -> None:
+    """Purge unused event data ids that were written before last_used_ts existed."""
+    legacy_data_ids: set[int] = set()
+    for data_ids_chunk in chunked_or_all(data_ids, instance.max_bind_vars):
+        legacy_data_ids.update(
+            data_id
+            for (data_id,) in session.execute(
+                find_data_ids_without_last_used(data_ids_chunk)
+            )
+        )
+    _purge_unused_data_ids(instance, session, legacy_data_ids)
+
+
 def _select_statistics_runs_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> list[int]:
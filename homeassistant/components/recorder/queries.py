@@ -5,7 +5,18 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import and_, delete, distinct, func, lambda_stmt, select, update
+from sqlalchemy import (
+    and_,
+    bindparam,
+    delete,
+    distinct,
+    func,
+    lambda_stmt,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.sql.dml import Update
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -19,6 +30,7 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -35,6 +47,46 @@ def select_event_type_ids(event_types: tuple[str, ...]) -> Select:
     )
 
 
+def update_state_attributes_last_used() -> Update:
+    """Generate an update that moves the last_used_ts of state_attributes forward.
+
+    This query is intentionally not a lambda statement as it is
+    executed with a list of parameters.
+    """
+    table = StateAttributes.__table__
+    return (
+        update(table)
+        .where(
+            table.c.attributes_id == bindparam("b_id"),
+            or_(
+                table.c.last_used_ts.is_(None),
+                table.c.last_used_ts < bindparam("b_last_used_ts"),
+            ),
+        )
+        .values(last_used_ts=bindparam("b_last_used_ts"))
+    )
+
+
+def update_event_data_last_used() -> Update:
+    """Generate an update that moves the last_used_ts of event_data forward.
+
+    This query is intentionally not a lambda statement as it is
+    executed with a list of parameters.
+    """
+    table = EventData.__table__
+    return (
+        update(table)
+        .where(
+            table.c.data_id == bindparam("b_id"),
+            or_(
+                table.c.last_used_ts.is_(None),
+                table.c.last_used_ts < bindparam("b_last_used_ts"),
+            ),
+        )
+        .values(last_used_ts=bindparam("b_last_used_ts"))
+    )
+
+
 def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     """Load shared attributes from the database."""
     return lambda_stmt(
@@ -181,6 +233,63 @@ def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def find_linked_old_state_ids_before(
+    purge_before: float,
+) -> StatementLambdaElement:
+    """Find states before purge_before that newer states link as their old state."""
+    return lambda_stmt(
+        lambda: select(States.old_state_id).filter(
+            States.last_updated_ts >= purge_before,
+            States.old_state_id.in_(
+                select(States.state_id).filter(States.last_updated_ts < purge_before)
+            ),
+        )
+    )
+
+
+def find_attributes_ids_of_states_before(
+    purge_before: float,
+) -> StatementLambdaElement:
+    """Find the distinct attributes ids of the states before purge_before."""
+    return lambda_stmt(
+        lambda: select(distinct(States.attributes_id)).filter(
+            States.last_updated_ts < purge_before,
+            States.attributes_id.is_not(None),
+        )
+    )
+
+
+def find_state_ids_before(
+    state_ids: Iterable[int], purge_before: float
+) -> StatementLambdaElement:
+    """Find which of the state ids are before purge_before."""
+    return lambda_stmt(
+        lambda: select(States.state_id).filter(
+            States.state_id.in_(state_ids), States.last_updated_ts < purge_before
+        )
+    )
+
+
+def disconnect_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Disconnect states rows before purge_before."""
+    return lambda_stmt(
+        lambda: update(States)
+        .filter(States.last_updated_ts < purge_before)
+        .filter(States.old_state_id.is_not(None))
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_rows_before(purge_before: float) -> StatementLambdaElement:
+    """Delete states rows before purge_before."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .filter(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_data_rows(data_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete event_data rows."""
     return lambda_stmt(
@@ -223,6 +332,17 @@ def delete_statistics_short_term_rows(
     )
 
 
+def delete_statistics_short_term_rows_before(
+    purge_before: float,
+) -> StatementLambdaElement:
+    """Delete statistics_short_term rows before purge_before."""
+    return lambda_stmt(
+        lambda: delete(StatisticsShortTerm)
+        .filter(StatisticsShortTerm.start_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_rows(
     event_ids: Iterable[int],
 ) -> StatementLambdaElement:
@@ -269,6 +389,51 @@ def find_states_to_purge(
     )
 
 
+def find_unused_attributes_ids(
+    used_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find state_attributes that have not been used since used_before."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .filter(StateAttributes.last_used_ts < used_before)
+        .limit(max_bind_vars)
+    )
+
+
+def find_unused_data_ids(
+    used_before: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find event_data that have not been used since used_before."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .filter(EventData.last_used_ts < used_before)
+        .limit(max_bind_vars)
+    )
+
+
+def find_attributes_ids_without_last_used(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find which of the attributes ids do not have a last_used_ts."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id).filter(
+            StateAttributes.attributes_id.in_(attributes_ids),
+            StateAttributes.last_used_ts.is_(None),
+        )
+    )
+
+
+def find_data_ids_without_last_used(
+    data_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find which of the event data ids do not have a last_used_ts."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id).filter(
+            EventData.data_id.in_(data_ids), EventData.last_used_ts.is_(None)
+        )
+    )
+
+
 def find_oldest_state() -> StatementLambdaElement:
     """Find the last_updated_ts of the oldest state."""
     return lambda_stmt(
@@ -278,6 +443,24 @@ def find_oldest_state() -> StatementLambdaElement:
     )
 
 
+def find_oldest_event() -> StatementLambdaElement:
+    """Find the time_fired_ts of the oldest event."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired_ts)
+        .order_by(Events.time_fired_ts.asc())
+        .limit(1)
+    )
+
+
+def find_oldest_short_term_statistic() -> StatementLambdaElement:
+    """Find the start_ts of the oldest short term statistic."""
+    return lambda_stmt(
+        lambda: select(StatisticsShortTerm.start_ts)
+        .order_by(StatisticsShortTerm.start_ts.asc())
+        .limit(1)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -646,3 +829,15 @@ def delete_duplicate_statistics_row(statistic_id: int) -> StatementLambdaElement
         .where(Statistics.id == statistic_id)
         .execution_options(synchronize_session=False)
     )
+
+
+def find_statistics_metadata_ids_to_roll_up(
+    after_metadata_id: int, limit: int
+) -> StatementLambdaElement:
+    """Find the next statistics metadata_ids to roll up."""
+    return lambda_stmt(
+        lambda: select(StatisticsMeta.id)
+        .filter(StatisticsMeta.id > after_metadata_id)
+        .order_by(StatisticsMeta.id)
+        .limit(limit)
+    )
@@ -0,0 +1,189 @@
+"""Spool events to disk while the database cannot be reached."""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import IO, Any, cast
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+# Events are spooled to disk until the spool reaches this size,
+# newer events are dropped after that
+SPOOL_MAX_BYTES = 512 * 1024 * 1024
+
+# Start a new segment once the segment being written reaches this size,
+# each segment is replayed and committed in a single transaction
+SPOOL_SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+
+SPOOL_SEGMENT_SUFFIX = ".spool"
+
+
+def event_to_spool_line(event: Event) -> bytes:
+    """Serialize an event to a line of a spool segment."""
+    context = event.context
+    return (
+        json_bytes(
+            {
+                "event_type": event.event_type,
+                "data": event.data,
+                "origin": event.origin.value,
+                "time_fired_ts": event.time_fired_timestamp,
+                "context": [context.id, context.user_id, context.parent_id],
+            }
+        )
+        + b"\n"
+    )
+
+
+def event_from_spool_line(line: bytes) -> Event:
+    """Restore an event from a line of a spool segment."""
+    spooled = cast(dict[str, Any], json_loads(line))
+    event_type: str = spooled["event_type"]
+    data: dict[str, Any] = spooled["data"]
+    if event_type == EVENT_STATE_CHANGED:
+        data["old_state"] = State.from_dict(data["old_state"])
+        data["new_state"] = State.from_dict(data["new_state"])
+    context_id, user_id, parent_id = spooled["context"]
+    return Event(
+        event_type,
+        data,
+        EventOrigin(spooled["origin"]),
+        spooled["time_fired_ts"],
+        Context(user_id, parent_id, context_id),
+    )
+
+
+class EventSpool:
+    """Append-only spool of events in numbered segment files.
+
+    Events are appended to the newest segment and segments are replayed
+    and removed oldest first. The spool is only used from the recorder
+    thread.
+    """
+
+    def __init__(self, path: str, max_bytes: int = SPOOL_MAX_BYTES) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_bytes = max_bytes
+        # Events are written to the spool instead of the database
+        self.active = False
+        self.size = 0
+        self.dropped = 0
+        self._segments: list[int] = []
+        self._file: IO[bytes] | None = None
+        self._file_size = 0
+
+    @property
+    def has_events(self) -> bool:
+        """Return if there are spooled events to replay."""
+        return bool(self._segments)
+
+    def _segment_path(self, segment: int) -> str:
+        """Return the path of a segment."""
+        return os.path.join(self.path, f"{segment:010d}{SPOOL_SEGMENT_SUFFIX}")
+
+    def load(self) -> None:
+        """Find the segments left over from a previous run."""
+        os.makedirs(self.path, exist_ok=True)
+        for name in os.listdir(self.path):
+            segment, suffix = os.path.splitext(name)
+            if suffix != SPOOL_SEGMENT_SUFFIX or not segment.isdigit():
+                continue
+            self._segments.append(int(segment))
+            self.size += os.path.getsize(os.path.join(self.path, name))
+        self._segments.sort()
+        if self._segments:
+            _LOGGER.info(
+                "Found %s bytes of spooled events from a previous run", self.size
+            )
+
+    def append(self, event: Event) -> bool:
+        """Append an event to the spool.
+
+        Returns False if the event could not be spooled.
+        """
+        try:
+            line = event_to_spool_line(event)
+        except TypeError:
+            _LOGGER.warning(
+                "Event is not JSON serializable and cannot be spooled: %s", event
+            )
+            return False
+        if self.size + len(line) > self.max_bytes:
+            if not self.dropped:
+                _LOGGER.error(
+                    "The recorder spool reached the maximum size of %s bytes; "
+                    "events will no longer be recorded until the database "
+                    "is available again",
+                    self.max_bytes,
+                )
+            self.dropped += 1
+            return False
+        if self._file is None or self._file_size >= SPOOL_SEGMENT_MAX_BYTES:
+            self._open_new_segment()
+            assert self._file is not None
+        self._file.write(line)
+        self._file_size += len(line)
+        self.size += len(line)
+        return True
+
+    def _open_new_segment(self) -> None:
+        """Close the segment being written and start a new one."""
+        self.close()
+        segment = self._segments[-1] + 1 if self._segments else 1
+        self._segments.append(segment)
+        self._file = open(self._segment_path(segment), "ab")
+        self._file_size = 0
+
+    def flush(self) -> None:
+        """Write the buffered events of the segment being written to disk."""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the segment being written."""
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+    def read_oldest(self) -> list[Event] | None:
+        """Return the events of the oldest segment.
+
+        Returns None if there are no spooled events.
+        """
+        if not self._segments:
+            return None
+        if len(self._segments) == 1:
+            # New events must go to a new segment once
+            # the oldest one is being replayed
+            self.close()
+        path = self._segment_path(self._segments[0])
+        events: list[Event] = []
+        with open(path, "rb") as segment_file:
+            for line in segment_file:
+                try:
+                    events.append(event_from_spool_line(line))
+                except (KeyError, TypeError, ValueError):
+                    # The last line may be incomplete if
+                    # Home Assistant stopped while it was written
+                    _LOGGER.warning("Skipping unreadable spooled event in %s", path)
+        return events
+
+    def remove_oldest(self) -> None:
+        """Remove the oldest segment after its events have been replayed."""
+        path = self._segment_path(self._segments.pop(0))
+        size = os.path.getsize(path)
+        os.unlink(path)
+        self.size -= size
+        if not self._segments:
+            self.size = 0
+            self.dropped = 0
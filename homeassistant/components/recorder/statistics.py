@@ -57,6 +57,7 @@ from .const import (
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    StatisticsRollupPeriod,
     SupportedDialect,
 )
 from .db_schema import (
@@ -64,6 +65,7 @@ from .db_schema import (
     Statistics,
     StatisticsBase,
     StatisticsMeta,
+    StatisticsRollups,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -454,6 +456,9 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    if summary:
+        _update_statistics_rollups(session, start_time_ts, summary)
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -1116,12 +1121,148 @@ def _reduce_statistics_per_month(
     )
 
 
+_ROLLUP_PERIOD_TS_FACTORIES: dict[
+    StatisticsRollupPeriod,
+    Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+] = {
+    StatisticsRollupPeriod.DAY: reduce_day_ts_factory,
+    StatisticsRollupPeriod.WEEK: reduce_week_ts_factory,
+    StatisticsRollupPeriod.MONTH: reduce_month_ts_factory,
+}
+
+_PERIOD_TO_ROLLUP_PERIOD: dict[str, StatisticsRollupPeriod] = {
+    "day": StatisticsRollupPeriod.DAY,
+    "week": StatisticsRollupPeriod.WEEK,
+    "month": StatisticsRollupPeriod.MONTH,
+}
+
+
+def _update_statistics_rollups(
+    session: Session, start_time_ts: float, summary: dict[int, StatisticDataTimestamp]
+) -> None:
+    """Merge the statistics compiled for an hour into the rollups of the hour.
+
+    The mean of a rollup is the mean of the hourly means, the same as when
+    the hourly statistics are reduced when they are read.
+    """
+    for rollup_period, reduce_ts_factory in _ROLLUP_PERIOD_TS_FACTORIES.items():
+        _, period_start_end = reduce_ts_factory()
+        period_start_ts = period_start_end(start_time_ts)[0]
+        rollups: dict[int | None, StatisticsRollups] = {
+            rollup.metadata_id: rollup
+            for rollup in session.query(StatisticsRollups).filter(
+                StatisticsRollups.start_ts == period_start_ts,
+                StatisticsRollups.period == rollup_period,
+            )
+        }
+        for metadata_id, summary_item in summary.items():
+            _mean = summary_item.get("mean")
+            _min = summary_item.get("min")
+            _max = summary_item.get("max")
+            if (rollup := rollups.get(metadata_id)) is None:
+                session.add(
+                    StatisticsRollups(
+                        metadata_id=metadata_id,
+                        period=rollup_period,
+                        start_ts=period_start_ts,
+                        mean=_mean,
+                        mean_weight=0 if _mean is None else 1,
+                        min=_min,
+                        max=_max,
+                        last_reset_ts=summary_item.get("last_reset_ts"),
+                        state=summary_item.get("state"),
+                        sum=summary_item.get("sum"),
+                    )
+                )
+                continue
+            if _mean is not None:
+                weight = rollup.mean_weight or 0
+                if rollup.mean is None or not weight:
+                    rollup.mean = _mean
+                else:
+                    rollup.mean = (rollup.mean * weight + _mean) / (weight + 1)
+                rollup.mean_weight = weight + 1
+            if _min is not None and (rollup.min is None or _min < rollup.min):
+                rollup.min = _min
+            if _max is not None and (rollup.max is None or _max > rollup.max):
+                rollup.max = _max
+            rollup.last_reset_ts = summary_item.get("last_reset_ts")
+            rollup.state = summary_item.get("state")
+            rollup.sum = summary_item.get("sum")
+
+
+def rebuild_statistics_rollups(
+    session: Session, metadata_id: int, start_time_ts: float | None = None
+) -> None:
+    """Rebuild the rollups of a statistic from its hourly statistics.
+
+    If start_time_ts is set only the rollups of the periods containing
+    start_time_ts or starting after it are rebuilt.
+    """
+    period_start_ends = {
+        rollup_period: reduce_ts_factory()[1]
+        for rollup_period, reduce_ts_factory in _ROLLUP_PERIOD_TS_FACTORIES.items()
+    }
+    query = session.query(*QUERY_STATISTICS).filter(
+        Statistics.metadata_id == metadata_id
+    )
+    from_ts: dict[StatisticsRollupPeriod, float] = {}
+    if start_time_ts is not None:
+        from_ts = {
+            rollup_period: period_start_end(start_time_ts)[0]
+            for rollup_period, period_start_end in period_start_ends.items()
+        }
+        query = query.filter(Statistics.start_ts >= min(from_ts.values()))
+    hourly_rows = query.order_by(Statistics.start_ts).all()
+
+    for rollup_period, period_start_end in period_start_ends.items():
+        delete_query = session.query(StatisticsRollups).filter(
+            StatisticsRollups.metadata_id == metadata_id,
+            StatisticsRollups.period == rollup_period,
+        )
+        period_from_ts = from_ts.get(rollup_period)
+        if period_from_ts is not None:
+            delete_query = delete_query.filter(
+                StatisticsRollups.start_ts >= period_from_ts
+            )
+        delete_query.delete(synchronize_session=False)
+
+        rows_by_period: dict[float, list[Row]] = defaultdict(list)
+        for row in hourly_rows:
+            if period_from_ts is None or row.start_ts >= period_from_ts:
+                rows_by_period[period_start_end(row.start_ts)[0]].append(row)
+
+        for period_start_ts, period_rows in rows_by_period.items():
+            mean_values = [row.mean for row in period_rows if row.mean is not None]
+            min_values = [row.min for row in period_rows if row.min is not None]
+            max_values = [row.max for row in period_rows if row.max is not None]
+            last_row = period_rows[-1]
+            session.add(
+                StatisticsRollups(
+                    metadata_id=metadata_id,
+                    period=rollup_period,
+                    start_ts=period_start_ts,
+                    mean=mean(mean_values) if mean_values else None,
+                    mean_weight=len(mean_values),
+                    min=min(min_values) if min_values else None,
+                    max=max(max_values) if max_values else None,
+                    last_reset_ts=last_row.last_reset_ts,
+                    state=last_row.state,
+                    sum=last_row.sum,
+                )
+            )
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
     metadata_ids: list[int] | None,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollups],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    rollup_period: StatisticsRollupPeriod | None = None,
 ) -> StatementLambdaElement:
     """Prepare a database query for statistics during a given period.
 
@@ -1129,6 +1270,9 @@ def _generate_statistics_during_period_stmt(
     """
     start_time_ts = start_time.timestamp()
     stmt = _generate_select_columns_for_types_stmt(table, types)
+    if rollup_period is not None:
+        period = int(rollup_period)
+        stmt += lambda q: q.filter(StatisticsRollups.period == period)
     stmt += lambda q: q.filter(table.start_ts >= start_time_ts)
     if end_time is not None:
         end_time_ts = end_time.timestamp()
@@ -1612,7 +1756,7 @@ _type_column_mapping = {
 
 
 def _generate_select_columns_for_types_stmt(
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollups],
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> StatementLambdaElement:
     columns = select(table.metadata_id, table.start_ts)
@@ -1701,6 +1845,52 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    rollup_period: StatisticsRollupPeriod,
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return statistics during a period from the rollups.
+
+    Returns None if the rollups were made for another time zone and the
+    hourly statistics have to be reduced instead.
+    """
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, StatisticsRollups, types, rollup_period
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return {}
+
+    result = _sorted_statistics_to_dict(
+        hass,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        StatisticsRollups,
+        units,
+        types,
+    )
+    _, period_start_end = _ROLLUP_PERIOD_TS_FACTORIES[rollup_period]()
+    for rows in result.values():
+        for row in rows:
+            start, end = period_start_end(row["start"])
+            if start != row["start"]:
+                return None
+            row["end"] = end
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1721,7 +1911,8 @@ def _statistics_during_period_with_session(
         # for custom integrations that call this method.
         statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
     # Fetch metadata for the given (or all) statistic_ids
-    metadata = get_instance(hass).statistics_meta_manager.get_many(
+    instance = get_instance(hass)
+    metadata = instance.statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
     )
     if not metadata:
@@ -1771,35 +1962,55 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    result: dict[str, list[StatisticsRow]] | None = None
+    if (
+        rollup_period := _PERIOD_TO_ROLLUP_PERIOD.get(period)
+    ) is not None and instance.use_statistics_rollups:
+        result = _statistics_rollups_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            rollup_period,
+            units,
+            types,
+        )
 
-    if not stats:
-        return {}
+    if result is None:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        if not stats:
+            return {}
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
+
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
+    elif not result:
+        return {}
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2154,7 +2365,7 @@ def _sorted_statistics_to_dict(
     statistic_ids: set[str] | None,
     _metadata: dict[str, tuple[int, StatisticMetaData]],
     convert_units: bool,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollups],
     units: dict[str, str] | None,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
@@ -2355,13 +2566,19 @@ def _import_statistics_with_session(
         session, metadata, old_metadata_dict
     )
     now_timestamp = time_time()
+    first_start_ts: float | None = None
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat, now_timestamp)
+        start_ts = stat["start"].timestamp()
+        if first_start_ts is None or start_ts < first_start_ts:
+            first_start_ts = start_ts
 
     if table != StatisticsShortTerm:
+        if first_start_ts is not None:
+            rebuild_statistics_rollups(session, metadata_id, first_start_ts)
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2491,12 +2708,16 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        rebuild_statistics_rollups(
+            session, metadata[statistic_id][0], start_time.replace(minute=0).timestamp()
+        )
+
     return True
 
 
 def _change_statistics_unit_for_table(
     session: Session,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollups],
     metadata_id: int,
     convert: Callable[[float | None], float | None],
 ) -> None:
@@ -2548,9 +2769,10 @@ def change_statistics_unit(
             )
             return
 
-        tables: tuple[type[StatisticsBase], ...] = (
+        tables: tuple[type[StatisticsBase | StatisticsRollups], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsRollups,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -8,6 +8,8 @@ from lru import LRU
 
 from homeassistant.util.event_type import EventType
 
+from ..const import LAST_USED_UPDATE_INTERVAL
+
 if TYPE_CHECKING:
     from ..core import Recorder
 
@@ -74,3 +76,87 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+class BaseLastUsedLRUTableManager[_DataT](BaseLRUTableManager[_DataT]):
+    """Base class for LRU table managers of rows shared by other rows.
+
+    Keeps the last_used_ts of the shared rows up to date so purge can
+    find the rows that are no longer used with the last_used_ts index
+    instead of checking every row against the table that uses it.
+    """
+
+    def __init__(self, recorder: Recorder, lru_size: int) -> None:
+        """Initialize the last used LRU table manager."""
+        super().__init__(recorder, lru_size)
+        # The last_used_ts of committed rows that is known to be in the database
+        self._last_used: LRU[int, float] = LRU(lru_size)
+        # The last_used_ts of committed rows to write at the next commit
+        self._pending_last_used: dict[int, float] = {}
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        if new_size > self._last_used.get_size():
+            self._last_used.set_size(new_size)
+
+    def mark_used(self, row_id: int, timestamp: float) -> None:
+        """Mark a committed row as used by a row with the given timestamp.
+
+        The last_used_ts is only written when it moves forward by more
+        than LAST_USED_UPDATE_INTERVAL so a row that is used by every
+        state change is written at most once per interval.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (
+            last_used := self._last_used.get(row_id)
+        ) is not None and timestamp < last_used + LAST_USED_UPDATE_INTERVAL:
+            return
+        if timestamp > self._pending_last_used.get(row_id, 0):
+            self._pending_last_used[row_id] = timestamp
+
+    def get_pending_last_used(self) -> dict[int, float]:
+        """Return the last_used_ts to write at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_last_used
+
+    def post_commit_last_used(self) -> None:
+        """Call after commit to remember the last_used_ts that were written.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        for row_id, timestamp in self._pending_last_used.items():
+            last_used[row_id] = timestamp
+        self._pending_last_used.clear()
+
+    def evict_purged_last_used(self, row_ids: set[int]) -> None:
+        """Evict purged rows from the last used cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        for row_id in row_ids:
+            last_used.pop(row_id, None)
+            self._pending_last_used.pop(row_id, None)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._last_used.clear()
+        self._pending_last_used.clear()
@@ -5,13 +5,32 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any, cast
 
+from sqlalchemy import insert, update
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from ..db_schema import States
+from homeassistant.core import Event, EventStateChangedData
+
+from ..db_schema import StateAttributes, States, StatesMeta
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
 from ..queries import find_oldest_state
 from ..util import execute_stmt_lambda_element
 
+BULK_INSERT_COLUMNS = (
+    "entity_id",
+    "state",
+    "last_updated_ts",
+    "last_changed_ts",
+    "last_reported_ts",
+    "context_id_bin",
+    "context_user_id_bin",
+    "context_parent_id_bin",
+    "origin_idx",
+    "metadata_id",
+    "attributes_id",
+    "old_state_id",
+)
+
 
 class StatesManager:
     """Manage the states table."""
@@ -20,6 +39,8 @@ class StatesManager:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
         self._last_committed_id: dict[str, int] = {}
+        # Committed state_ids linked as old states since the last commit
+        self._linked_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
         self._oldest_ts: float | None = None
 
@@ -47,7 +68,9 @@ class StatesManager:
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        return self._last_committed_id.pop(entity_id, None)
+        if (state_id := self._last_committed_id.pop(entity_id, None)) is not None:
+            self._linked_committed_id[entity_id] = state_id
+        return state_id
 
     def add_pending(self, entity_id: str, state: States) -> None:
         """Add a pending state.
@@ -61,6 +84,15 @@ class StatesManager:
         if self._oldest_ts is None:
             self._oldest_ts = state.last_updated_ts
 
+    def update_oldest_ts(self, last_updated_ts: float) -> None:
+        """Set the oldest timestamp if there is not one yet.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._oldest_ts is None:
+            self._oldest_ts = last_updated_ts
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -80,6 +112,29 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._linked_committed_id.clear()
+        self._last_reported.clear()
+
+    def post_commit_bulk_pending(self, committed_ids: dict[str, int]) -> None:
+        """Call after commit to load the state_ids written by a bulk insert.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_committed_id.update(committed_ids)
+
+    def rollback_pending(self) -> None:
+        """Forget the pending states after their transaction was rolled back.
+
+        The committed states that were linked as old states since the last
+        commit can be linked again.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_committed_id.update(self._linked_committed_id)
+        self._linked_committed_id.clear()
+        self._pending.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -89,6 +144,7 @@ class StatesManager:
         recorder thread.
         """
         self._last_committed_id.clear()
+        self._linked_committed_id.clear()
         self._pending.clear()
         self._oldest_ts = None
 
@@ -107,6 +163,10 @@ class StatesManager:
             ts = result[0].last_updated_ts
         self._oldest_ts = ts
 
+    def last_committed_state_ids(self) -> set[int]:
+        """Return the state_ids of the last committed state of each entity."""
+        return set(self._last_committed_id.values())
+
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
 
@@ -134,3 +194,197 @@ class StatesManager:
         last_committed_ids = self._last_committed_id
         for entity_id in purged_entity_ids:
             last_committed_ids.pop(entity_id, None)
+
+
+class BulkStatesBuffer:
+    """Accumulate pending states rows in column buffers.
+
+    The rows are written with a single executemany INSERT .. RETURNING
+    when the event session is committed which bypasses the ORM unit of
+    work and identity map.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the buffer."""
+        self.entity_id: list[str | None] = []
+        self.state: list[str | None] = []
+        self.last_updated_ts: list[float] = []
+        self.last_changed_ts: list[float | None] = []
+        self.last_reported_ts: list[float | None] = []
+        self.context_id_bin: list[bytes | None] = []
+        self.context_user_id_bin: list[bytes | None] = []
+        self.context_parent_id_bin: list[bytes | None] = []
+        self.origin_idx: list[int] = []
+        self.states_meta: list[int | StatesMeta] = []
+        self.state_attributes: list[int | StateAttributes] = []
+        self.old_state_id: list[int | None] = []
+        self.old_state_idx: list[int | None] = []
+        # entity_id -> index of the newest pending row for the entity
+        self._pending: dict[str, int] = {}
+        # entity_id -> state_id of rows written but not yet committed
+        self._written: dict[str, int] = {}
+        # True once the rows were written in the current transaction
+        self.written = False
+
+    def __len__(self) -> int:
+        """Return the number of buffered rows."""
+        return len(self.state)
+
+    def pop_pending(self, entity_id: str) -> int | None:
+        """Pop the index of the newest pending row for an entity_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending.pop(entity_id, None)
+
+    def update_pending_last_reported(
+        self, index: int, last_reported_timestamp: float
+    ) -> None:
+        """Update the last reported timestamp of a pending row."""
+        self.last_reported_ts[index] = last_reported_timestamp
+
+    def append_from_event(
+        self,
+        event: Event[EventStateChangedData],
+        entity_id: str | None,
+        states_meta: int | StatesMeta,
+        state_attributes: int | StateAttributes,
+        old_state_id: int | None,
+        old_state_idx: int | None,
+    ) -> None:
+        """Append a row for a state_changed event.
+
+        The states_meta and state_attributes may be pending objects in
+        the session which will have their ids assigned when the session
+        is flushed before the rows are written.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        data = event.data
+        state = data["new_state"]
+        # None state means the state was removed from the state machine
+        if state is None:
+            self.state.append(None)
+            self.last_updated_ts.append(event.time_fired_timestamp)
+            self.last_changed_ts.append(None)
+            self.last_reported_ts.append(None)
+        else:
+            self._pending[data["entity_id"]] = len(self.state)
+            self.state.append(state.state)
+            last_updated_timestamp = state.last_updated_timestamp
+            self.last_updated_ts.append(last_updated_timestamp)
+            self.last_changed_ts.append(
+                None
+                if last_updated_timestamp == state.last_changed_timestamp
+                else state.last_changed_timestamp
+            )
+            self.last_reported_ts.append(
+                None
+                if last_updated_timestamp == state.last_reported_timestamp
+                else state.last_reported_timestamp
+            )
+        context = event.context
+        self.entity_id.append(entity_id)
+        self.context_id_bin.append(ulid_to_bytes_or_none(context.id))
+        self.context_user_id_bin.append(uuid_hex_to_bytes_or_none(context.user_id))
+        self.context_parent_id_bin.append(ulid_to_bytes_or_none(context.parent_id))
+        self.origin_idx.append(event.origin.idx)
+        self.states_meta.append(states_meta)
+        self.state_attributes.append(state_attributes)
+        self.old_state_id.append(old_state_id)
+        self.old_state_idx.append(old_state_idx)
+
+    def write(self, session: Session) -> None:
+        """Write the buffered rows to the database.
+
+        The session is flushed first so any pending StatesMeta and
+        StateAttributes rows have their ids assigned. The rows are
+        inserted in parameter order so the returned state_ids can be
+        used to link old_state_id for entities that changed more than
+        once in the same commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self.state or self.written:
+            return
+        session.flush()
+        columns = (
+            self.entity_id,
+            self.state,
+            self.last_updated_ts,
+            self.last_changed_ts,
+            self.last_reported_ts,
+            self.context_id_bin,
+            self.context_user_id_bin,
+            self.context_parent_id_bin,
+            self.origin_idx,
+            [
+                meta if type(meta) is int else meta.metadata_id  # type: ignore[union-attr]
+                for meta in self.states_meta
+            ],
+            [
+                attrs if type(attrs) is int else attrs.attributes_id  # type: ignore[union-attr]
+                for attrs in self.state_attributes
+            ],
+            self.old_state_id,
+        )
+        table = States.__table__
+        state_ids: list[int] = list(
+            session.execute(
+                insert(table).returning(table.c.state_id, sort_by_parameter_order=True),
+                [
+                    dict(zip(BULK_INSERT_COLUMNS, row, strict=True))
+                    for row in zip(*columns, strict=True)
+                ],
+            ).scalars()
+        )
+        if old_state_links := [
+            {"state_id": state_ids[idx], "old_state_id": state_ids[old_idx]}
+            for idx, old_idx in enumerate(self.old_state_idx)
+            if old_idx is not None
+        ]:
+            with session.no_autoflush:
+                session.execute(update(States), old_state_links)
+        self._written = {
+            entity_id: state_ids[idx] for entity_id, idx in self._pending.items()
+        }
+        self.written = True
+
+    def post_commit_pending(self) -> dict[str, int]:
+        """Clear the buffer after commit and return the committed state_ids.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        written = self._written
+        self.clear()
+        return written
+
+    def clear(self) -> None:
+        """Clear the buffer.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for column in (
+            self.entity_id,
+            self.state,
+            self.last_updated_ts,
+            self.last_changed_ts,
+            self.last_reported_ts,
+            self.context_id_bin,
+            self.context_user_id_bin,
+            self.context_parent_id_bin,
+            self.origin_idx,
+            self.states_meta,
+            self.state_attributes,
+            self.old_state_id,
+            self.old_state_idx,
+        ):
+            column.clear()
+        self._pending.clear()
+        self._written = {}
+        self.written = False
@@ -11,11 +11,12 @@ import logging
 import threading
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_RECORDER_STATES_PURGED
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -117,9 +118,11 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        finished = purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        )
+        dispatcher_send(instance.hass, SIGNAL_RECORDER_STATES_PURGED)
+        if finished:
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
@@ -140,7 +143,11 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
-        if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
+        finished = purge.purge_entity_data(
+            instance, self.entity_filter, self.purge_before
+        )
+        dispatcher_send(instance.hass, SIGNAL_RECORDER_STATES_PURGED)
+        if finished:
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(PurgeEntitiesTask(self.entity_filter, self.purge_before))
@@ -284,6 +291,17 @@ class KeepAliveTask(RecorderTask):
         instance._send_keep_alive()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class ReplaySpoolTask(RecorderTask):
+    """Replay the next segment of spooled events."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_spool()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class CommitTask(RecorderTask):
     """Commit the event session."""
@@ -318,9 +336,12 @@ class SynchronizeTask(RecorderTask):
 
     # commit_before is the default
     event: asyncio.Event
+    # Set if events were spooled to disk instead of committed
+    spooled: bool = False
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
+        self.spooled = instance._has_spooled_events()  # noqa: SLF001
         # Does not use a tracked task to avoid
         # blocking shutdown if the recorder is broken
         instance.hass.loop.call_soon_threadsafe(self.event.set)
@@ -6,7 +6,6 @@ from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 import datetime
-import itertools
 import logging
 import math
 from typing import Any
@@ -100,41 +99,42 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
 
 
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    fstates: list[tuple[float, State]], start_ts: float, end_ts: float
 ) -> float:
     """Calculate a time weighted average.
 
     The average is calculated by weighting the states by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
+
+    This works on timestamps since creating a datetime for every state
+    is the most expensive part of compiling statistics for many sensors.
     """
     old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    old_start_ts: float | None = None
     accumulated = 0.0
 
     for fstate, state in fstates:
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
+        state_start_ts = max(state.last_updated_timestamp, start_ts)
+        if old_start_ts is None:
             # Adjust start time, if there was no last known state
-            start = start_time
+            start_ts = state_start_ts
         else:
-            duration = start_time - old_start_time
             # Accumulate the value, weighted by duration until next state change
             assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
+            accumulated += old_fstate * (state_start_ts - old_start_ts)
 
         old_fstate = fstate
-        old_start_time = start_time
+        old_start_ts = state_start_ts
 
     if old_fstate is not None:
         # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+        assert old_start_ts is not None
+        accumulated += old_fstate * (end_ts - old_start_ts)
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = end_ts - start_ts
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -410,6 +410,8 @@ def compile_statistics(  # noqa: C901
 ) -> statistics.PlatformCompiledStatistics:
     """Compile statistics for all entities during start-end."""
     result: list[StatisticResult] = []
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
@@ -514,9 +516,10 @@ def compile_statistics(  # noqa: C901
                 continue
 
         # Set meta data
+        wanted = wanted_statistics[entity_id]
         meta: StatisticMetaData = {
-            "has_mean": "mean" in wanted_statistics[entity_id],
-            "has_sum": "sum" in wanted_statistics[entity_id],
+            "has_mean": "mean" in wanted,
+            "has_sum": "sum" in wanted,
             "name": None,
             "source": RECORDER_DOMAIN,
             "statistic_id": entity_id,
@@ -525,19 +528,17 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if "max" in wanted or "min" in wanted:
+            values = [fstate for fstate, _ in valid_float_states]
+            if "max" in wanted:
+                stat["max"] = max(values)
+            if "min" in wanted:
+                stat["min"] = min(values)
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+        if "mean" in wanted:
+            stat["mean"] = _time_weighted_average(valid_float_states, start_ts, end_ts)
 
-        if "sum" in wanted_statistics[entity_id]:
+        if "sum" in wanted:
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0.0
@@ -14,6 +14,8 @@ from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
@@ -35,6 +37,7 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
@@ -60,13 +63,25 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_subscriptions import EntitySubscription, async_get_entity_subscriptions
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+DOMAIN_SERVICE_DESCRIPTIONS_JSON_CACHE: HassKey[
+    dict[str, tuple[dict[str, Any], bytes]]
+] = HassKey("websocket_api_domain_service_descriptions_json")
+ALL_STATES_JSON_CACHE: HassKey[dict[str, tuple[int, bytes]]] = HassKey(
+    "websocket_api_all_states_json"
+)
+
+# Seconds to wait for more services to change before
+# sending the changes to subscribe_services subscriptions
+SERVICES_CHANGED_COOLDOWN = 0.5
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,6 +106,7 @@ def async_register_commands(
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
+    async_reg(hass, handle_subscribe_services)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
@@ -309,12 +325,18 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+@callback
+def _async_can_read_all_states(connection: ActiveConnection) -> bool:
+    """Return if the user of the connection can read the state of every entity."""
+    user = connection.user
+    return user.is_admin or user.permissions.access_all_entities(POLICY_READ)
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
 ) -> list[State]:
-    user = connection.user
-    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+    if _async_can_read_all_states(connection):
         return hass.states.async_all()
     entity_perm = connection.user.permissions.check_entity
     return [
@@ -330,6 +352,15 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    if _async_can_read_all_states(connection):
+        try:
+            payload = _async_get_all_states_json(hass, "as_dict_json")
+        except (ValueError, TypeError):
+            pass
+        else:
+            _send_handle_get_states_response(connection, msg["id"], [payload])
+            return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -356,6 +387,24 @@ def handle_get_states(
     _send_handle_get_states_response(connection, msg["id"], serialized_states)
 
 
+@callback
+def _async_get_all_states_json(hass: HomeAssistant, attr: str) -> bytes:
+    """Return a JSON attribute of every state joined by commas.
+
+    The payload is cached until the state machine changes, so clients
+    that fetch all states in between share a single payload.
+
+    Raises ValueError or TypeError if a state can't be serialized.
+    """
+    cache = hass.data.setdefault(ALL_STATES_JSON_CACHE, {})
+    version = hass.states.version
+    if (cached := cache.get(attr)) is not None and cached[0] == version:
+        return cached[1]
+    payload = b",".join([getattr(state, attr) for state in hass.states.async_all()])
+    cache[attr] = (version, payload)
+    return payload
+
+
 def _send_handle_get_states_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
 ) -> None:
@@ -367,38 +416,13 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("low_priority", default=False): bool,
+        vol.Optional("cursor"): vol.Any(str, None),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -415,19 +439,41 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
+    entity_subscriptions = async_get_entity_subscriptions(hass)
+    # Clients that pass a cursor, even if it is null, get a cursor with
+    # every message to resume the subscription from after a reconnect
+    cursor: str | None = None
+    changed_entity_ids: set[str] | None = None
+    if with_cursor := "cursor" in msg:
+        cursor = entity_subscriptions.async_cursor()
+        changed_entity_ids = entity_subscriptions.async_entity_ids_changed_since(
+            msg["cursor"]
+        )
+    connection.subscriptions[msg_id] = entity_subscriptions.async_add(
+        EntitySubscription(
+            connection.send_coalesced_message,
             connection.user,
             message_id_as_bytes,
-        ),
+            entity_ids,
+            entity_filter,
+            msg["low_priority"],
+            with_cursor,
+        )
     )
     connection.send_result(msg_id)
 
+    if changed_entity_ids is not None:
+        _send_handle_entities_resume_response(
+            hass,
+            connection,
+            message_id_as_bytes,
+            changed_entity_ids,
+            entity_ids,
+            entity_filter,
+            cast(str, cursor),
+        )
+        return
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -439,14 +485,18 @@ def handle_subscribe_entities(
                 if (not entity_ids or state.entity_id in entity_ids)
                 and (not entity_filter or entity_filter(state.entity_id))
             ]
-        else:
+        elif _async_can_read_all_states(connection):
             # Fast path when not filtering
+            serialized_states = [
+                _async_get_all_states_json(hass, "as_compressed_state_json")
+            ]
+        else:
             serialized_states = [state.as_compressed_state_json for state in states]
     except (ValueError, TypeError):
         pass
     else:
         _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            connection, message_id_as_bytes, serialized_states, cursor
         )
         return
 
@@ -463,7 +513,7 @@ def handle_subscribe_entities(
             )
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection, message_id_as_bytes, serialized_states, cursor
     )
 
 
@@ -471,6 +521,7 @@ def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
     serialized_states: list[bytes],
+    cursor: str | None = None,
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
@@ -480,7 +531,63 @@ def _send_handle_entities_init_response(
                 message_id_as_bytes,
                 b',"type":"event","event":{"a":{',
                 b",".join(serialized_states),
-                b"}}}",
+                b"}}",
+                b"" if cursor is None else b',"cursor":' + json_bytes(cursor),
+                b"}",
+            )
+        )
+    )
+
+
+def _send_handle_entities_resume_response(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    message_id_as_bytes: bytes,
+    changed_entity_ids: set[str],
+    entity_ids: set[str] | None,
+    entity_filter: Callable[[str], bool] | None,
+    cursor: str,
+) -> None:
+    """Send the entities that changed since the cursor the client resumes from."""
+    check_entity = (
+        None
+        if _async_can_read_all_states(connection)
+        else connection.user.permissions.check_entity
+    )
+    serialized_states: list[bytes] = []
+    removed_entity_ids: list[str] = []
+    for entity_id in changed_entity_ids:
+        if (
+            (entity_ids and entity_id not in entity_ids)
+            or (entity_filter and not entity_filter(entity_id))
+            or (check_entity and not check_entity(entity_id, POLICY_READ))
+        ):
+            continue
+        if (state := hass.states.get(entity_id)) is None:
+            removed_entity_ids.append(entity_id)
+            continue
+        try:
+            serialized_states.append(state.as_compressed_state_json)
+        except (ValueError, TypeError):
+            connection.logger.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(state, dump=JSON_DUMP)
+                ),
+            )
+
+    connection.send_message(
+        b"".join(
+            (
+                b'{"id":',
+                message_id_as_bytes,
+                b',"type":"event","event":{"a":{',
+                b",".join(serialized_states),
+                b'},"r":',
+                json_bytes(removed_entity_ids),
+                b'},"cursor":',
+                json_bytes(cursor),
+                b',"resumed":true}',
             )
         )
     )
@@ -496,11 +603,37 @@ async def _async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
         # If the descriptions are the same, return the cached JSON payload
         if cached_descriptions is descriptions:
             return cast(bytes, cached_json_payload)
-    json_payload = json_bytes(descriptions)
+    fragments = _async_get_domain_descriptions_json(hass, descriptions)
+    json_payload = b"".join((b"{", b",".join(fragments.values()), b"}"))
     hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (descriptions, json_payload)
     return json_payload
 
 
+@callback
+def _async_get_domain_descriptions_json(
+    hass: HomeAssistant, descriptions: dict[str, dict[str, Any]]
+) -> dict[str, bytes]:
+    """Return the JSON member of the service descriptions of each domain.
+
+    The descriptions of a domain are only serialized again when they are
+    a new object, which is when the services of the domain changed.
+    """
+    if (cache := hass.data.get(DOMAIN_SERVICE_DESCRIPTIONS_JSON_CACHE)) is None:
+        cache = hass.data[DOMAIN_SERVICE_DESCRIPTIONS_JSON_CACHE] = {}
+    fragments: dict[str, bytes] = {}
+    for domain, domain_descriptions in descriptions.items():
+        cached = cache.get(domain)
+        if cached is None or cached[0] is not domain_descriptions:
+            cached = cache[domain] = (
+                domain_descriptions,
+                b"".join((json_bytes(domain), b":", json_bytes(domain_descriptions))),
+            )
+        fragments[domain] = cached[1]
+    for domain in cache.keys() - descriptions.keys():
+        del cache[domain]
+    return fragments
+
+
 @decorators.websocket_command({vol.Required("type"): "get_services"})
 @decorators.async_response
 async def handle_get_services(
@@ -511,6 +644,85 @@ async def handle_get_services(
     connection.send_message(construct_result_message(msg["id"], payload))
 
 
+@decorators.websocket_command({vol.Required("type"): "subscribe_services"})
+@decorators.async_response
+async def handle_subscribe_services(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe services command.
+
+    The first event has the descriptions of all domains, later events only
+    those of the domains whose services changed and the removed domains.
+    """
+    msg_id = msg["id"]
+    message_id_as_bytes = str(msg_id).encode()
+    # The descriptions of each domain the client has been sent
+    sent: dict[str, dict[str, Any]] = {}
+
+    async def _async_send_changed_domains() -> None:
+        """Send the descriptions of the domains that changed."""
+        descriptions = await async_get_all_descriptions(hass)
+        if msg_id not in connection.subscriptions:
+            return
+        fragments = _async_get_domain_descriptions_json(hass, descriptions)
+        changed = [
+            fragments[domain]
+            for domain, domain_descriptions in descriptions.items()
+            if sent.get(domain) is not domain_descriptions
+        ]
+        removed = [domain for domain in sent if domain not in descriptions]
+        if not changed and not removed:
+            return
+        sent.clear()
+        sent.update(descriptions)
+        event_members: list[bytes] = []
+        if changed:
+            event_members.append(b"".join((b'"a":{', b",".join(changed), b"}")))
+        if removed:
+            event_members.append(b'"r":' + json_bytes(removed))
+        connection.send_message(
+            b"".join(
+                (
+                    b'{"id":',
+                    message_id_as_bytes,
+                    b',"type":"event","event":{',
+                    b",".join(event_members),
+                    b"}}",
+                )
+            )
+        )
+
+    # Services are registered in bursts while integrations are set up
+    debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=SERVICES_CHANGED_COOLDOWN,
+        immediate=False,
+        function=_async_send_changed_domains,
+    )
+
+    @callback
+    def _async_services_changed(event: Event) -> None:
+        """Schedule sending the domains that changed."""
+        debouncer.async_schedule_call()
+
+    unsubs = [
+        hass.bus.async_listen(EVENT_SERVICE_REGISTERED, _async_services_changed),
+        hass.bus.async_listen(EVENT_SERVICE_REMOVED, _async_services_changed),
+    ]
+
+    @callback
+    def _async_unsubscribe() -> None:
+        """Stop sending the services that changed."""
+        for unsub in unsubs:
+            unsub()
+        debouncer.async_shutdown()
+
+    connection.subscriptions[msg_id] = _async_unsubscribe
+    connection.send_result(msg_id)
+    await _async_send_changed_domains()
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "get_config"})
 def handle_get_config(
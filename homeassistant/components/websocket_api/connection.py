@@ -43,6 +43,7 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "send_coalesced_message",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -65,6 +66,10 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Replaced by the websocket handler once the connection is authenticated
+        self.send_coalesced_message: Callable[
+            [Hashable, bytes, Callable[[], bytes], bool], None
+        ] = self._send_uncoalesced_message
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -129,6 +134,17 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    @callback
+    def _send_uncoalesced_message(
+        self,
+        key: Hashable,
+        message: bytes,
+        latest_message: Callable[[], bytes],
+        low_priority: bool,
+    ) -> None:
+        """Send a message without coalescing it."""
+        self.send_message(message)
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -34,6 +34,12 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages after which a message that can be coalesced,
+# like a state change of an entity, replaces the pending message with the
+# same key instead of being added to the queue. Coalesced messages do not
+# count towards MAX_PENDING_MSG and PENDING_MSG_PEAK.
+PENDING_MSG_COALESCE: Final = 512
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
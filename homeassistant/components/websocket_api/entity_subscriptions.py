@@ -0,0 +1,202 @@
+"""Shared fan-out of state changes to subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from functools import partial
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
+
+from . import messages
+from .const import DOMAIN
+
+DATA_ENTITY_SUBSCRIPTIONS: HassKey[EntitySubscriptions] = HassKey(
+    f"{DOMAIN}.entity_subscriptions"
+)
+
+
+@dataclass(slots=True, eq=False)
+class EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    send_coalesced_message: Callable[[Hashable, bytes, Callable[[], bytes], bool], None]
+    user: User
+    message_id_as_bytes: bytes
+    entity_ids: set[str] | None
+    entity_filter: Callable[[str], bool] | None
+    # Low priority subscriptions only get the latest state of an entity
+    # when several changes are pending
+    low_priority: bool = False
+    # Add the cursor to resume the subscription from to every message
+    with_cursor: bool = False
+
+
+class EntitySubscriptions:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state changed listener serves every subscription. Subscriptions
+    with entity_ids are indexed by entity_id, so a state change only visits
+    the subscriptions that can want it. The state diff is serialized once
+    per state change and the permissions are checked once per user.
+
+    The state changes are sent as coalesced messages keyed by subscription
+    and entity_id. When a connection falls behind, the pending state change
+    of an entity is replaced by the full state of the latest change, which
+    moves to the end of the queue. The cursors of the messages a client gets
+    only increase, as no message is sent ahead of an older change.
+
+    A cursor is the run and the version of the state machine up to which
+    a client got the state changes. A client that reconnects can pass it
+    to only get the entities that changed since.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self.hass = hass
+        # The version of the state machine starts over on every run
+        self._run_id = ulid_now()
+        self._by_entity_id: dict[str, dict[EntitySubscription, None]] = {}
+        self._all_entities: dict[EntitySubscription, None] = {}
+        self._listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(self, subscription: EntitySubscription) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if (entity_ids := subscription.entity_ids) is None:
+            self._all_entities[subscription] = None
+        else:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+        if self._listener is None:
+            self._listener = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_forward,
+                event_filter=self._async_filter,
+            )
+        return partial(self._async_remove, subscription)
+
+    @callback
+    def _async_remove(self, subscription: EntitySubscription) -> None:
+        """Remove a subscription."""
+        if (entity_ids := subscription.entity_ids) is None:
+            del self._all_entities[subscription]
+        else:
+            by_entity_id = self._by_entity_id
+            for entity_id in entity_ids:
+                subscriptions = by_entity_id[entity_id]
+                del subscriptions[subscription]
+                if not subscriptions:
+                    del by_entity_id[entity_id]
+        if self._listener is not None and not (
+            self._all_entities or self._by_entity_id
+        ):
+            self._listener()
+            self._listener = None
+
+    @callback
+    def async_cursor(self) -> str:
+        """Return the cursor of the state changes dispatched so far."""
+        return f"{self._run_id}:{self.hass.states.dispatched_version}"
+
+    @callback
+    def _async_forward_cursor(self) -> str:
+        """Return the cursor of the state change being forwarded."""
+        states = self.hass.states
+        version = states.version
+        # The state change being forwarded is the only one that is dispatched,
+        # so the subscriptions got every state change up to it
+        if states.dispatched_version == version - 1:
+            return f"{self._run_id}:{version}"
+        return self.async_cursor()
+
+    @callback
+    def async_entity_ids_changed_since(self, cursor: str | None) -> set[str] | None:
+        """Return the entity ids changed after a cursor, or None if it is unknown."""
+        if not cursor:
+            return None
+        run_id, _, version = cursor.partition(":")
+        if run_id != self._run_id or not version.isdigit():
+            return None
+        return self.hass.states.async_entity_ids_changed_since(int(version))
+
+    @callback
+    def _async_filter(self, event_data: EventStateChangedData) -> bool:
+        """Filter state changes nobody subscribed to."""
+        return bool(self._all_entities) or event_data["entity_id"] in self._by_entity_id
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the subscriptions that want it."""
+        entity_id = event.data["entity_id"]
+        subscriptions: list[EntitySubscription] = list(self._all_entities)
+        if entity_specific := self._by_entity_id.get(entity_id):
+            subscriptions.extend(entity_specific)
+        prefix: bytes | None = None
+        cursor: str | None = None
+        cursor_prefix: bytes | None = None
+        # We have to lookup the permissions again because the user might have
+        # changed since the subscription was created.
+        permitted_users: dict[str, bool] = {}
+        for subscription in subscriptions:
+            if (entity_filter := subscription.entity_filter) and not entity_filter(
+                entity_id
+            ):
+                continue
+            user = subscription.user
+            if (permitted := permitted_users.get(user.id)) is None:
+                permissions = user.permissions
+                permitted = permitted_users[user.id] = (
+                    user.is_admin
+                    or permissions.access_all_entities(POLICY_READ)
+                    or permissions.check_entity(entity_id, POLICY_READ)
+                )
+            if not permitted:
+                continue
+            message_id_as_bytes = subscription.message_id_as_bytes
+            if subscription.with_cursor:
+                if cursor_prefix is None:
+                    cursor = self._async_forward_cursor()
+                    cursor_prefix = messages.cached_state_diff_message_prefix(
+                        event, cursor
+                    )
+                message_prefix = cursor_prefix
+                latest_message = partial(
+                    messages.cached_state_replace_message,
+                    message_id_as_bytes,
+                    event,
+                    cursor,
+                )
+            else:
+                if prefix is None:
+                    prefix = messages.cached_state_diff_message_prefix(event)
+                message_prefix = prefix
+                latest_message = partial(
+                    messages.cached_state_replace_message, message_id_as_bytes, event
+                )
+            subscription.send_coalesced_message(
+                (message_id_as_bytes, entity_id),
+                b"".join((message_prefix, message_id_as_bytes, b"}")),
+                latest_message,
+                subscription.low_priority,
+            )
+
+
+@callback
+def async_get_entity_subscriptions(hass: HomeAssistant) -> EntitySubscriptions:
+    """Return the subscribe_entities subscriptions."""
+    if (subscriptions := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        subscriptions = EntitySubscriptions(hass)
+        hass.data[DATA_ENTITY_SUBSCRIPTIONS] = subscriptions
+    return subscriptions
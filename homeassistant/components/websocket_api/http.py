@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
 import datetime as dt
 from functools import partial
 import logging
@@ -25,6 +25,7 @@ from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -66,6 +67,22 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f"[{self.extra['connid']}] {msg}", kwargs
 
 
+class _CoalescedMessage:
+    """A pending message that is replaced by later messages with the same key.
+
+    A replaced message stays in the queue without latest_message.
+    """
+
+    __slots__ = ("key", "latest_message")
+
+    def __init__(
+        self, key: Hashable, latest_message: Callable[[], bytes] | None
+    ) -> None:
+        """Initialize the coalesced message."""
+        self.key = key
+        self.latest_message = latest_message
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -82,6 +99,8 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_coalesced_messages",
+        "_replaced_messages",
         "_ready_future",
         "_release_ready_queue_size",
     )
@@ -104,7 +123,11 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes] = deque()
+        self._message_queue: deque[bytes | _CoalescedMessage] = deque()
+        # Pending coalesced messages by key
+        self._coalesced_messages: dict[Hashable, _CoalescedMessage] = {}
+        # Replaced coalesced messages that are still in the queue
+        self._replaced_messages = 0
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
 
@@ -157,12 +180,38 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    if type(message) is not bytes:
+                        if (
+                            latest_message := self._pop_coalesced_message(message)
+                        ) is None:
+                            continue
+                        message = latest_message
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                if self._coalesced_messages:
+                    coalesced_messages = b"".join(
+                        (
+                            b"[",
+                            b",".join(
+                                message
+                                for message in (
+                                    queued
+                                    if type(queued) is bytes
+                                    else self._pop_coalesced_message(queued)
+                                    for queued in message_queue
+                                )
+                                if message is not None
+                            ),
+                            b"]",
+                        )
+                    )
+                else:
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(message_queue), b"]")  # type: ignore[arg-type]
+                    )
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
@@ -184,6 +233,27 @@ class WebSocketHandler:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    @callback
+    def _pop_coalesced_message(self, message: _CoalescedMessage) -> bytes | None:
+        """Build a coalesced message that is about to be sent.
+
+        Returns None if the message was replaced by a later one in the queue.
+        """
+        if (latest_message := message.latest_message) is None:
+            self._replaced_messages -= 1
+            return None
+        del self._coalesced_messages[message.key]
+        return latest_message()
+
+    @callback
+    def _pending_message_count(self) -> int:
+        """Return the number of queued messages that are not coalesced."""
+        return (
+            len(self._message_queue)
+            - len(self._coalesced_messages)
+            - self._replaced_messages
+        )
+
     @callback
     def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
         """Queue sending a message to the client.
@@ -203,9 +273,72 @@ class WebSocketHandler:
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
+        self._queue_message(message)
+
+    @callback
+    def _send_coalesced_message(
+        self,
+        key: Hashable,
+        message: bytes,
+        latest_message: Callable[[], bytes],
+        low_priority: bool,
+    ) -> None:
+        """Queue sending a message that a later message with the same key replaces.
+
+        Once PENDING_MSG_COALESCE messages are pending, or always for low
+        priority messages, latest_message is queued instead of message. It must
+        build a message that does not depend on earlier messages with the same
+        key, and is only called when the message is sent. While it is pending,
+        messages with the same key replace it and move it to the end of the
+        queue, so it is never sent ahead of messages queued before it.
+
+        Async friendly.
+        """
+        if self._closing:
+            return
+
+        coalesced_messages = self._coalesced_messages
+        if (pending := coalesced_messages.get(key)) is not None:
+            pending.latest_message = None
+            self._replaced_messages += 1
+            pending = coalesced_messages[key] = _CoalescedMessage(key, latest_message)
+            message_queue = self._message_queue
+            message_queue.append(pending)
+            # Keep the queue bounded by the number of keys
+            if self._replaced_messages * 2 > len(message_queue):
+                self._compact_message_queue()
+            return
+
+        if not low_priority and self._pending_message_count() < PENDING_MSG_COALESCE:
+            self._queue_message(message)
+            return
+
+        pending = coalesced_messages[key] = _CoalescedMessage(key, latest_message)
+        self._queue_message(pending)
+
+    @callback
+    def _compact_message_queue(self) -> None:
+        """Drop the replaced coalesced messages from the queue."""
+        message_queue = self._message_queue
+        queued = [
+            message
+            for message in message_queue
+            if type(message) is bytes or message.latest_message is not None
+        ]
+        message_queue.clear()
+        message_queue.extend(queued)
+        self._replaced_messages = 0
+
+    @callback
+    def _queue_message(self, message: bytes | _CoalescedMessage) -> None:
+        """Add a message to the queue."""
         message_queue = self._message_queue
         message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        queue_size_after_add = len(message_queue)
+        # Coalesced messages are bounded by their keys, so they don't count
+        # towards the limits
+        pending_count = self._pending_message_count()
+        if pending_count >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
@@ -226,7 +359,7 @@ class WebSocketHandler:
 
         peak_checker_active = self._peak_checker_unsub is not None
 
-        if queue_size_after_add <= PENDING_MSG_PEAK:
+        if pending_count <= PENDING_MSG_PEAK:
             if peak_checker_active:
                 self._cancel_peak_checker()
             return
@@ -267,7 +400,7 @@ class WebSocketHandler:
         """Check that we are no longer above the write peak."""
         self._peak_checker_unsub = None
 
-        if len(self._message_queue) < PENDING_MSG_PEAK:
+        if self._pending_message_count() < PENDING_MSG_PEAK:
             return
 
         self._logger.error(
@@ -403,6 +536,7 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        connection.send_coalesced_message = self._send_coalesced_message
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -162,6 +162,30 @@ def cached_state_diff_message(
     )
 
 
+def cached_state_diff_message_prefix(
+    event: Event[EventStateChangedData], cursor: str | None = None
+) -> bytes:
+    """Return a state diff message up to the message id.
+
+    Appending the message id and a closing brace completes the message,
+    so the prefix can be shared by every subscription getting the event.
+    """
+    return b"".join(
+        (
+            _partial_cached_state_diff_message(event)[:-1],
+            _cursor_member(cursor),
+            b',"id":',
+        )
+    )
+
+
+def _cursor_member(cursor: str | None) -> bytes:
+    """Return the JSON member with the cursor of a subscribe_entities message."""
+    if cursor is None:
+        return b""
+    return b"".join((b',"cursor":', json_bytes(cursor)))
+
+
 @lru_cache(maxsize=128)
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
@@ -177,6 +201,48 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def cached_state_replace_message(
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    cursor: str | None = None,
+) -> bytes:
+    """Return an event message with the full new state or the removal of an entity.
+
+    Unlike a state diff, the message does not depend on the earlier messages
+    for the entity, so it can replace a pending message for the same entity.
+    """
+    return b"".join(
+        (
+            _partial_cached_state_replace_message(event)[:-1],
+            _cursor_member(cursor),
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_replace_message(
+    event: Event[EventStateChangedData],
+) -> bytes:
+    """Cache and serialize the event to json.
+
+    The message is constructed without the id which
+    will be appended in cached_state_replace_message
+    """
+    if (new_state := event.data["new_state"]) is None:
+        replace_event: dict[str, Any] = {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    else:
+        replace_event = {
+            ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}
+        }
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": replace_event})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -205,9 +271,9 @@ def _state_diff_event(
     old_state_context = old_state.context
     if old_state.state != new_state.state:
         additions[COMPRESSED_STATE_STATE] = new_state.state
-    if old_state.last_changed != new_state.last_changed:
+    if old_state.last_changed_timestamp != new_state.last_changed_timestamp:
         additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed_timestamp
-    elif old_state.last_updated != new_state.last_updated:
+    elif old_state.last_updated_timestamp != new_state.last_updated_timestamp:
         additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated_timestamp
     if old_state_context.parent_id != new_state_context.parent_id:
         additions[COMPRESSED_STATE_CONTEXT] = {"parent_id": new_state_context.parent_id}
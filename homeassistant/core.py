@@ -7,7 +7,7 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
-from collections import UserDict, defaultdict
+from collections import UserDict, defaultdict, deque
 from collections.abc import (
     Callable,
     Collection,
@@ -41,15 +41,21 @@ from typing import (
     overload,
 )
 
+from lru import LRU
 from propcache import cached_property, under_cached_property
 import voluptuous as vol
 
 from . import util
 from .const import (
+    ATTR_ATTRIBUTION,
+    ATTR_DEVICE_CLASS,
     ATTR_DOMAIN,
+    ATTR_ENTITY_PICTURE,
     ATTR_FRIENDLY_NAME,
+    ATTR_ICON,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    ATTR_UNIT_OF_MEASUREMENT,
     COMPRESSED_STATE_ATTRIBUTES,
     COMPRESSED_STATE_CONTEXT,
     COMPRESSED_STATE_LAST_CHANGED,
@@ -193,6 +199,27 @@ _DEPRECATED_Config = DeferredDeprecatedAlias(
 TIMEOUT_EVENT_START = 15
 
 
+# Values of these attributes rarely change and repeat across entities,
+# so values up to MAX_INTERNED_ATTRIBUTE_LENGTH are shared between states
+_INTERNED_ATTRIBUTES = (
+    ATTR_FRIENDLY_NAME,
+    ATTR_UNIT_OF_MEASUREMENT,
+    ATTR_DEVICE_CLASS,
+    ATTR_ICON,
+    ATTR_ENTITY_PICTURE,
+    ATTR_ATTRIBUTION,
+    "state_class",
+)
+MAX_INTERNED_ATTRIBUTE_LENGTH = 100
+
+# How many shared attribute values are kept,
+# the least recently used are dropped first
+MAX_INTERNED_ATTRIBUTES = 16384
+
+# How many of the most recent state changes are remembered
+# to look up the entities that changed since a version
+MAX_RECENT_STATE_CHANGES = 8192
+
 EVENTS_EXCLUDED_FROM_MATCH_ALL = {
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_STATE_REPORTED,
@@ -1445,10 +1472,6 @@ class _OneTimeListener(Generic[_DataT]):
         return f"<_OneTimeListener {self.listener_job.target}>"
 
 
-# Empty list, used by EventBus.async_fire_internal
-EMPTY_LIST: list[Any] = []
-
-
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
     """Verify the length of the event type and raise if too long."""
@@ -1456,10 +1479,123 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
         raise MaxLengthExceeded(event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE)
 
 
+class _DispatchStats:
+    """Dispatch count and time of an event type or listener."""
+
+    __slots__ = ("count", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.count = 0
+        self.max = 0.0
+        self.total = 0.0
+
+    def add(self, duration: float) -> None:
+        """Add a dispatch that took duration seconds."""
+        self.count += 1
+        self.total += duration
+        self.max = max(duration, self.max)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the stats as a dict."""
+        return {"count": self.count, "total": self.total, "max": self.max}
+
+
+class _ListenerDispatchStats(_DispatchStats):
+    """Dispatch count and time of the listeners with the same callable."""
+
+    __slots__ = ("filtered",)
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        super().__init__()
+        # Events the event filter did not let through
+        self.filtered = 0
+
+    def add_filtered(self, duration: float) -> None:
+        """Add an event the event filter took duration seconds to reject."""
+        self.filtered += 1
+        self.total += duration
+        self.max = max(duration, self.max)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the stats as a dict."""
+        return {**super().as_dict(), "filtered": self.filtered}
+
+
+def _callable_qualname(target: Callable[..., Any]) -> str:
+    """Return the module and qualified name of a callable."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    if (qualname := getattr(target, "__qualname__", None)) is None:
+        # Callable instances are named after their class
+        qualname = type(target).__qualname__
+    return f"{getattr(target, '__module__', None)}.{qualname}"
+
+
+class EventBusProfile:
+    """Time spent dispatching events while the event bus is profiled.
+
+    The time of a listener includes running its event filter. Listeners
+    that are coroutine functions or run in the executor are only timed
+    until their task or job is scheduled. Listeners are grouped by the
+    name of their job and the module and qualified name of their callable,
+    so removed listeners are not kept alive.
+    """
+
+    __slots__ = ("event_types", "listeners", "started")
+
+    def __init__(self) -> None:
+        """Initialize the profile."""
+        self.started = time.time()
+        self.event_types: defaultdict[EventType[Any] | str, _DispatchStats] = (
+            defaultdict(_DispatchStats)
+        )
+        self.listeners: defaultdict[
+            tuple[EventType[Any] | str, str | None, str], _ListenerDispatchStats
+        ] = defaultdict(_ListenerDispatchStats)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile as a dict, slowest first."""
+        return {
+            "started": self.started,
+            "event_types": [
+                {"event_type": event_type, **stats.as_dict()}
+                for event_type, stats in sorted(
+                    self.event_types.items(),
+                    key=lambda item: item[1].total,
+                    reverse=True,
+                )
+            ],
+            "listeners": [
+                {
+                    "event_type": event_type,
+                    "name": name,
+                    "target": target,
+                    **stats.as_dict(),
+                }
+                for (event_type, name, target), stats in sorted(
+                    self.listeners.items(),
+                    key=lambda item: item[1].total,
+                    reverse=True,
+                )
+            ],
+        }
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_dispatch",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_dispatch",
+        "_match_all_listeners",
+        "_profile",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1604,18 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Immutable listeners to run per event type, they are rebuilt
+        # on the next fire after a listener is added or removed
+        self._dispatch: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {}
+        self._match_all_dispatch: tuple[_FilterableJobType[Any], ...] | None = None
+        # event_type -> event data key -> value -> listeners
+        self._keyed_listeners: dict[
+            EventType[Any] | str,
+            dict[str, dict[Any, tuple[HassJob[[Event[Any]], Any], ...]]],
+        ] = {}
+        self._profile: EventBusProfile | None = None
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1483,7 +1631,16 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners_count = {
+            key: len(listeners) for key, listeners in self._listeners.items()
+        }
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners_count[event_type] = listeners_count.get(event_type, 0) + sum(
+                len(jobs)
+                for jobs_by_value in keyed_listeners.values()
+                for jobs in jobs_by_value.values()
+            )
+        return listeners_count
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1548,14 +1705,17 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
+        if self._profile is not None:
+            self._async_fire_profiled(
+                self._profile, event_type, event_data, origin, context, time_fired
+            )
+            return
+
+        if (listeners := self._dispatch.get(event_type)) is None:
+            listeners = self._async_build_dispatch(event_type)
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+        for job, event_filter in listeners:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1578,6 +1738,164 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if (
+            event_data is None
+            or (keyed_listeners := self._keyed_listeners.get(event_type)) is None
+        ):
+            return
+
+        for data_key, jobs_by_value in keyed_listeners.items():
+            try:
+                jobs = jobs_by_value.get(event_data.get(data_key))
+            except TypeError:
+                # The value is not hashable so no listener can match it
+                continue
+            if jobs is None:
+                continue
+            if not event:
+                event = Event(
+                    event_type,
+                    event_data,
+                    origin,
+                    time_fired,
+                    context,
+                )
+            for job in jobs:
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def _async_fire_profiled(
+        self,
+        profile: EventBusProfile,
+        event_type: EventType[_DataT] | str,
+        event_data: _DataT | None,
+        origin: EventOrigin,
+        context: Context | None,
+        time_fired: float | None,
+    ) -> None:
+        """Fire an event and record the time spent in each listener."""
+        start = time.perf_counter()
+        if (listeners := self._dispatch.get(event_type)) is None:
+            listeners = self._async_build_dispatch(event_type)
+        if event_data is not None and (
+            keyed_listeners := self._keyed_listeners.get(event_type)
+        ):
+            listeners_list = list(listeners)
+            for data_key, jobs_by_value in keyed_listeners.items():
+                try:
+                    jobs = jobs_by_value.get(event_data.get(data_key), ())
+                except TypeError:
+                    continue
+                listeners_list.extend((job, None) for job in jobs)
+            listeners = tuple(listeners_list)
+
+        event: Event[_DataT] | None = None
+        profile_listeners = profile.listeners
+        for job, event_filter in listeners:
+            listener_start = time.perf_counter()
+            dispatched = False
+            try:
+                if event_filter is not None:
+                    try:
+                        if event_data is None or not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+
+                if not event:
+                    event = Event(
+                        event_type,
+                        event_data,
+                        origin,
+                        time_fired,
+                        context,
+                    )
+
+                dispatched = True
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+            finally:
+                duration = time.perf_counter() - listener_start
+                stats = profile_listeners[
+                    event_type, job.name, _callable_qualname(job.target)
+                ]
+                if dispatched:
+                    stats.add(duration)
+                else:
+                    stats.add_filtered(duration)
+
+        profile.event_types[event_type].add(time.perf_counter() - start)
+
+    @callback
+    def async_start_profile(self) -> None:
+        """Start recording the time spent dispatching events.
+
+        Profiling adds overhead to every event that is fired and
+        should only be enabled while investigating a slow event loop.
+
+        This method must be run in the event loop.
+        """
+        if self._profile is None:
+            self._profile = EventBusProfile()
+
+    @callback
+    def async_stop_profile(self) -> dict[str, Any] | None:
+        """Stop profiling and return the recorded profile.
+
+        This method must be run in the event loop.
+        """
+        profile, self._profile = self._profile, None
+        return profile.as_dict() if profile else None
+
+    @callback
+    def async_profile(self) -> dict[str, Any] | None:
+        """Return the profile recorded so far or None when not profiling.
+
+        This method must be run in the event loop.
+        """
+        return self._profile.as_dict() if self._profile else None
+
+    @callback
+    def _async_build_dispatch(
+        self, event_type: EventType[Any] | str
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Build the listeners to run for an event type."""
+        if (match_all_dispatch := self._match_all_dispatch) is None:
+            match_all_dispatch = self._match_all_dispatch = tuple(
+                self._match_all_listeners
+            )
+        if event_type in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            match_all_dispatch = ()
+        if event_type not in self._listeners:
+            # Not stored to avoid keeping every event type
+            # that was ever fired without listeners
+            return match_all_dispatch
+        dispatch = tuple(self._listeners[event_type]) + match_all_dispatch
+        self._dispatch[event_type] = dispatch
+        return dispatch
+
+    @callback
+    def _async_has_listeners(self, event_type: EventType[Any] | str) -> bool:
+        """Return if any listener runs for an event type."""
+        if (listeners := self._dispatch.get(event_type)) is None:
+            listeners = self._async_build_dispatch(event_type)
+        return bool(listeners) or event_type in self._keyed_listeners
+
+    @callback
+    def _async_invalidate_dispatch(self, event_type: EventType[Any] | str) -> None:
+        """Invalidate the listeners to run after listeners changed."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+            self._match_all_dispatch = None
+        else:
+            self._dispatch.pop(event_type, None)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1649,10 +1967,75 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._async_invalidate_dispatch(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        values: Iterable[Any],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type by a value of their event data.
+
+        The listener runs for events where the event data value of data_key
+        is one of values. This replaces an event_filter that checks
+        event_data[data_key] with a dict lookup when the event is fired, so
+        the cost of firing the event does not grow with the number of keyed
+        listeners.
+
+        Keyed listeners run after the other listeners of the event type.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require an event type")
+        job = HassJob(listener, f"listen {event_type} by {data_key}")
+        jobs_by_value = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        )
+        values = frozenset(values)
+        for value in values:
+            jobs_by_value[value] = (*jobs_by_value.get(value, ()), job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, data_key, values, job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        values: frozenset[Any],
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            jobs_by_value = keyed_listeners[data_key]
+            for value in values:
+                jobs = jobs_by_value[value]
+                if remaining := tuple(
+                    value_job for value_job in jobs if value_job is not job
+                ):
+                    jobs_by_value[value] = remaining
+                else:
+                    del jobs_by_value[value]
+        except KeyError:
+            _LOGGER.exception("Unable to remove unknown keyed job listener %s", job)
+            return
+        if not jobs_by_value:
+            del keyed_listeners[data_key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1734,6 +2117,7 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
                 self._listeners.pop(event_type)
+            self._async_invalidate_dispatch(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -1770,14 +2154,16 @@ class State:
         "entity_id",
         "state",
         "attributes",
-        "last_changed",
-        "last_reported",
-        "last_updated",
         "context",
         "state_info",
         "domain",
         "object_id",
+        "last_changed_timestamp",
+        "last_reported_timestamp",
         "last_updated_timestamp",
+        "_last_changed",
+        "_last_reported",
+        "_last_updated",
         "_cache",
     )
 
@@ -1793,8 +2179,15 @@ class State:
         validate_entity_id: bool | None = True,
         state_info: StateInfo | None = None,
         last_updated_timestamp: float | None = None,
+        last_changed_timestamp: float | None = None,
+        last_reported_timestamp: float | None = None,
     ) -> None:
-        """Initialize a new state."""
+        """Initialize a new state.
+
+        If last_updated_timestamp is passed, last_changed and last_reported
+        default to last_updated, and datetimes that are not passed are only
+        created from the timestamps when they are accessed.
+        """
         self._cache: dict[str, Any] = {}
         state = str(state)
 
@@ -1815,26 +2208,35 @@ class State:
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
-        self.last_reported = last_reported or dt_util.utcnow()
-        self.last_updated = last_updated or self.last_reported
-        self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
-        # The recorder or the websocket_api will always call the timestamps,
-        # so we will set the timestamp values here to avoid the overhead of
-        # the function call in the property we know will always be called.
-        last_updated = self.last_updated
+        # The recorder or the websocket_api will always use the timestamps
+        # so they are always set, while the datetimes are mostly used by
+        # automations and templates and are created when first accessed.
         if not last_updated_timestamp:
+            last_reported = last_reported or dt_util.utcnow()
+            last_updated = last_updated or last_reported
             last_updated_timestamp = last_updated.timestamp()
+        self._last_updated = last_updated
         self.last_updated_timestamp = last_updated_timestamp
-        if self.last_changed == last_updated:
-            self._cache["last_changed_timestamp"] = last_updated_timestamp
-        # If last_reported is the same as last_updated async_set will pass
-        # the same datetime object for both values so we can use an identity
-        # check here.
-        if self.last_reported is last_updated:
-            self._cache["last_reported_timestamp"] = last_updated_timestamp
+        self._last_reported = last_reported
+        if last_reported_timestamp is None:
+            # If last_reported is the same as last_updated async_set will pass
+            # the same datetime object for both values so we can use an
+            # identity check here.
+            if last_reported is None or last_reported is last_updated:
+                last_reported_timestamp = last_updated_timestamp
+            else:
+                last_reported_timestamp = last_reported.timestamp()
+        self.last_reported_timestamp = last_reported_timestamp
+        self._last_changed = last_changed
+        if last_changed_timestamp is None:
+            if last_changed is None or last_changed == last_updated:
+                last_changed_timestamp = last_updated_timestamp
+            else:
+                last_changed_timestamp = last_changed.timestamp()
+        self.last_changed_timestamp = last_changed_timestamp
 
     @under_cached_property
     def name(self) -> str:
@@ -1843,15 +2245,65 @@ class State:
             "_", " "
         )
 
-    @under_cached_property
-    def last_changed_timestamp(self) -> float:
-        """Timestamp of last change."""
-        return self.last_changed.timestamp()
+    @property
+    def last_updated(self) -> datetime.datetime:
+        """Last time the state or attributes were changed."""
+        if (last_updated := self._last_updated) is None:
+            # It is much faster to convert a timestamp to a utc datetime object
+            # than converting a utc datetime object to a timestamp since cpython
+            # does not have a fast path for handling the UTC timezone and has to
+            # do multiple local timezone conversions.
+            #
+            # from_timestamp implementation:
+            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+            #
+            # timestamp implementation:
+            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+            # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+            last_updated = self._last_updated = dt_util.utc_from_timestamp(
+                self.last_updated_timestamp
+            )
+        return last_updated
 
-    @under_cached_property
-    def last_reported_timestamp(self) -> float:
-        """Timestamp of last report."""
-        return self.last_reported.timestamp()
+    @last_updated.setter
+    def last_updated(self, value: datetime.datetime) -> None:
+        """Set the last time the state or attributes were changed."""
+        self._last_updated = value
+        self.last_updated_timestamp = value.timestamp()
+
+    @property
+    def last_changed(self) -> datetime.datetime:
+        """Last time the state was changed."""
+        if (last_changed := self._last_changed) is None:
+            if self.last_changed_timestamp == self.last_updated_timestamp:
+                last_changed = self.last_updated
+            else:
+                last_changed = dt_util.utc_from_timestamp(self.last_changed_timestamp)
+            self._last_changed = last_changed
+        return last_changed
+
+    @last_changed.setter
+    def last_changed(self, value: datetime.datetime) -> None:
+        """Set the last time the state was changed."""
+        self._last_changed = value
+        self.last_changed_timestamp = value.timestamp()
+
+    @property
+    def last_reported(self) -> datetime.datetime:
+        """Last time the state was reported."""
+        if (last_reported := self._last_reported) is None:
+            if self.last_reported_timestamp == self.last_updated_timestamp:
+                last_reported = self.last_updated
+            else:
+                last_reported = dt_util.utc_from_timestamp(self.last_reported_timestamp)
+            self._last_reported = last_reported
+        return last_reported
+
+    @last_reported.setter
+    def last_reported(self, value: datetime.datetime) -> None:
+        """Set the last time the state was reported."""
+        self._last_reported = value
+        self.last_reported_timestamp = value.timestamp()
 
     @under_cached_property
     def _as_dict(self) -> dict[str, Any]:
@@ -1941,7 +2393,7 @@ class State:
             COMPRESSED_STATE_CONTEXT: context,
             COMPRESSED_STATE_LAST_CHANGED: self.last_changed_timestamp,
         }
-        if self.last_changed != self.last_updated:
+        if self.last_changed_timestamp != self.last_updated_timestamp:
             compressed_state[COMPRESSED_STATE_LAST_UPDATED] = (
                 self.last_updated_timestamp
             )
@@ -2063,10 +2515,23 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+_EMPTY_ATTRIBUTES: ReadOnlyDict[str, Any] = ReadOnlyDict()
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_interned_attributes",
+        "_version",
+        "_recent_changes",
+        "_dispatching",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2077,6 +2542,67 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Attribute values shared between states
+        self._interned_attributes: LRU[str, str] = LRU(MAX_INTERNED_ATTRIBUTES)
+        self._version = 0
+        # Version and entity_id of the most recent state changes
+        self._recent_changes: deque[tuple[int, str]] = deque(
+            maxlen=MAX_RECENT_STATE_CHANGES
+        )
+        # Versions of the state changes being dispatched. They are nested
+        # when a listener changes a state while a state change is dispatched.
+        self._dispatching: list[int] = []
+
+    @property
+    def version(self) -> int:
+        """Return a number that increases when any state is changed or removed.
+
+        States that are only reported without changes do not increase it.
+        """
+        return self._version
+
+    @property
+    def dispatched_version(self) -> int:
+        """Return the version up to which all state changes have been dispatched.
+
+        Callback listeners of state changes up to this version have been called.
+        It is lower than version while state changes are being dispatched.
+        """
+        if dispatching := self._dispatching:
+            return dispatching[0] - 1
+        return self._version
+
+    @property
+    def dispatching_version(self) -> int | None:
+        """Return the version of the state change being dispatched.
+
+        Returns None if no state change is being dispatched.
+        """
+        if dispatching := self._dispatching:
+            return dispatching[-1]
+        return None
+
+    @callback
+    def async_entity_ids_changed_since(self, version: int) -> set[str] | None:
+        """Return the entity ids that were changed or removed after a version.
+
+        Returns None if the version is not known, either because it is newer
+        than the current version or older than the remembered state changes.
+
+        This method must be run in the event loop.
+        """
+        if version > self._version:
+            return None
+        entity_ids: set[str] = set()
+        oldest_version = self._version + 1
+        for change_version, entity_id in reversed(self._recent_changes):
+            if change_version <= version:
+                return entity_ids
+            entity_ids.add(entity_id)
+            oldest_version = change_version
+        if oldest_version > version + 1:
+            return None
+        return entity_ids
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2194,11 +2720,7 @@ class StateMachine:
             "old_state": old_state,
             "new_state": None,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-        )
+        self._async_fire_state_changed(state_changed_data, context, None)
         return True
 
     def set(
@@ -2313,35 +2835,34 @@ class StateMachine:
             old_state = None
             same_state = False
             same_attr = False
-            last_changed = None
+            last_changed_timestamp = None
         else:
             same_state = old_state.state == new_state and not force_update
             same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
+            last_changed_timestamp = (
+                old_state.last_changed_timestamp if same_state else None
+            )
 
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
 
         if same_state and same_attr:
-            # mypy does not understand this is only possible if old_state is not None
-            old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            bus = self._bus
+            # The datetime of the old last_reported is only created
+            # when something reads the event
+            fire_reported = bus._debug or bus._async_has_listeners(  # noqa: SLF001
+                EVENT_STATE_REPORTED
+            )
+            if fire_reported:
+                # mypy does not understand this is only possible if old_state is not None
+                old_last_reported = old_state.last_reported  # type: ignore[union-attr]
+            # The datetime is created when last_reported is accessed
+            old_state._last_reported = None  # type: ignore[union-attr] # noqa: SLF001
+            old_state.last_reported_timestamp = timestamp  # type: ignore[union-attr]
+            if not fire_reported:
+                return
             # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
+            bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
                 {
                     "entity_id": entity_id,
@@ -2357,6 +2878,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._async_intern_attributes(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2364,13 +2887,14 @@ class StateMachine:
             entity_id,
             new_state,
             attributes,
-            last_changed,
-            now,
-            now,
+            None,
+            None,
+            None,
             context,
             old_state is None,
             state_info,
             timestamp,
+            last_changed_timestamp,
         )
         if old_state is not None:
             old_state.expire()
@@ -2380,13 +2904,143 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
+        self._async_fire_state_changed(state_changed_data, context, timestamp)
+
+    @callback
+    def _async_fire_state_changed(
+        self,
+        state_changed_data: EventStateChangedData,
+        context: Context | None,
+        time_fired: float | None,
+    ) -> None:
+        """Increase the version and fire a state changed event."""
+        self._version = version = self._version + 1
+        self._recent_changes.append((version, state_changed_data["entity_id"]))
+        self._dispatching.append(version)
+        try:
+            self._bus.async_fire_internal(
+                EVENT_STATE_CHANGED,
+                state_changed_data,
+                context=context,
+                time_fired=time_fired,
+            )
+        finally:
+            self._dispatching.pop()
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the states of multiple entities in one batch.
+
+        States is an iterable of (entity_id, new_state, attributes) tuples.
+
+        All states of the batch share the same context and timestamp. Events
+        are fired in the order of the batch right after each state is set.
+
+        This method must be run in the event loop.
+        """
+        self.async_set_many_internal(
+            [
+                (
+                    entity_id.lower(),
+                    str(new_state),
+                    attributes or {},
+                    force_update,
+                    None,
+                    None,
+                )
+                for entity_id, new_state, attributes in states
+            ],
+            context,
+            timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many_internal(
+        self,
+        states: Iterable[
+            tuple[
+                str,
+                str,
+                Mapping[str, Any] | None,
+                bool,
+                Context | None,
+                StateInfo | None,
+            ]
+        ],
+        context: Context | None,
+        timestamp: float,
+    ) -> None:
+        """Set the states of multiple entities in one batch.
+
+        States is an iterable of (entity_id, new_state, attributes,
+        force_update, context, state_info) tuples. States without a
+        context use the context of the batch.
+
+        The context is created once per batch instead of once per state.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        set_state = self.async_set_internal
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            state_context,
+            state_info,
+        ) in states:
+            set_state(
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                state_context or context,
+                state_info,
+                timestamp,
+            )
+
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any] | None
+    ) -> ReadOnlyDict[str, Any]:
+        """Return read only attributes that share static values with other states.
+
+        Integrations build new attribute dicts on every state write, so
+        without sharing thousands of states each keep their own copies of
+        the same friendly names, units and device classes.
+        """
+        if not attributes:
+            return _EMPTY_ATTRIBUTES
+        # State only creates and expects a ReadOnlyDict so
+        # there is no need to check for subclassing with
+        # isinstance here so we can use the faster type check.
+        if type(attributes) is ReadOnlyDict:
+            return attributes
+        shared: ReadOnlyDict[str, Any] = ReadOnlyDict(attributes)
+        interned = self._interned_attributes
+        for key in _INTERNED_ATTRIBUTES:
+            if type(value := shared.get(key)) is not str:
+                continue
+            if (interned_value := interned.get(value)) is not None:
+                # The attributes are not shared yet so they can still be changed
+                dict.__setitem__(shared, key, interned_value)
+            elif len(value) <= MAX_INTERNED_ATTRIBUTE_LENGTH:
+                interned[value] = value
+        return shared
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
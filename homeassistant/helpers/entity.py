@@ -5,7 +5,8 @@ from __future__ import annotations
 from abc import ABCMeta
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine, Iterable, Mapping
+from collections.abc import Callable, Coroutine, Generator, Iterable, Mapping
+from contextlib import contextmanager
 import dataclasses
 from enum import Enum, IntFlag, auto
 import functools as ft
@@ -47,6 +48,7 @@ from homeassistant.core import (
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
+    validate_state,
 )
 from homeassistant.core_config import DATA_CUSTOMIZE
 from homeassistant.exceptions import (
@@ -57,6 +59,7 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.hass_dict import HassKey
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -85,6 +88,9 @@ CAPABILITIES_UPDATE_LIMIT = 100
 
 CONTEXT_RECENT_TIME_SECONDS = 5  # Time that a context is considered recent
 
+# Entities with a pending state write while a batch of state writes is collected
+DATA_STATE_WRITE_BATCH: HassKey[dict[str, Entity]] = HassKey("entity_state_write_batch")
+
 
 @callback
 def async_setup(hass: HomeAssistant) -> None:
@@ -100,6 +106,56 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the states of multiple entities to the state machine in one batch.
+
+    The states share the timestamp and, unless the entity has a context of its
+    own, the context of the batch.
+    """
+    hass.states.async_set_many_internal(
+        [
+            state_write
+            for entity in entities
+            if (state_write := entity._async_batch_state_write()) is not None  # noqa: SLF001
+        ],
+        None,
+        timer(),
+    )
+
+
+@contextmanager
+def async_batch_write_ha_state(hass: HomeAssistant) -> Generator[None]:
+    """Collect the state writes of entities and write them in one batch on exit.
+
+    An entity that writes its state more than once while the batch is collected
+    is only written once with its latest state. Batches may be nested, the
+    states are written when the outermost batch exits. The states collected
+    before an exception are still written, an error writing them is logged
+    so the exception propagates.
+
+    This must not be held across an await.
+    """
+    if DATA_STATE_WRITE_BATCH in hass.data:
+        yield
+        return
+    batch: dict[str, Entity] = {}
+    hass.data[DATA_STATE_WRITE_BATCH] = batch
+    failed = True
+    try:
+        yield
+        failed = False
+    finally:
+        del hass.data[DATA_STATE_WRITE_BATCH]
+        if batch and failed:
+            try:
+                async_write_ha_states(hass, batch.values())
+            except Exception:
+                _LOGGER.exception("Error writing the states of a failed batch")
+        elif batch:
+            async_write_ha_states(hass, batch.values())
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -1130,6 +1186,76 @@ class Entity(
         hass = self.hass
         entity_id = self.entity_id
 
+        if (batch := hass.data.get(DATA_STATE_WRITE_BATCH)) is not None:
+            # The state is calculated and written when the batch is written
+            batch[entity_id] = self
+            return
+
+        if (calculated := self._async_calculate_state_write()) is None:
+            return
+        state, attr, time_now = calculated
+
+        try:
+            hass.states.async_set_internal(
+                entity_id,
+                state,
+                attr,
+                self.force_update,
+                self._context,
+                self._state_info,
+                time_now,
+            )
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+            )
+            hass.states.async_set(
+                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
+            )
+
+    @callback
+    def _async_batch_state_write(
+        self,
+    ) -> tuple[str, str, dict[str, Any], bool, Context | None, StateInfo | None] | None:
+        """Return the state write of the entity for a batch of state writes.
+
+        Returns None if the state should not be written.
+        """
+        if self._platform_state is EntityPlatformState.REMOVED:
+            return None
+        if not self.hass or not self._verified_state_writable:
+            self._async_verify_state_writable()
+        if (calculated := self._async_calculate_state_write()) is None:
+            return None
+        state, attr, _ = calculated
+        try:
+            validate_state(state)
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s",
+                self.entity_id,
+                STATE_UNKNOWN,
+            )
+            state, attr = STATE_UNKNOWN, {}
+        return (
+            self.entity_id,
+            state,
+            attr,
+            self.force_update,
+            self._context,
+            self._state_info,
+        )
+
+    @callback
+    def _async_calculate_state_write(self) -> tuple[str, dict[str, Any], float] | None:
+        """Calculate the state and attributes to write to the state machine.
+
+        Returns a tuple of the state, the attributes and the time the state
+        was calculated at or None if the state should not be written.
+        """
+        hass = self.hass
+        entity_id = self.entity_id
+
         if (entry := self.registry_entry) and entry.disabled_by:
             if not self._disabled_reported:
                 self._disabled_reported = True
@@ -1141,7 +1267,7 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
@@ -1223,23 +1349,7 @@ class Entity(
             self._context = None
             self._context_set = None
 
-        try:
-            hass.states.async_set_internal(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-                time_now,
-            )
-        except InvalidStateError:
-            _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
-            )
-            hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
-            )
+        return state, attr, time_now
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
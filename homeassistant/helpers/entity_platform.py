@@ -44,6 +44,7 @@ from . import (
     service,
     translation,
 )
+from .entity import async_write_ha_states
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
@@ -983,6 +984,17 @@ class EntityPlatform:
         ):
             self.async_unsub_polling()
 
+    @callback
+    def async_write_ha_states(self, entities: Iterable[Entity] | None = None) -> None:
+        """Write the states of entities of this platform in one batch.
+
+        Writes the states of all entities of the platform if no entities
+        are passed.
+        """
+        async_write_ha_states(
+            self.hass, self.entities.values() if entities is None else entities
+        )
+
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
     ) -> list[Entity]:
@@ -57,7 +57,7 @@ from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
+_TRACK_STATE_CHANGE_DATA: HassKey[_StateChangeSubscriptions] = HassKey(
     "track_state_change_data"
 )
 _TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
@@ -331,16 +331,6 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action, job_type)
 
 
-@callback
-def _async_dispatch_entity_id_event_soon[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
-
-
 @callback
 def _async_dispatch_entity_id_event[_StateEventDataT: EventStateEventData](
     hass: HomeAssistant,
@@ -371,12 +361,125 @@ def _async_state_filter[_StateEventDataT: EventStateEventData](
     return event_data["entity_id"] in callbacks
 
 
-_KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
-    event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
-)
+type _StateChangeJob = HassJob[[Event[EventStateChangedData]], Any]
+
+
+class _StateChangeSubscriptions:
+    """Index of state change subscriptions by entity_id.
+
+    The jobs of an entity_id are kept in an insertion ordered dict so
+    subscribing and unsubscribing are O(1) per entity_id. Dispatch uses a
+    tuple of the jobs that is cached until the subscriptions of the entity_id
+    change, so a state change does not copy the jobs.
+
+    State changes are dispatched in the next event loop iteration. All state
+    changes fired in one iteration are dispatched by a single call_soon.
+    """
+
+    __slots__ = ("_dispatch", "_hass", "_jobs", "_listener", "_pending")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self._hass = hass
+        self._jobs: dict[str, dict[_StateChangeJob, None]] = {}
+        self._dispatch: dict[str, tuple[_StateChangeJob, ...]] = {}
+        self._pending: list[Event[EventStateChangedData]] = []
+        self._listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(self, job: _StateChangeJob, entity_ids: Iterable[str]) -> None:
+        """Subscribe a job to state changes of entity_ids."""
+        jobs = self._jobs
+        dispatch = self._dispatch
+        for entity_id in entity_ids:
+            if (entity_jobs := jobs.get(entity_id)) is None:
+                jobs[entity_id] = {job: None}
+            else:
+                entity_jobs[job] = None
+                dispatch.pop(entity_id, None)
+        if self._listener is None and jobs:
+            self._listener = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_state_changed,
+                event_filter=self._async_filter_state_changed,
+            )
+
+    @callback
+    def async_unsubscribe(
+        self, job: _StateChangeJob, entity_ids: Iterable[str]
+    ) -> None:
+        """Unsubscribe a job from state changes of entity_ids."""
+        jobs = self._jobs
+        dispatch = self._dispatch
+        for entity_id in entity_ids:
+            if (entity_jobs := jobs.get(entity_id)) is None:
+                continue
+            entity_jobs.pop(job, None)
+            if not entity_jobs:
+                del jobs[entity_id]
+            dispatch.pop(entity_id, None)
+        if self._listener is not None and not jobs:
+            self._listener()
+            self._listener = None
+
+    @callback
+    def async_update(
+        self,
+        job: _StateChangeJob,
+        old_entity_ids: set[str],
+        new_entity_ids: set[str],
+    ) -> None:
+        """Move a job from one set of entity_ids to another.
+
+        Only the difference between the sets is subscribed and unsubscribed.
+        """
+        self.async_subscribe(job, new_entity_ids - old_entity_ids)
+        self.async_unsubscribe(job, old_entity_ids - new_entity_ids)
+
+    @callback
+    def _async_filter_state_changed(self, event_data: EventStateChangedData) -> bool:
+        """Filter state changes by entity_id."""
+        return event_data["entity_id"] in self._jobs
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Queue a state change to ensure one event loop runs before dispatch."""
+        if not self._pending:
+            self._hass.loop.call_soon(self._async_dispatch_pending)
+        self._pending.append(event)
+
+    @callback
+    def _async_dispatch_pending(self) -> None:
+        """Dispatch the queued state changes to the subscribed jobs."""
+        # State changes fired by the jobs are dispatched in the next iteration
+        pending = self._pending
+        self._pending = []
+        hass = self._hass
+        dispatch = self._dispatch
+        for event in pending:
+            entity_id = event.data["entity_id"]
+            if (jobs := dispatch.get(entity_id)) is None:
+                if (entity_jobs := self._jobs.get(entity_id)) is None:
+                    continue
+                jobs = dispatch[entity_id] = tuple(entity_jobs)
+            for job in jobs:
+                try:
+                    hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception(
+                        "Error while dispatching event for %s to %s", entity_id, job
+                    )
+
+
+@callback
+def _async_get_state_change_subscriptions(
+    hass: HomeAssistant,
+) -> _StateChangeSubscriptions:
+    """Return the state change subscriptions."""
+    if (subscriptions := hass.data.get(_TRACK_STATE_CHANGE_DATA)) is None:
+        subscriptions = _StateChangeSubscriptions(hass)
+        hass.data[_TRACK_STATE_CHANGE_DATA] = subscriptions
+    return subscriptions
 
 
 @bind_hass
@@ -390,9 +493,16 @@ def _async_track_state_change_event(
 
     The passed in entity_ids will not be automatically lower cased.
     """
-    return _async_track_event(
-        _KEYED_TRACK_STATE_CHANGE, hass, entity_ids, action, job_type
+    if not entity_ids:
+        return _remove_empty_listener
+    job = HassJob(
+        action, f"track {EVENT_STATE_CHANGED} event {entity_ids}", job_type=job_type
     )
+    if isinstance(entity_ids, str):
+        entity_ids = (entity_ids,)
+    subscriptions = _async_get_state_change_subscriptions(hass)
+    subscriptions.async_subscribe(job, entity_ids)
+    return partial(subscriptions.async_unsubscribe, job, entity_ids)
 
 
 _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
@@ -734,6 +844,9 @@ class _TrackStateChangeFiltered:
         )
         self._listeners: dict[str, Callable[[], None]] = {}
         self._last_track_states: TrackStates = track_states
+        self._subscriptions = _async_get_state_change_subscriptions(hass)
+        # Entity ids the action is subscribed to
+        self._entities: set[str] = set()
 
     @callback
     def async_setup(self) -> None:
@@ -752,7 +865,7 @@ class _TrackStateChangeFiltered:
             return
 
         self._setup_domains_listener(track_states.domains)
-        self._setup_entities_listener(track_states.domains, track_states.entities)
+        self._update_entities_listener(track_states.domains, track_states.entities)
 
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
@@ -776,7 +889,7 @@ class _TrackStateChangeFiltered:
             if had_all_listener:
                 return
             self._cancel_listener(_DOMAINS_LISTENER)
-            self._cancel_listener(_ENTITIES_LISTENER)
+            self._update_entities_listener(set(), set())
             self._setup_all_listener()
             return
 
@@ -795,8 +908,7 @@ class _TrackStateChangeFiltered:
             or domains_changed
             or new_track_states.entities != last_track_states.entities
         ):
-            self._cancel_listener(_ENTITIES_LISTENER)
-            self._setup_entities_listener(
+            self._update_entities_listener(
                 new_track_states.domains, new_track_states.entities
             )
 
@@ -805,6 +917,7 @@ class _TrackStateChangeFiltered:
         """Cancel the listeners."""
         for key in list(self._listeners):
             self._listeners.pop(key)()
+        self._update_entities_listener(set(), set())
 
     @callback
     def _cancel_listener(self, listener_name: str) -> None:
@@ -814,23 +927,23 @@ class _TrackStateChangeFiltered:
         self._listeners.pop(listener_name)()
 
     @callback
-    def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
+    def _update_entities_listener(self, domains: set[str], entities: set[str]) -> None:
+        """Subscribe to the entities that were added and unsubscribe the rest."""
+        entities = entities.copy()
         if domains:
-            entities = entities.copy()
             entities.update(self.hass.states.async_entity_ids(domains))
 
-        # Entities has changed to none
-        if not entities:
+        if entities == self._entities:
             return
 
-        self._listeners[_ENTITIES_LISTENER] = _async_track_state_change_event(
-            self.hass, entities, self._action, self._action_as_hassjob.job_type
+        self._subscriptions.async_update(
+            self._action_as_hassjob, self._entities, entities
         )
+        self._entities = entities
 
     @callback
     def _state_added(self, event: Event[EventStateChangedData]) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
+        self._update_entities_listener(
             self._last_track_states.domains, self._last_track_states.entities
         )
         self.hass.async_run_hass_job(self._action_as_hassjob, event)
@@ -1170,7 +1283,7 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
+        self._info[template] = info = template.async_render_to_info_shared(
             track_template_.variables
         )
 
@@ -0,0 +1,224 @@
+"""Monitor the latency and queue depths of the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_LOOP_MONITOR: HassKey[LoopMonitor] = HassKey("loop_monitor")
+
+# Seconds between samples
+SAMPLE_INTERVAL = 1.0
+# A sample that runs this many seconds late means a callback
+# held the event loop for at least that long
+LONG_CALLBACK_THRESHOLD = 0.1
+# Number of samples kept for the recent maximums
+RECENT_SAMPLES = 60
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUEUE_DEPTH_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+LOOP_LAG = "loop_lag"
+READY_QUEUE = "ready_queue"
+EXECUTOR_QUEUE = "executor_queue"
+IMPORT_EXECUTOR_QUEUE = "import_executor_queue"
+
+METRICS = (LOOP_LAG, READY_QUEUE, EXECUTOR_QUEUE, IMPORT_EXECUTOR_QUEUE)
+
+
+class Histogram:
+    """Count samples in buckets with fixed upper bounds."""
+
+    __slots__ = ("bounds", "buckets", "count", "max", "total")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize the histogram."""
+        self.bounds = bounds
+        # The last bucket counts samples above the largest bound
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.max: float = 0
+        self.total: float = 0
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(value, self.max)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        return {
+            "bounds": self.bounds,
+            "buckets": list(self.buckets),
+            "count": self.count,
+            "max": self.max,
+            "total": self.total,
+        }
+
+
+def _executor_queue_depth(executor: ThreadPoolExecutor | None) -> int:
+    """Return the number of jobs waiting for a thread of an executor."""
+    if executor is None:
+        return 0
+    return executor._work_queue.qsize()  # noqa: SLF001
+
+
+class LoopMonitor:
+    """Sample the event loop lag and queue depths at a fixed interval.
+
+    The lag is how late the sample timer runs. It is the time the event loop
+    was busy with other callbacks, so a sample later than
+    LONG_CALLBACK_THRESHOLD is counted as a long running callback.
+
+    Sampling only runs while the monitor is held by a user or a listener.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor."""
+        self.hass = hass
+        self.histograms = {
+            LOOP_LAG: Histogram(LATENCY_BUCKETS),
+            READY_QUEUE: Histogram(QUEUE_DEPTH_BUCKETS),
+            EXECUTOR_QUEUE: Histogram(QUEUE_DEPTH_BUCKETS),
+            IMPORT_EXECUTOR_QUEUE: Histogram(QUEUE_DEPTH_BUCKETS),
+        }
+        self.recent: dict[str, deque[float]] = {
+            metric: deque(maxlen=RECENT_SAMPLES) for metric in METRICS
+        }
+        self.long_callbacks = 0
+        self._listeners: dict[CALLBACK_TYPE, None] = {}
+        self._holds = 0
+        self._expected: float = 0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling."""
+        if self._timer is not None:
+            return
+        self._expected = self.hass.loop.time() + SAMPLE_INTERVAL
+        self._timer = self.hass.loop.call_at(self._expected, self._async_sample)
+
+    @callback
+    def async_stop(self, _event: Event | None = None) -> None:
+        """Stop sampling."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    @callback
+    def async_hold(self) -> CALLBACK_TYPE:
+        """Keep sampling until the returned callback is called."""
+        released = False
+
+        @callback
+        def release() -> None:
+            """Stop sampling if nothing else holds the monitor."""
+            nonlocal released
+            if released:
+                return
+            released = True
+            self._holds -= 1
+            if not self._holds:
+                self.async_stop()
+
+        self._holds += 1
+        self.async_start()
+        return release
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for new samples and keep sampling while listening."""
+        release = self.async_hold()
+
+        @callback
+        def remove_listener() -> None:
+            """Remove update listener."""
+            self._listeners.pop(update_callback)
+            release()
+
+        self._listeners[update_callback] = None
+        return remove_listener
+
+    @callback
+    def _async_sample(self) -> None:
+        """Take a sample and schedule the next one."""
+        loop = self.hass.loop
+        now = loop.time()
+        lag = max(now - self._expected, 0)
+        if lag > LONG_CALLBACK_THRESHOLD:
+            self.long_callbacks += 1
+        self._async_add(LOOP_LAG, lag)
+        self._async_add(READY_QUEUE, len(getattr(loop, "_ready")))
+        self._async_add(
+            EXECUTOR_QUEUE,
+            _executor_queue_depth(getattr(loop, "_default_executor", None)),
+        )
+        self._async_add(
+            IMPORT_EXECUTOR_QUEUE, _executor_queue_depth(self.hass.import_executor)
+        )
+        if self._timer is not None:
+            # Only schedule the next sample while sampling is running
+            self._timer.cancel()
+            self._expected = now + SAMPLE_INTERVAL
+            self._timer = loop.call_at(self._expected, self._async_sample)
+        for update_callback in list(self._listeners):
+            try:
+                update_callback()
+            except Exception:
+                _LOGGER.exception("Error in loop monitor listener")
+
+    @callback
+    def _async_add(self, metric: str, value: float) -> None:
+        """Add a sample of a metric."""
+        self.histograms[metric].add(value)
+        self.recent[metric].append(value)
+
+    @callback
+    def async_recent_max(self, metric: str) -> float | None:
+        """Return the largest recent sample of a metric."""
+        if not (recent := self.recent[metric]):
+            return None
+        return max(recent)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histograms and latest samples as a dict."""
+        return {
+            "sample_interval": SAMPLE_INTERVAL,
+            "long_callback_threshold": LONG_CALLBACK_THRESHOLD,
+            "long_callbacks": self.long_callbacks,
+            "latest": {
+                metric: recent[-1] if (recent := self.recent[metric]) else None
+                for metric in METRICS
+            },
+            "histograms": {
+                metric: histogram.as_dict()
+                for metric, histogram in self.histograms.items()
+            },
+        }
+
+
+@callback
+@singleton(DATA_LOOP_MONITOR)
+def async_get_loop_monitor(hass: HomeAssistant) -> LoopMonitor:
+    """Return the loop monitor.
+
+    Sampling starts once the monitor is held or a listener is added.
+    """
+    monitor = LoopMonitor(hass)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, monitor.async_stop)
+    return monitor
@@ -77,8 +77,9 @@ _LOGGER = logging.getLogger(__name__)
 SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]] = (
     HassKey("service_description_cache")
 )
+# The services the descriptions were built for, None if they are outdated
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
-    tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
+    tuple[set[tuple[str, str]] | None, dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
 
 
@@ -713,7 +714,7 @@ async def async_get_all_descriptions(
         for service_name in services_by_domain
     }
     # If we have a complete cache, check if it is still valid
-    all_cache: tuple[set[tuple[str, str]], dict[str, dict[str, Any]]] | None
+    previous_descriptions_cache: dict[str, dict[str, Any]] = {}
     if all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE):
         previous_all_services, previous_descriptions_cache = all_cache
         # If the services are the same, we can return the cache
@@ -755,8 +756,7 @@ async def async_get_all_descriptions(
     # Build response
     descriptions: dict[str, dict[str, Any]] = {}
     for domain, services_map in services.items():
-        descriptions[domain] = {}
-        domain_descriptions = descriptions[domain]
+        domain_descriptions: dict[str, Any] = {}
 
         for service_name, service in services_map.items():
             cache_key = (domain, service_name)
@@ -823,6 +823,12 @@ async def async_get_all_descriptions(
 
             domain_descriptions[service_name] = description
 
+        # Keep the previous descriptions of a domain that did not change,
+        # so anything cached for them, like their JSON, stays valid
+        if previous_descriptions_cache.get(domain) == domain_descriptions:
+            domain_descriptions = previous_descriptions_cache[domain]
+        descriptions[domain] = domain_descriptions
+
     hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = (all_services, descriptions)
     return descriptions
 
@@ -864,7 +870,9 @@ def async_set_service_schema(
             "optional": response == SupportsResponse.OPTIONAL,
         }
 
-    hass.data.pop(ALL_SERVICE_DESCRIPTIONS_CACHE, None)
+    if all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE):
+        # Keep the descriptions to reuse those of the other domains
+        hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = (None, all_cache[1])
     descriptions_cache[(domain, service)] = description
 
 
@@ -0,0 +1,162 @@
+"""Aggregates over the states of a domain kept up to date from state changes."""
+
+from __future__ import annotations
+
+from collections import Counter
+from fractions import Fraction
+import math
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+DATA_STATE_AGGREGATES: HassKey[StateAggregates] = HassKey("state_aggregates")
+
+
+def _numeric_value(state: str) -> float | None:
+    """Return the state as a finite number or None."""
+    try:
+        value = float(state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+class DomainStateAggregate:
+    """Counts and numeric totals of the states of one domain.
+
+    Updating for a state change is O(1). The minimum and maximum are only
+    recalculated when the entity that held them changes.
+    """
+
+    __slots__ = ("_max", "_min", "_total", "entity_count", "numeric", "state_counts")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self.entity_count = 0
+        self.state_counts: Counter[str] = Counter()
+        self.numeric: dict[str, float] = {}
+        # Fractions keep the sum exact while values are added and removed
+        self._total = Fraction(0)
+        self._min: float | None = None
+        self._max: float | None = None
+
+    def add(self, entity_id: str, state: str) -> None:
+        """Add the state of an entity."""
+        self.entity_count += 1
+        self.state_counts[state] += 1
+        if (value := _numeric_value(state)) is None:
+            return
+        self.numeric[entity_id] = value
+        self._total += Fraction(value)
+        if self._min is not None and value < self._min:
+            self._min = value
+        if self._max is not None and value > self._max:
+            self._max = value
+
+    def remove(self, entity_id: str, state: str) -> None:
+        """Remove the state of an entity."""
+        self.entity_count -= 1
+        if self.state_counts[state] <= 1:
+            del self.state_counts[state]
+        else:
+            self.state_counts[state] -= 1
+        if (value := self.numeric.pop(entity_id, None)) is None:
+            return
+        self._total -= Fraction(value)
+        if value == self._min:
+            self._min = None
+        if value == self._max:
+            self._max = None
+
+    def count(self, state: str | None = None) -> int:
+        """Return the number of entities, optionally only those in a state."""
+        if state is None:
+            return self.entity_count
+        return self.state_counts.get(state, 0)
+
+    def total(self) -> float:
+        """Return the sum of the numeric states."""
+        return float(self._total)
+
+    def minimum(self) -> float | None:
+        """Return the smallest numeric state."""
+        if not self.numeric:
+            return None
+        if self._min is None:
+            self._min = min(self.numeric.values())
+        return self._min
+
+    def maximum(self) -> float | None:
+        """Return the largest numeric state."""
+        if not self.numeric:
+            return None
+        if self._max is None:
+            self._max = max(self.numeric.values())
+        return self._max
+
+
+class StateAggregates:
+    """Aggregates of the domains that have been asked for."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the aggregates and listen for state changes."""
+        self.hass = hass
+        self._domains: dict[str, DomainStateAggregate] = {}
+        # State machine version each aggregate was calculated at
+        self._seed_versions: dict[str, int] = {}
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_filter_state_changed,
+        )
+
+    @callback
+    def async_get(self, domain: str) -> DomainStateAggregate:
+        """Return the aggregate of a domain, calculating it on first use."""
+        if (aggregate := self._domains.get(domain)) is None:
+            aggregate = self._domains[domain] = DomainStateAggregate()
+            self._seed_versions[domain] = self.hass.states.version
+            for state in self.hass.states.async_all(domain):
+                aggregate.add(state.entity_id, state.state)
+        return aggregate
+
+    @callback
+    def _async_filter_state_changed(self, event_data: EventStateChangedData) -> bool:
+        """Filter state changes of domains without aggregates."""
+        return split_entity_id(event_data["entity_id"])[0] in self._domains
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the aggregate of a domain."""
+        entity_id = event.data["entity_id"]
+        domain = split_entity_id(entity_id)[0]
+        if (
+            version := self.hass.states.dispatching_version
+        ) is not None and version <= self._seed_versions[domain]:
+            # The aggregate was calculated while this change was dispatched
+            return
+        aggregate = self._domains[domain]
+        if (old_state := event.data["old_state"]) is not None:
+            aggregate.remove(entity_id, old_state.state)
+        if (new_state := event.data["new_state"]) is not None:
+            aggregate.add(entity_id, new_state.state)
+
+
+@callback
+@singleton(DATA_STATE_AGGREGATES)
+def async_get_state_aggregates(hass: HomeAssistant) -> StateAggregates:
+    """Return the state aggregates.
+
+    They should be created before anything that renders templates on
+    state changes listens for them, so the aggregates are updated first.
+    """
+    return StateAggregates(hass)
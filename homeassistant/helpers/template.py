@@ -12,8 +12,11 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -54,13 +57,16 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -94,6 +100,8 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .state_aggregate import DomainStateAggregate, async_get_state_aggregates
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -114,6 +122,11 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+_SHARED_RENDER_INFO: HassKey[dict[tuple[Any, ...], RenderInfo]] = HassKey(
+    "template.shared_render_info"
+)
+_SHAREABLE_VARIABLE_TYPES = {str, int, float, bool, type(None)}
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -165,6 +178,12 @@ CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
+BYTECODE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_STORAGE_VERSION = 1
+# The compiled code depends on the Python, Jinja and Home Assistant versions
+BYTECODE_CACHE_VERSION = f"{MAGIC_NUMBER.hex()}-{jinja2.__version__}-{__version__}"
+# Names every module compiled from a Jinja template defines
+_TEMPLATE_CODE_NAMES = frozenset({"root", "blocks", "debug_info"})
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
@@ -195,7 +214,7 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
 
 
 def async_setup(hass: HomeAssistant) -> bool:
-    """Set up tracking the template LRUs."""
+    """Set up tracking the template LRUs and state aggregates."""
 
     @callback
     def _async_adjust_lru_sizes(_: Any) -> None:
@@ -218,6 +237,9 @@ def async_setup(hass: HomeAssistant) -> bool:
     )
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, _async_adjust_lru_sizes)
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, callback(lambda _: cancel()))
+    # Listen for state changes before any template tracker so the
+    # aggregates are up to date when templates re-render
+    async_get_state_aggregates(hass)
     return True
 
 
@@ -768,6 +790,44 @@ class Template:
         render_info._freeze()  # noqa: SLF001
         return render_info
 
+    @callback
+    def async_render_to_info_shared(
+        self, variables: TemplateVarsType = None
+    ) -> RenderInfo:
+        """Render the template and collect an entity filter, sharing the result.
+
+        Identical templates rendered with the same variables while the
+        state machine does not change share one render within the same
+        event loop iteration. The returned RenderInfo must not be mutated.
+        """
+        assert self.hass is not None
+        if variables and not all(
+            type(value) in _SHAREABLE_VARIABLE_TYPES for value in variables.values()
+        ):
+            # Only scalar variables are shared, they are keyed by type
+            # since 1, 1.0 and True are equal but render differently
+            return self.async_render_to_info(variables)
+        key = (
+            self.template,
+            self._limited,
+            self._strict,
+            frozenset((name, type(value), value) for name, value in variables.items())
+            if variables
+            else None,
+            self.hass.states.version,
+        )
+
+        hass = self.hass
+        if (shared := hass.data.get(_SHARED_RENDER_INFO)) is None:
+            shared = hass.data[_SHARED_RENDER_INFO] = {}
+        elif (render_info := shared.get(key)) is not None:
+            return render_info
+
+        if not shared:
+            hass.loop.call_soon(shared.clear)
+        render_info = shared[key] = self.async_render_to_info(variables)
+        return render_info
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -858,11 +918,14 @@ class Template:
         self._log_fn = log_fn
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        # Identical templates share one compiled template per environment
+        if (compiled := env.compiled_templates.get(self.template)) is None:
+            compiled = env.compiled_templates[self.template] = (
+                jinja2.Template.from_code(env, self._compiled_code, env.globals, None)
+            )
+        self._compiled = compiled
 
-        return self._compiled
+        return compiled
 
     def __eq__(self, other):
         """Compare template with another."""
@@ -1108,6 +1171,24 @@ class TemplateStateBase(State):
         self._collect_state()
         return self._state.last_updated
 
+    @property
+    def last_changed_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_changed_timestamp."""
+        self._collect_state()
+        return self._state.last_changed_timestamp
+
+    @property
+    def last_reported_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_reported_timestamp."""
+        self._collect_state()
+        return self._state.last_reported_timestamp
+
+    @property
+    def last_updated_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_updated_timestamp."""
+        self._collect_state()
+        return self._state.last_updated_timestamp
+
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
@@ -1299,6 +1380,35 @@ def result_as_boolean(template_result: Any | None) -> bool:
     return forgiving_boolean(template_result, default=False)
 
 
+def _domain_state_aggregate(hass: HomeAssistant, domain: str) -> DomainStateAggregate:
+    """Return the aggregate of a domain and re-render when the domain changes."""
+    if not valid_domain(domain):
+        raise TemplateError(f"Invalid domain: {domain}")
+    if (entity_collect := _render_info.get()) is not None:
+        entity_collect.domains.add(domain)  # type: ignore[attr-defined]
+    return async_get_state_aggregates(hass).async_get(domain)
+
+
+def states_count(hass: HomeAssistant, domain: str, state: str | None = None) -> int:
+    """Return the number of entities in a domain, optionally only in a state."""
+    return _domain_state_aggregate(hass, domain).count(state)
+
+
+def states_sum(hass: HomeAssistant, domain: str) -> float:
+    """Return the sum of the numeric states of a domain."""
+    return _domain_state_aggregate(hass, domain).total()
+
+
+def states_min(hass: HomeAssistant, domain: str) -> float | None:
+    """Return the smallest numeric state of a domain."""
+    return _domain_state_aggregate(hass, domain).minimum()
+
+
+def states_max(hass: HomeAssistant, domain: str) -> float | None:
+    """Return the largest numeric state of a domain."""
+    return _domain_state_aggregate(hass, domain).maximum()
+
+
 def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
     """Expand out any groups and zones into entity states."""
     # circular import.
@@ -2803,6 +2913,95 @@ async def async_load_custom_templates(hass: HomeAssistant) -> None:
     _get_hass_loader(hass).sources = custom_templates
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the compiled code of templates from the previous start."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
+class TemplateBytecodeCache:
+    """Compiled code of templates kept across restarts.
+
+    The code is keyed by the hash of the environment kind and the template
+    source, and is discarded when the Python, Jinja or Home Assistant
+    version changes. Only the code of templates compiled until Home
+    Assistant has started is saved, as those are the templates that slow
+    down startup.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._store = Store[dict[str, Any]](
+            hass, BYTECODE_STORAGE_VERSION, BYTECODE_STORAGE_KEY, private=True
+        )
+        self._code: dict[str, CodeType] = {}
+        self._used: set[str] = set()
+        self._collecting = True
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the compiled code of a template."""
+        if (code := self._code.get(key)) is not None and self._collecting:
+            self._used.add(key)
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the compiled code of a template."""
+        if self._collecting:
+            self._code[key] = code
+            self._used.add(key)
+
+    async def async_load(self) -> None:
+        """Load the cache and save it once Home Assistant has started."""
+        if (data := await self._store.async_load()) is not None and data.get(
+            "version"
+        ) == BYTECODE_CACHE_VERSION:
+            self._code = await self.hass.async_add_executor_job(
+                _unmarshal_bytecode, data["code"]
+            )
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, self._async_save)
+
+    async def _async_save(self, _event: Event) -> None:
+        """Save the code of the templates used during startup."""
+        self._collecting = False
+        code = self._code = {key: self._code[key] for key in self._used}
+        self._used = set()
+        await self._store.async_save(
+            {
+                "version": BYTECODE_CACHE_VERSION,
+                "code": await self.hass.async_add_executor_job(_marshal_bytecode, code),
+            }
+        )
+
+
+def _marshal_bytecode(code: dict[str, CodeType]) -> dict[str, str]:
+    """Serialize compiled code."""
+    return {
+        key: base64.b64encode(marshal.dumps(value)).decode()
+        for key, value in code.items()
+    }
+
+
+def _unmarshal_bytecode(data: dict[str, str]) -> dict[str, CodeType]:
+    """Deserialize compiled code, skipping code that is not a compiled template."""
+    code: dict[str, CodeType] = {}
+    for key, value in data.items():
+        try:
+            loaded = marshal.loads(base64.b64decode(value))
+        except (ValueError, EOFError, TypeError):
+            loaded = None
+        if (
+            not isinstance(loaded, CodeType)
+            or loaded.co_filename != "<template>"
+            or not _TEMPLATE_CODE_NAMES.issubset(loaded.co_names)
+        ):
+            _LOGGER.debug("Ignoring invalid template bytecode for %s", key)
+            continue
+        code[key] = loaded
+    return code
+
+
 def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     result = {}
     jinja_path = hass.config.path("custom_templates")
@@ -2864,9 +3063,16 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # Compiled code is only shared between environments of the same kind
+        self._bytecode_scope = (
+            f"{type(self).__module__}.{type(self).__qualname__}:{limited}:{strict}"
+        )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        self.compiled_templates: weakref.WeakValueDictionary[str, jinja2.Template] = (
+            weakref.WeakValueDictionary()
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3095,6 +3301,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 "today_at",
                 "label_id",
                 "label_name",
+                "states_count",
+                "states_sum",
+                "states_min",
+                "states_max",
             ]
             hass_filters = [
                 "closest",
@@ -3139,6 +3349,14 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.filters["state_attr"] = self.globals["state_attr"]
         self.globals["states"] = AllStates(hass)
         self.filters["states"] = self.globals["states"]
+        self.globals["states_count"] = hassfunction(states_count)
+        self.filters["states_count"] = self.globals["states_count"]
+        self.globals["states_sum"] = hassfunction(states_sum)
+        self.filters["states_sum"] = self.globals["states_sum"]
+        self.globals["states_min"] = hassfunction(states_min)
+        self.filters["states_min"] = self.globals["states_min"]
+        self.globals["states_max"] = hassfunction(states_max)
+        self.filters["states_max"] = self.globals["states_max"]
         self.globals["state_translated"] = StateTranslated(hass)
         self.filters["state_translated"] = self.globals["state_translated"]
         self.globals["has_value"] = hassfunction(has_value)
@@ -3219,7 +3437,19 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is not None
+            and isinstance(source, str)
+            and (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is not None
+        ):
+            key = hashlib.sha256(
+                f"{self._bytecode_scope}\0{source}".encode()
+            ).hexdigest()
+            if (compiled := bytecode_cache.get(key)) is None:
+                compiled = super().compile(source)
+                bytecode_cache.set(key, compiled)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
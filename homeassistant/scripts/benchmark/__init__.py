@@ -7,16 +7,22 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 
-from homeassistant import core
+from homeassistant import core, loader
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    TrackStates,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_state_change_filtered,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.setup import async_setup_component
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -223,6 +229,151 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+async def _state_changed_entity_listeners(hass, keyed: bool) -> float:
+    """Fire 100k state changed events with 1000 entity listeners."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        if keyed:
+            hass.bus.async_listen_keyed(
+                EVENT_STATE_CHANGED, "entity_id", [f"{entity_id}{idx}"], listener
+            )
+            continue
+
+        @core.callback
+        def event_filter(event_data, entity_id=f"{entity_id}{idx}"):
+            """Filter event."""
+            return event_data["entity_id"] == entity_id
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, listener, event_filter=event_filter)
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def state_changed_filter_listeners(hass):
+    """Fire 100k state changed events with 1000 filtered listeners."""
+    return await _state_changed_entity_listeners(hass, False)
+
+
+@benchmark
+async def state_changed_keyed_listeners(hass):
+    """Fire 100k state changed events with 1000 keyed listeners."""
+    return await _state_changed_entity_listeners(hass, True)
+
+
+@benchmark
+async def track_state_change_fan_out(hass):
+    """Subscribe 5k listeners to 20 of 10k entities and change every entity."""
+    count = 0
+    entity_count = 10**4
+    listener_count = 5000
+    entities_per_listener = 20
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    entity_ids = [f"sensor.bench_{idx}" for idx in range(entity_count)]
+    old_state = core.State("sensor.bench", "0")
+    new_state = core.State("sensor.bench", "1")
+
+    start = timer()
+
+    unsubs = [
+        async_track_state_change_event(
+            hass,
+            [
+                entity_ids[(idx * 2 + offset) % entity_count]
+                for offset in range(entities_per_listener)
+            ],
+            listener,
+        )
+        for idx in range(listener_count)
+    ]
+
+    for entity_id in entity_ids:
+        hass.bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": old_state, "new_state": new_state},
+        )
+
+    await hass.async_block_till_done()
+
+    for unsub in unsubs:
+        unsub()
+
+    assert count == listener_count * entities_per_listener
+
+    return timer() - start
+
+
+@benchmark
+async def track_state_change_filtered_update(hass):
+    """Move 5k filtered trackers across 10k entities 10 times."""
+    entity_count = 10**4
+    tracker_count = 5000
+    entities_per_tracker = 20
+    updates = 10
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+
+    entity_ids = [f"sensor.bench_{idx}" for idx in range(entity_count)]
+
+    def _track_states(idx: int, shift: int) -> TrackStates:
+        return TrackStates(
+            False,
+            {
+                entity_ids[(idx * 2 + shift + offset) % entity_count]
+                for offset in range(entities_per_tracker)
+            },
+            set(),
+        )
+
+    start = timer()
+
+    trackers = [
+        async_track_state_change_filtered(hass, _track_states(idx, 0), listener)
+        for idx in range(tracker_count)
+    ]
+
+    for shift in range(1, updates + 1):
+        for idx, tracker in enumerate(trackers):
+            tracker.async_update_listeners(_track_states(idx, shift))
+
+    for tracker in trackers:
+        tracker.async_remove()
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -308,3 +459,202 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+async def _record_state_changes(hass, bulk_insert_states: bool) -> float:
+    """Record a burst of state changes and return events per second."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import get_instance
+
+    entity_count = 4000
+    events_to_fire = 10**5
+
+    with TemporaryDirectory() as tmp_dir:
+        db_url = f"sqlite:///{Path(tmp_dir) / 'benchmark.db'}"
+        hass.config.config_dir = tmp_dir
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": db_url,
+                    "commit_interval": 1,
+                    "bulk_insert_states": bulk_insert_states,
+                }
+            },
+        )
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_recorder_ready.wait()
+
+        start = timer()
+        for idx in range(events_to_fire):
+            hass.states.async_set(
+                f"sensor.power_{idx % entity_count}",
+                str(idx),
+                {"unit_of_measurement": "W", "friendly_name": "Power"},
+            )
+            if not idx % 1000:
+                # Yield so the recorder sees a sustained stream
+                await asyncio.sleep(0)
+        await instance.async_block_till_done()
+        runtime = timer() - start
+        print(f"Recorded {events_to_fire / runtime:.0f} state changes per second")
+        await hass.async_stop()
+
+    return runtime
+
+
+@benchmark
+async def recorder_state_changed_orm(hass):
+    """Record 100k state changes for 4000 entities with the ORM."""
+    return await _record_state_changes(hass, False)
+
+
+@benchmark
+async def recorder_state_changed_bulk(hass):
+    """Record 100k state changes for 4000 entities with bulk inserts."""
+    return await _record_state_changes(hass, True)
+
+
+@benchmark
+async def sensor_compile_statistics(hass):
+    """Compile 5-minute statistics for 1500 sensors with 20 states each."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.components.sensor import recorder as sensor_recorder
+    from homeassistant.util import dt as dt_util
+
+    entity_count = 1500
+    states_per_entity = 20
+
+    with TemporaryDirectory() as tmp_dir:
+        db_url = f"sqlite:///{Path(tmp_dir) / 'benchmark.db'}"
+        hass.config.config_dir = tmp_dir
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": db_url, "commit_interval": 1}}
+        )
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_recorder_ready.wait()
+
+        start_time = dt_util.utcnow()
+        for value in range(states_per_entity):
+            for idx in range(entity_count):
+                state_class = "total_increasing" if idx % 3 == 0 else "measurement"
+                hass.states.async_set(
+                    f"sensor.power_{idx}",
+                    str(value + idx % 7),
+                    {"unit_of_measurement": "W", "state_class": state_class},
+                )
+            await asyncio.sleep(0)
+        await instance.async_block_till_done()
+        end_time = dt_util.utcnow()
+
+        def _compile() -> float:
+            with session_scope(hass=hass, read_only=True) as session:
+                start = timer()
+                compiled = sensor_recorder.compile_statistics(
+                    hass, session, start_time, end_time
+                )
+                runtime = timer() - start
+            print(f"Compiled statistics for {len(compiled.platform_stats)} sensors")
+            return runtime
+
+        runtime = await instance.async_add_executor_job(_compile)
+        await hass.async_stop()
+
+    return runtime
+
+
+async def _coordinator_refresh(hass, batch: bool) -> float:
+    """Write the states of 600 entities for 1000 refreshes of a coordinator."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.helpers.entity import Entity, async_batch_write_ha_state
+    from homeassistant.helpers.entity_platform import EntityPlatform
+
+    platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="sensor",
+        platform_name="benchmark",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    entities = []
+    for idx in range(600):
+        entity = Entity()
+        entity.hass = hass
+        entity.platform = platform
+        entity.entity_id = f"sensor.power_{idx}"
+        entity._attr_extra_state_attributes = {"unit_of_measurement": "W"}  # noqa: SLF001
+        entities.append(entity)
+
+    start = timer()
+    for refresh in range(1000):
+        if batch:
+            with async_batch_write_ha_state(hass):
+                for entity in entities:
+                    entity._attr_state = refresh  # noqa: SLF001
+                    entity.async_write_ha_state()
+        else:
+            for entity in entities:
+                entity._attr_state = refresh  # noqa: SLF001
+                entity.async_write_ha_state()
+    return timer() - start
+
+
+@benchmark
+async def coordinator_refresh_write_state(hass):
+    """Write the states of 600 entities per refresh one by one."""
+    return await _coordinator_refresh(hass, False)
+
+
+@benchmark
+async def coordinator_refresh_batch_write_state(hass):
+    """Write the states of 600 entities per refresh in one batch."""
+    return await _coordinator_refresh(hass, True)
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Measure the memory of the state machine with 10k entities."""
+    # pylint: disable-next=import-outside-toplevel
+    import tracemalloc
+
+    entity_count = 10000
+    device_classes = ("power", "energy", "temperature", "humidity")
+    units = ("W", "kWh", "°C", "%")
+
+    tracemalloc.start()
+    start = timer()
+    for update in range(3):
+        for idx in range(entity_count):
+            kind = idx % len(device_classes)
+            # Attributes are built for every write like entities do
+            hass.states.async_set(
+                f"sensor.sensor_{idx}",
+                str(update + idx),
+                {
+                    "state_class": "measurement",
+                    "unit_of_measurement": units[kind],
+                    "device_class": device_classes[kind],
+                    "friendly_name": f"Sensor {idx} {device_classes[kind]}",
+                    "icon": f"mdi:{device_classes[kind]}",
+                },
+            )
+    runtime = timer() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"State machine uses {current / 1024 / 1024:.1f} MiB")
+    return runtime
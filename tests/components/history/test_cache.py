@@ -0,0 +1,66 @@
+"""The tests for the history stream cache."""
+
+from homeassistant.components.history.cache import (
+    BUCKET_OVERHEAD_BYTES,
+    HistoryStreamCache,
+)
+
+
+def test_sealed_buckets() -> None:
+    """Test only whole buckets before the sealed time are returned."""
+    cache = HistoryStreamCache(bucket_seconds=100)
+    assert cache.sealed_buckets(50, 1000) == []
+
+    cache.async_seal(450)
+    assert cache.sealed_buckets(50, 1000) == [100.0, 200.0, 300.0]
+    assert cache.sealed_buckets(100, 1000) == [100.0, 200.0, 300.0]
+    assert cache.sealed_buckets(50, 320) == [100.0, 200.0]
+    assert cache.sealed_buckets(150, 250) == []
+
+    # The sealed time never moves backwards
+    cache.async_seal(200)
+    assert cache.sealed_buckets(50, 1000) == [100.0, 200.0, 300.0]
+
+
+def test_clear() -> None:
+    """Test clearing drops all buckets and buckets read before it."""
+    cache = HistoryStreamCache()
+    key = (("sensor.one",), True, False, False, 0.0)
+    generation = cache.generation
+    cache.put(key, [(b"x" * 100, 1.0)], generation)
+    assert cache.get(key) is not None
+
+    cache.async_clear()
+    assert cache.get(key) is None
+    assert cache.size == 0
+
+    # Chunks read from the database before the clear are not stored
+    cache.put(key, [(b"x" * 100, 1.0)], generation)
+    assert cache.get(key) is None
+    cache.put(key, [(b"x" * 100, 1.0)], cache.generation)
+    assert cache.get(key) is not None
+
+
+def test_least_recently_used_buckets_are_evicted() -> None:
+    """Test the least recently used buckets are evicted once the cache is full."""
+    bucket_size = BUCKET_OVERHEAD_BYTES + 100
+    cache = HistoryStreamCache(max_bytes=bucket_size * 4)
+    keys = [(("sensor.one",), True, False, False, float(hour)) for hour in range(5)]
+    for key in keys[:4]:
+        cache.put(key, [(b"x" * 100, 1.0)])
+    assert cache.size == bucket_size * 4
+
+    assert cache.get(keys[0]) == [(b"x" * 100, 1.0)]
+    cache.put(keys[4], [(b"x" * 100, 1.0)])
+    assert cache.size == bucket_size * 4
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[4]) is not None
+
+    # Replacing a bucket does not count it twice
+    cache.put(keys[4], [])
+    assert cache.size == bucket_size * 3 + BUCKET_OVERHEAD_BYTES
+
+    # A bucket larger than a quarter of the cache is not stored
+    cache.put(keys[1], [(b"x" * bucket_size * 2, 1.0)])
+    assert cache.get(keys[1]) is None
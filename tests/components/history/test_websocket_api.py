@@ -9,6 +9,7 @@ import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
+from homeassistant.components.history.const import DATA_HISTORY_STREAM_CACHE
 from homeassistant.components.recorder import Recorder
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
@@ -543,6 +544,140 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_in_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends historical states in chunks."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    timestamps: list[float] = []
+    for entity_id, state in (
+        ("sensor.one", "on"),
+        ("sensor.one", "off"),
+        ("sensor.one", "on"),
+        ("sensor.two", "off"),
+    ):
+        hass.states.async_set(entity_id, state, attributes={"any": "attr"})
+        timestamps.append(hass.states.get(entity_id).last_updated_timestamp)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "HISTORY_STREAM_CHUNK_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "start_time": now.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["type"] == "result"
+
+        response = await client.receive_json()
+        assert response["event"] == {
+            "end_time": pytest.approx(timestamps[1]),
+            "start_time": pytest.approx(now.timestamp()),
+            "states": {
+                "sensor.one": [
+                    {"lu": pytest.approx(timestamps[0]), "s": "on"},
+                    {"lu": pytest.approx(timestamps[1]), "s": "off"},
+                ],
+            },
+        }
+        response = await client.receive_json()
+        assert response["event"] == {
+            "end_time": pytest.approx(timestamps[3]),
+            "start_time": pytest.approx(now.timestamp()),
+            "states": {
+                "sensor.one": [{"lu": pytest.approx(timestamps[2]), "s": "on"}],
+                "sensor.two": [{"lu": pytest.approx(timestamps[3]), "s": "off"}],
+            },
+        }
+
+
+async def test_history_stream_serves_sealed_buckets_from_cache(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream serves whole sealed buckets from the cache."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    start_time = (dt_util.utcnow() - timedelta(hours=4)).replace(
+        minute=30, second=0, microsecond=0
+    )
+    timestamps: list[float] = []
+    for minutes, state in ((10, "on"), (70, "off"), (130, "on")):
+        with freeze_time(start_time + timedelta(minutes=minutes)):
+            hass.states.async_set("sensor.one", state, attributes={"any": "attr"})
+            timestamps.append(hass.states.get("sensor.one").last_updated_timestamp)
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+    cache = hass.data[DATA_HISTORY_STREAM_CACHE]
+    cache.async_seal(end_time.timestamp())
+
+    client = await hass_ws_client()
+
+    async def _async_stream(msg_id: int) -> list[dict]:
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "history/stream",
+                "entity_ids": ["sensor.one"],
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        return [(await client.receive_json())["event"] for _ in range(3)]
+
+    expected = [
+        {
+            "end_time": pytest.approx(timestamp),
+            "start_time": pytest.approx(start_time.timestamp()),
+            "states": {
+                "sensor.one": [{"lu": pytest.approx(timestamp), "s": state}],
+            },
+        }
+        for timestamp, state in zip(timestamps, ("on", "off", "on"), strict=True)
+    ]
+    assert await _async_stream(1) == expected
+    assert cache.size > 0
+    cached_size = cache.size
+
+    with patch.object(cache, "put", side_effect=AssertionError("not cached")):
+        assert await _async_stream(2) == expected
+    assert cache.size == cached_size
+
+    # Purging states drops the cached buckets
+    await hass.services.async_call(
+        "recorder",
+        "purge_entities",
+        {"entity_id": "sensor.one", "keep_days": 0},
+        blocking=True,
+    )
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+    assert cache.size == 0
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
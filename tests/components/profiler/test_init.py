@@ -25,18 +25,22 @@ from homeassistant.components.profiler import (
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_START,
+    SERVICE_START_EVENT_BUS_PROFILE,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_EVENT_BUS_PROFILE,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.loop_monitor import async_get_loop_monitor
 import homeassistant.util.dt as dt_util
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, MockUser, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -447,3 +451,129 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_event_bus_profile(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test profiling the event bus."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    @callback
+    def _profiled_listener(event):
+        """Mock listener."""
+
+    hass.bus.async_listen("profiled_event", _profiled_listener)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "profiler/event_bus_profile"})
+    response = await client.receive_json()
+    assert not response["success"]
+
+    with pytest.raises(HomeAssistantError, match="not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_EVENT_BUS_PROFILE, {}, blocking=True
+        )
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_EVENT_BUS_PROFILE, {}, blocking=True
+    )
+    with pytest.raises(HomeAssistantError, match="already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_EVENT_BUS_PROFILE, {}, blocking=True
+        )
+
+    hass.bus.async_fire("profiled_event")
+    hass.bus.async_fire("profiled_event")
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "profiler/event_bus_profile"})
+    response = await client.receive_json()
+    assert response["success"]
+    event_types = {
+        stats["event_type"]: stats for stats in response["result"]["event_types"]
+    }
+    assert event_types["profiled_event"]["count"] == 2
+    listener = next(
+        stats
+        for stats in response["result"]["listeners"]
+        if stats["event_type"] == "profiled_event"
+    )
+    assert "_profiled_listener" in listener["target"]
+    assert listener["count"] == 2
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_EVENT_BUS_PROFILE, {}, blocking=True
+    )
+    assert "_profiled_listener" in caplog.text
+    assert hass.bus.async_profile() is None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_subscribe_loop_monitor(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscribing to the loop monitor samples."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    monitor = async_get_loop_monitor(hass)
+    # The sensors are disabled by default so nothing samples yet
+    assert monitor._timer is None
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 7, "type": "profiler/subscribe_loop_monitor"})
+    msg = await client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+    assert monitor._timer is not None
+
+    msg = await client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["histograms"]["loop_lag"]["count"] == 0
+
+    monitor._async_sample()
+    msg = await client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"]["histograms"]["loop_lag"]["count"] == 1
+    assert msg["event"]["latest"]["ready_queue"] is not None
+
+    await client.send_json({"id": 8, "type": "unsubscribe_events", "subscription": 7})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert monitor._timer is None
+
+
+async def test_subscribe_loop_monitor_requires_admin(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribing to the loop monitor requires admin."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass_admin_user.groups = []
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 7, "type": "profiler/subscribe_loop_monitor"})
+    msg = await client.receive_json()
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == "unauthorized"
@@ -0,0 +1,45 @@
+"""Test the Profiler sensors."""
+
+import pytest
+
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.loop_monitor import async_get_loop_monitor
+
+from tests.common import MockConfigEntry
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_loop_monitor_sensors(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the loop monitor sensors."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_long_callbacks"
+    )
+    assert hass.states.get(entity_id).state == "0"
+    lag_entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_loop_lag"
+    )
+    assert hass.states.get(lag_entity_id).state == "unknown"
+
+    monitor = async_get_loop_monitor(hass)
+    assert monitor._timer is not None
+    monitor._expected = hass.loop.time() - 1
+    monitor._async_sample()
+    await async_update_entity(hass, lag_entity_id)
+    await async_update_entity(hass, entity_id)
+    assert float(hass.states.get(lag_entity_id).state) >= 1000
+    assert hass.states.get(entity_id).state == "1"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert monitor._timer is None
@@ -0,0 +1,210 @@
+"""Test the recorder adaptive commit interval and backpressure."""
+
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import CONF_ADAPTIVE_COMMIT_INTERVAL, Recorder
+from homeassistant.components.recorder.backpressure import (
+    BACKLOG_SHRINK_THRESHOLD,
+    BACKLOG_WIDEN_THRESHOLD,
+    COALESCE_BACKLOG_THRESHOLD,
+    MAX_COMMIT_INTERVAL_MULTIPLIER,
+    CommitIntervalController,
+    StateChangedCoalescer,
+    merge_state_changed_events,
+)
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State
+
+from .common import async_block_recorder, async_wait_recording_done
+
+
+def _state_changed_event(
+    entity_id: str, new_state: str | None
+) -> Event[dict[str, str | State | None]]:
+    """Return a state_changed event."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": entity_id,
+            "old_state": State(entity_id, "previous"),
+            "new_state": None if new_state is None else State(entity_id, new_state),
+        },
+    )
+
+
+def test_commit_interval_controller_widens_and_shrinks() -> None:
+    """Test the commit window widens under load and shrinks once drained."""
+    controller = CommitIntervalController(5)
+    assert controller.current_commit_interval == 5
+    assert controller.async_commit_due(0) is True
+
+    for _ in range(10):
+        controller.async_commit_due(BACKLOG_WIDEN_THRESHOLD)
+    assert controller.multiplier == MAX_COMMIT_INTERVAL_MULTIPLIER
+    assert controller.current_commit_interval == 5 * MAX_COMMIT_INTERVAL_MULTIPLIER
+    assert controller.coalesce is False
+
+    # Only every multiplier ticks is a commit due
+    commits_due = [
+        controller.async_commit_due(BACKLOG_WIDEN_THRESHOLD)
+        for _ in range(MAX_COMMIT_INTERVAL_MULTIPLIER * 2)
+    ]
+    assert commits_due.count(True) == 2
+
+    # A slow commit keeps the window wide even when the queue is empty
+    controller.record_commit_time(controller.current_commit_interval)
+    controller.async_commit_due(0)
+    assert controller.multiplier == MAX_COMMIT_INTERVAL_MULTIPLIER
+
+    controller.record_commit_time(0.01)
+    for _ in range(10):
+        controller.async_commit_due(BACKLOG_SHRINK_THRESHOLD)
+    assert controller.multiplier == 1
+
+
+def test_commit_interval_controller_coalesce_hysteresis() -> None:
+    """Test coalescing starts on a deep backlog and stops once drained."""
+    controller = CommitIntervalController(5)
+    controller.async_commit_due(COALESCE_BACKLOG_THRESHOLD)
+    assert controller.coalesce is True
+    controller.async_commit_due(BACKLOG_WIDEN_THRESHOLD)
+    assert controller.coalesce is True
+    controller.async_commit_due(BACKLOG_SHRINK_THRESHOLD)
+    assert controller.coalesce is False
+
+
+def test_state_changed_coalescer() -> None:
+    """Test superseded state changes replace the queued one."""
+    coalescer = StateChangedCoalescer()
+    first = _state_changed_event("sensor.power", "1")
+    second = _state_changed_event("sensor.power", "2")
+    third = _state_changed_event("sensor.power", "3")
+    other = _state_changed_event("sensor.other", "1")
+    removed = _state_changed_event("sensor.power", None)
+    after_removed = _state_changed_event("sensor.power", "4")
+
+    assert coalescer.async_coalesce(first) is False
+    assert coalescer.async_coalesce(other) is False
+    assert coalescer.async_coalesce(second) is True
+    assert coalescer.async_coalesce(third) is True
+    assert coalescer.async_coalesce(removed) is False
+    assert coalescer.async_coalesce(after_removed) is False
+
+    recorded = coalescer.resolve(first)
+    assert recorded.data["new_state"] is third.data["new_state"]
+    assert recorded.data["old_state"] is first.data["old_state"]
+    assert recorded.context is third.context
+    assert coalescer.resolve(other) is other
+    assert coalescer.resolve(removed) is removed
+    assert coalescer.resolve(after_removed) is after_removed
+
+    # Nothing is tracked once everything has been resolved
+    assert not coalescer._open
+    assert not coalescer._replacements
+    untracked = _state_changed_event("sensor.power", "5")
+    assert coalescer.resolve(untracked) is untracked
+
+
+def test_state_changed_coalescer_not_replacing() -> None:
+    """Test events queued while not coalescing are not replaced out of order."""
+    coalescer = StateChangedCoalescer()
+    first = _state_changed_event("sensor.power", "1")
+    second = _state_changed_event("sensor.power", "2")
+    third = _state_changed_event("sensor.power", "3")
+
+    assert coalescer.async_coalesce(first) is False
+    assert coalescer.async_coalesce(second, replace=False) is False
+    assert coalescer.async_coalesce(third) is True
+
+    # The newest state replaces the last queued event, not the first
+    assert coalescer.resolve(first) is first
+    recorded = coalescer.resolve(second)
+    assert recorded.data["new_state"] is third.data["new_state"]
+    assert recorded.data["old_state"] is second.data["old_state"]
+    assert not coalescer._open
+    assert not coalescer._replacements
+
+
+def test_merge_state_changed_events() -> None:
+    """Test merging keeps the old state of the superseded event."""
+    superseded = _state_changed_event("sensor.power", "1")
+    newer = _state_changed_event("sensor.power", "2")
+    merged = merge_state_changed_events(superseded, newer)
+    assert merged.event_type == EVENT_STATE_CHANGED
+    assert merged.data == {
+        "entity_id": "sensor.power",
+        "old_state": superseded.data["old_state"],
+        "new_state": newer.data["new_state"],
+    }
+    assert merged.time_fired_timestamp == newer.time_fired_timestamp
+    assert merged.context is newer.context
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_ADAPTIVE_COMMIT_INTERVAL: True}])
+async def test_coalesce_state_changes_in_queue(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test superseded state changes are not recorded while coalescing."""
+    assert recorder_mock._commit_controller is not None
+    recorder_mock._commit_controller.coalesce = True
+
+    await async_block_recorder(hass, 0.1)
+    for value in range(5):
+        hass.states.async_set("sensor.power", str(value))
+    hass.states.async_set("sensor.other", "on")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(StatesMeta.entity_id, States.state).outerjoin(
+                StatesMeta, States.metadata_id == StatesMeta.metadata_id
+            )
+        )
+    assert sorted(states) == [("sensor.other", "on"), ("sensor.power", "4")]
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_ADAPTIVE_COMMIT_INTERVAL: True}])
+async def test_coalesce_toggled_between_writes(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the latest state is recorded last when coalescing is toggled."""
+    controller = recorder_mock._commit_controller
+    assert controller is not None
+
+    await async_block_recorder(hass, 0.1)
+    controller.coalesce = True
+    hass.states.async_set("sensor.power", "0")
+    controller.coalesce = False
+    hass.states.async_set("sensor.power", "1")
+    hass.states.async_set("sensor.power", "2")
+    controller.coalesce = True
+    hass.states.async_set("sensor.power", "3")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = [
+            state for (state,) in session.query(States.state).order_by(States.state_id)
+        ]
+    assert states == ["0", "1", "3"]
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_ADAPTIVE_COMMIT_INTERVAL: True}])
+async def test_max_backlog_starts_coalescing_before_stopping(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test reaching the max backlog coalesces state changes before stopping."""
+    assert recorder_mock._commit_controller is not None
+    with patch.object(recorder_mock, "_reached_max_backlog", return_value=True):
+        recorder_mock._async_check_queue()
+        assert recorder_mock._commit_controller.coalesce is True
+        assert recorder_mock.recording is True
+        assert "will no longer be recorded" in caplog.text
+
+        recorder_mock._async_check_queue()
+        assert recorder_mock.recording is False
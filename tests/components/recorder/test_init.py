@@ -21,6 +21,7 @@ from homeassistant.components.lock import LockState
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_INSERT_STATES,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -130,12 +131,17 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         auto_purge=True,
         auto_repack=True,
         keep_days=7,
+        purge_by_day=False,
         commit_interval=1,
+        adaptive_commit_interval=False,
+        bulk_insert_states=False,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        min_recorded_intervals=[],
+        spool_dir=None,
     )
 
 
@@ -1473,6 +1479,160 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_INSERT_STATES: True}])
+async def test_saving_sets_old_state_bulk_insert(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test saving with bulk inserts links old states inside the commit."""
+    instance = get_instance(hass)
+    assert instance._bulk_states is not None
+
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.two", "s2", {})
+    hass.states.async_set("test.one", "s3", {"attr": 1})
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.two", "s5", {})
+    hass.states.async_remove("test.one")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+                States.entity_id.label("legacy_entity_id"),
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s3"].entity_id == "test.one"
+        assert states_by_state["s4"].entity_id == "test.one"
+        assert states_by_state["s5"].entity_id == "test.two"
+        assert states_by_state[None].entity_id == "test.one"
+        assert all(state.legacy_entity_id is None for state in states)
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state[None].old_state_id == states_by_state["s4"].state_id
+
+        assert (
+            states_by_state["s1"].attributes_id == states_by_state["s3"].attributes_id
+        )
+        assert (
+            states_by_state["s1"].attributes_id != states_by_state["s4"].attributes_id
+        )
+
+    assert len(instance._bulk_states) == 0
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_INSERT_STATES: True}])
+async def test_saving_state_bulk_insert_restores_state(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test a state saved with bulk inserts round trips."""
+    entity_id = "test.recorder"
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    hass.states.async_set(entity_id, "restoring_from_db", attributes)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = []
+        for db_state, db_state_attributes, states_meta in (
+            session.query(States, StateAttributes, StatesMeta)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        ):
+            db_state.entity_id = states_meta.entity_id
+            db_states.append(db_state)
+            state = db_state.to_native()
+            state.attributes = db_state_attributes.to_native()
+        assert len(db_states) == 1
+
+    assert state.as_dict() == _state_with_context(hass, entity_id).as_dict()
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_INSERT_STATES: True}])
+async def test_saving_state_bulk_insert_retries_commit(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
+) -> None:
+    """Test the bulk states rows are built again when a commit is retried."""
+    instance = get_instance(hass)
+    hass.states.async_set("test.one", "s0", {"attr": 0})
+    await async_wait_recording_done(hass)
+    session = instance.event_session
+    commit = session.commit
+    calls = 0
+
+    def _commit_fails_once() -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise OperationalError("commit", {}, Exception("forced to fail"))
+        commit()
+
+    with (
+        patch("time.sleep"),
+        patch.object(session, "commit", side_effect=_commit_fails_once),
+    ):
+        hass.states.async_set("test.one", "s1", {"attr": 1})
+        hass.states.async_set("test.one", "s2", {"attr": 2})
+        await async_wait_recording_done(hass)
+
+    assert "Error executing query" in caplog.text
+    assert instance.event_session is not session
+    assert len(instance._bulk_states) == 0
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                States.state_id, States.old_state_id, States.state, States.attributes_id
+            )
+        )
+        assert len(states) == 3
+        states_by_state = {state.state: state for state in states}
+        # The state committed before the failure is still linked
+        assert states_by_state["s1"].old_state_id == states_by_state["s0"].state_id
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s1"].attributes_id is not None
+        assert states_by_state["s2"].attributes_id is not None
+        assert (
+            states_by_state["s1"].attributes_id != states_by_state["s2"].attributes_id
+        )
+
+
+async def test_bulk_insert_states_unsupported_dialect(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test bulk inserts fall back to the ORM without ordered RETURNING support."""
+    recorder_helper.async_initialize_recorder(hass)
+    instance = _default_recorder(hass)
+    instance.bulk_insert_states = True
+    instance.engine = Mock(
+        dialect=Mock(insert_executemany_returning_sort_by_parameter_order=False)
+    )
+    instance.engine.dialect.name = "mysql"
+    instance._setup_bulk_insert_states()
+    assert instance._bulk_states is None
+    assert "bulk insert of states is disabled" in caplog.text
+
+    instance.engine.dialect.insert_executemany_returning_sort_by_parameter_order = True
+    instance._setup_bulk_insert_states()
+    assert instance._bulk_states is not None
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
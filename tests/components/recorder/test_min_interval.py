@@ -0,0 +1,153 @@
+"""Test the recorder minimum recorded interval."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import (
+    CONF_INTERVAL,
+    CONF_MIN_RECORDED_INTERVAL,
+    CONFIG_SCHEMA,
+    DOMAIN,
+    Recorder,
+)
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.common import async_fire_time_changed
+
+
+def _recorded_states(hass: HomeAssistant) -> list[tuple[str, str | None, int, int]]:
+    """Return the recorded entity_id, state, state_id and old_state_id."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return [
+            tuple(row)
+            for row in session.query(
+                StatesMeta.entity_id, States.state, States.state_id, States.old_state_id
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        ]
+
+
+def test_min_recorded_interval_schema() -> None:
+    """Test the minimum recorded interval config."""
+    conf = CONFIG_SCHEMA(
+        {
+            DOMAIN: {
+                CONF_MIN_RECORDED_INTERVAL: {
+                    "entity_globs": ["sensor.*_power"],
+                    CONF_INTERVAL: 10,
+                }
+            }
+        }
+    )[DOMAIN]
+    assert conf[CONF_MIN_RECORDED_INTERVAL] == [
+        {
+            "domains": [],
+            "entity_globs": ["sensor.*_power"],
+            "entities": [],
+            CONF_INTERVAL: timedelta(seconds=10),
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [
+        {
+            CONF_MIN_RECORDED_INTERVAL: [
+                {"entity_globs": ["sensor.*_power"], CONF_INTERVAL: 10},
+                {"domains": ["sensor"], CONF_INTERVAL: 60},
+            ]
+        }
+    ],
+)
+async def test_min_recorded_interval(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test superseded states inside the interval are not recorded."""
+    for value in range(4):
+        hass.states.async_set("sensor.kitchen_power", str(value))
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    await async_wait_recording_done(hass)
+
+    states = _recorded_states(hass)
+    assert [(entity_id, state) for entity_id, state, _, _ in states] == [
+        ("sensor.kitchen_power", "0"),
+        ("light.kitchen", "on"),
+        ("light.kitchen", "off"),
+    ]
+    first_power_state_id = states[0][2]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await async_wait_recording_done(hass)
+
+    states = _recorded_states(hass)
+    assert [(entity_id, state) for entity_id, state, _, _ in states] == [
+        ("sensor.kitchen_power", "0"),
+        ("light.kitchen", "on"),
+        ("light.kitchen", "off"),
+        ("sensor.kitchen_power", "3"),
+    ]
+    assert states[3][3] == first_power_state_id
+    assert hass.states.get("sensor.kitchen_power").state == "3"
+
+    # The held state is recorded before the removal
+    hass.states.async_set("sensor.kitchen_power", "4")
+    hass.states.async_remove("sensor.kitchen_power")
+    await async_wait_recording_done(hass)
+
+    states = _recorded_states(hass)
+    assert [(entity_id, state) for entity_id, state, _, _ in states][4:] == [
+        ("sensor.kitchen_power", "4"),
+        ("sensor.kitchen_power", None),
+    ]
+    assert states[5][3] == states[4][2]
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{CONF_MIN_RECORDED_INTERVAL: [{"domains": ["sensor"], CONF_INTERVAL: 60}]}],
+)
+async def test_min_recorded_interval_release_all(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test held states are recorded when they are released before shutdown."""
+    hass.states.async_set("sensor.power", "1")
+    hass.states.async_set("sensor.power", "2")
+    hass.states.async_set("sensor.power", "3")
+    await async_wait_recording_done(hass)
+    assert [state for _, state, _, _ in _recorded_states(hass)] == ["1"]
+
+    assert recorder_mock._min_interval_limiter is not None
+    recorder_mock._min_interval_limiter.async_release_all()
+    await async_wait_recording_done(hass)
+    assert [state for _, state, _, _ in _recorded_states(hass)] == ["1", "3"]
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [
+        {
+            CONF_MIN_RECORDED_INTERVAL: [
+                {"entity_globs": ["sensor.*_power"], CONF_INTERVAL: 10},
+                {"domains": ["sensor"], CONF_INTERVAL: 60},
+            ]
+        }
+    ],
+)
+async def test_committed_watermark(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the committed watermark allows for the longest interval."""
+    assert recorder_mock.async_committed_watermark(1000.0) == 940.0
+
+    with patch.object(recorder_mock, "_event_listener", None):
+        assert recorder_mock.async_committed_watermark(1000.0) is None
@@ -12,9 +12,17 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
-from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
-from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder import (
+    CONF_PURGE_BY_DAY,
+    DOMAIN as RECORDER_DOMAIN,
+    Recorder,
+)
+from homeassistant.components.recorder.const import (
+    LAST_USED_UPDATE_INTERVAL,
+    SupportedDialect,
+)
 from homeassistant.components.recorder.db_schema import (
+    EventData,
     Events,
     EventTypes,
     RecorderRuns,
@@ -223,6 +231,167 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_state_attributes_and_event_data_last_used_ts(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the last_used_ts of shared rows only moves forward once per interval."""
+    attributes = {"test_attr": 5}
+    event_data = {"test_attr": 5}
+
+    def _last_used_ts() -> tuple[float | None, float | None]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                session.query(StateAttributes.last_used_ts)
+                .filter(StateAttributes.shared_attrs.like("%test_attr%"))
+                .one()[0],
+                session.query(EventData.last_used_ts)
+                .filter(EventData.shared_data.like("%test_attr%"))
+                .one()[0],
+            )
+
+    with freeze_time() as freezer:
+        first = dt_util.utcnow().timestamp()
+        hass.states.async_set("test.last_used", "1", attributes)
+        hass.bus.async_fire("EVENT_TEST", event_data)
+        await async_wait_recording_done(hass)
+        assert _last_used_ts() == (first, first)
+
+        freezer.tick(timedelta(seconds=LAST_USED_UPDATE_INTERVAL / 2))
+        hass.states.async_set("test.last_used", "2", attributes)
+        hass.bus.async_fire("EVENT_TEST", event_data)
+        await async_wait_recording_done(hass)
+        assert _last_used_ts() == (first, first)
+
+        freezer.tick(timedelta(seconds=LAST_USED_UPDATE_INTERVAL))
+        last = dt_util.utcnow().timestamp()
+        hass.states.async_set("test.last_used", "3", attributes)
+        hass.bus.async_fire("EVENT_TEST", event_data)
+        await async_wait_recording_done(hass)
+        assert _last_used_ts() == (last, last)
+
+
+async def test_purge_unused_shared_rows_by_last_used(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging shared rows by last_used_ts does not scan states or events."""
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 3
+        assert (
+            session.query(StateAttributes)
+            .filter(StateAttributes.last_used_ts.is_(None))
+            .count()
+            == 0
+        )
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch(
+            "homeassistant.components.recorder.purge.attributes_ids_exist_in_states",
+            side_effect=AssertionError,
+        ),
+        patch(
+            "homeassistant.components.recorder.purge.attributes_ids_exist_in_states_with_fast_in_distinct",
+            side_effect=AssertionError,
+        ),
+        patch(
+            "homeassistant.components.recorder.purge.data_ids_exist_in_events",
+            side_effect=AssertionError,
+        ),
+        patch(
+            "homeassistant.components.recorder.purge.data_ids_exist_in_events_with_fast_in_distinct",
+            side_effect=AssertionError,
+        ),
+    ):
+        while not purge_old_data(recorder_mock, purge_before, repack=False):
+            pass
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+        state_attributes = session.query(StateAttributes).one()
+        assert "dontpurgeme" in state_attributes.shared_attrs
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data.like("%test_attr%"))
+            .count()
+            == 1
+        )
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_PURGE_BY_DAY: True}])
+async def test_purge_old_states_by_day(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test deleting old states one day at a time."""
+    await _add_test_states(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    # The first run only purges the day of the oldest states
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert not finished
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        assert states.count() == 4
+        assert state_attributes.count() == 2
+        state_map_by_state = {state.state: state for state in states}
+        assert state_map_by_state["purgeme_2"].old_state_id is None
+        assert (
+            state_map_by_state["purgeme_3"].old_state_id
+            == state_map_by_state["purgeme_2"].state_id
+        )
+
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert not finished
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+        assert states.count() == 2
+        assert state_attributes.count() == 1
+        state_map_by_state = {state.state: state for state in states}
+        assert state_map_by_state["dontpurgeme_4"].old_state_id is None
+        assert (
+            state_map_by_state["dontpurgeme_5"].old_state_id
+            == state_map_by_state["dontpurgeme_4"].state_id
+        )
+
+    assert "test.recorder2" in recorder_mock.states_manager._last_committed_id
+
+    finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert finished
+
+    finished = purge_old_data(recorder_mock, dt_util.utcnow(), repack=False)
+    assert finished
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 0
+        assert session.query(StateAttributes).count() == 0
+
+    assert "test.recorder2" not in recorder_mock.states_manager._last_committed_id
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_PURGE_BY_DAY: True}])
+async def test_purge_old_short_term_statistics_by_day(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test deleting old short term statistics one day at a time."""
+    await _add_test_statistics(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with session_scope(hass=hass) as session:
+        assert not purge_old_data(recorder_mock, purge_before, repack=False)
+        assert session.query(StatisticsShortTerm).count() == 4
+        assert not purge_old_data(recorder_mock, purge_before, repack=False)
+        assert session.query(StatisticsShortTerm).count() == 2
+        assert purge_old_data(recorder_mock, purge_before, repack=False)
+        assert session.query(StatisticsShortTerm).count() == 2
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
@@ -0,0 +1,135 @@
+"""Test the recorder spool for database outages."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import States, StatesMeta
+from homeassistant.components.recorder.spool import (
+    EventSpool,
+    event_from_spool_line,
+    event_to_spool_line,
+)
+from homeassistant.components.recorder.tasks import KeepAliveTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, HomeAssistant, State
+
+from .common import async_wait_recording_done
+
+
+def _state_changed_event(entity_id: str, state: str) -> Event:
+    """Return a state_changed event."""
+    return Event(
+        EVENT_STATE_CHANGED,
+        {
+            "entity_id": entity_id,
+            "old_state": None,
+            "new_state": State(entity_id, state, {"unit_of_measurement": "W"}),
+        },
+        context=Context(user_id="abc", parent_id="def"),
+    )
+
+
+def test_event_spool_line_round_trip() -> None:
+    """Test events are restored from the spool."""
+    event = _state_changed_event("sensor.power", "1")
+    restored = event_from_spool_line(event_to_spool_line(event))
+    assert restored.event_type == EVENT_STATE_CHANGED
+    assert restored.origin == event.origin
+    assert restored.time_fired_timestamp == event.time_fired_timestamp
+    assert restored.context == event.context
+    assert restored.data["old_state"] is None
+    new_state: State = restored.data["new_state"]
+    assert new_state.entity_id == "sensor.power"
+    assert new_state.state == "1"
+    assert new_state.attributes == {"unit_of_measurement": "W"}
+    assert new_state.last_updated == event.data["new_state"].last_updated
+
+    event = Event("custom_event", {"key": [1, 2]})
+    restored = event_from_spool_line(event_to_spool_line(event))
+    assert restored.event_type == "custom_event"
+    assert restored.data == {"key": [1, 2]}
+
+
+def test_event_spool_segments(tmp_path: Path) -> None:
+    """Test the spool rolls over segments and replays them oldest first."""
+    spool = EventSpool(str(tmp_path))
+    spool.load()
+    assert not spool.has_events
+
+    with patch("homeassistant.components.recorder.spool.SPOOL_SEGMENT_MAX_BYTES", 1):
+        for value in range(3):
+            assert spool.append(_state_changed_event("sensor.power", str(value)))
+    spool.close()
+    assert len(list(tmp_path.iterdir())) == 3
+
+    # An incomplete last line is skipped
+    with (tmp_path / "0000000003.spool").open("ab") as segment_file:
+        segment_file.write(b'{"event_type":')
+
+    spool = EventSpool(str(tmp_path))
+    spool.load()
+    assert spool.has_events
+    replayed = []
+    while (events := spool.read_oldest()) is not None:
+        replayed.extend(event.data["new_state"].state for event in events)
+        spool.remove_oldest()
+    assert replayed == ["0", "1", "2"]
+    assert spool.size == 0
+    assert not list(tmp_path.iterdir())
+
+
+def test_event_spool_max_bytes(tmp_path: Path) -> None:
+    """Test events are dropped once the spool is full."""
+    spool = EventSpool(str(tmp_path), max_bytes=1)
+    spool.load()
+    assert not spool.append(_state_changed_event("sensor.power", "1"))
+    assert spool.dropped == 1
+    assert not spool.has_events
+
+
+async def test_spool_events_while_database_is_unavailable(
+    hass: HomeAssistant, recorder_mock: Recorder, tmp_path: Path
+) -> None:
+    """Test events are spooled while the database is away and replayed later."""
+    spool = EventSpool(str(tmp_path))
+    await recorder_mock.async_add_executor_job(spool.load)
+    recorder_mock._spool = spool
+
+    with patch.object(
+        recorder_mock,
+        "_commit_event_session",
+        side_effect=OperationalError("insert", {}, Exception("gone away")),
+    ):
+        hass.states.async_set("sensor.power", "1")
+        hass.states.async_set("sensor.power", "2")
+        await async_wait_recording_done(hass)
+
+    assert spool.active is True
+    assert spool.has_events
+    assert await recorder_mock.async_block_till_committed() is False
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 0
+
+    hass.states.async_set("sensor.power", "3")
+    await async_wait_recording_done(hass)
+    recorder_mock.queue_task(KeepAliveTask())
+    await async_wait_recording_done(hass)
+
+    assert spool.active is False
+    assert not spool.has_events
+    assert await recorder_mock.async_block_till_committed() is True
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(StatesMeta.entity_id, States.state)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.last_updated_ts)
+        )
+    assert states == [
+        ("sensor.power", "1"),
+        ("sensor.power", "2"),
+        ("sensor.power", "3"),
+    ]
@@ -9,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsMeta,
+    StatisticsRollups,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -2647,3 +2651,156 @@ async def test_recorder_platform_with_partial_statistics_support(
 
     for meth in supported_methods:
         getattr(recorder_platform, meth).assert_called_once()
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_statistics_rollups_match_reduced_statistics(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    timezone: str,
+) -> None:
+    """Test statistics read from the rollups match the reduced hourly statistics."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    assert recorder_mock.use_statistics_rollups is True
+
+    zero = dt_util.utcnow()
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-29 18:00:00"))
+    external_statistics = [
+        {
+            "start": period1 + timedelta(hours=5 * i),
+            "last_reset": None,
+            "max": i + 1,
+            "mean": i,
+            "min": i - 1,
+            "state": i,
+            "sum": i * 2,
+        }
+        for i in range(40)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    # Adjust part of the imported statistics
+    recorder_mock.async_adjust_statistics(
+        "test:total_energy_import", period1 + timedelta(days=4), 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+
+    types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
+    for period in ("day", "week", "month"):
+        stats = statistics_during_period(hass, zero, period=period, types=types)
+        with patch.object(recorder_mock, "use_statistics_rollups", False):
+            reduced_stats = statistics_during_period(
+                hass, zero, period=period, types=types
+            )
+        assert stats["test:total_energy_import"]
+        assert stats == reduced_stats
+
+        stats = statistics_during_period(
+            hass,
+            period1 + timedelta(days=2),
+            period1 + timedelta(days=3),
+            period=period,
+            types=types,
+        )
+        with patch.object(recorder_mock, "use_statistics_rollups", False):
+            reduced_stats = statistics_during_period(
+                hass,
+                period1 + timedelta(days=2),
+                period1 + timedelta(days=3),
+                period=period,
+                types=types,
+            )
+        assert stats == reduced_stats
+
+    # Rollups made for another time zone are not used
+    await hass.config.async_set_time_zone("Asia/Kolkata")
+    stats = statistics_during_period(hass, zero, period="day", types=types)
+    with patch.object(recorder_mock, "use_statistics_rollups", False):
+        reduced_stats = statistics_during_period(hass, zero, period="day", types=types)
+    assert stats == reduced_stats
+
+    # The rollups are removed with the statistics
+    recorder_mock.async_clear_statistics(["test:total_energy_import"])
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsRollups).count() == 0
+
+
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_compile_hourly_statistics_updates_rollups(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+) -> None:
+    """Test compiling hourly statistics keeps the rollups up to date."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    await async_wait_recording_done(hass)
+    zero = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 10:00:00"))
+
+    with session_scope(hass=hass) as session:
+        metadata = StatisticsMeta.from_meta(
+            {
+                "has_mean": True,
+                "has_sum": True,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": "sensor.test1",
+                "unit_of_measurement": "kWh",
+            }
+        )
+        session.add(metadata)
+        session.flush()
+        metadata_id = metadata.id
+        for i in range(36):
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    metadata_id,
+                    {
+                        "start": zero + timedelta(minutes=5 * i),
+                        "mean": i % 7,
+                        "min": i % 7 - 1,
+                        "max": i % 7 + 1,
+                        "state": i,
+                        "sum": i * 3,
+                    },
+                )
+            )
+
+    def _get_rollups() -> dict[tuple[int, float | None], tuple[Any, ...]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return {
+                (rollup.period, rollup.start_ts): (
+                    rollup.mean,
+                    rollup.mean_weight,
+                    rollup.min,
+                    rollup.max,
+                    rollup.state,
+                    rollup.sum,
+                )
+                for rollup in session.query(StatisticsRollups)
+            }
+
+    with session_scope(hass=hass) as session:
+        for hour in range(3):
+            statistics._compile_hourly_statistics(session, zero + timedelta(hours=hour))
+    compiled_rollups = _get_rollups()
+    assert len(compiled_rollups) == 3
+
+    with session_scope(hass=hass) as session:
+        statistics.rebuild_statistics_rollups(session, metadata_id)
+    rebuilt_rollups = _get_rollups()
+    assert rebuilt_rollups.keys() == compiled_rollups.keys()
+    for key, (_mean, *values) in rebuilt_rollups.items():
+        compiled_mean, *compiled_values = compiled_rollups[key]
+        assert compiled_mean == pytest.approx(_mean)
+        assert compiled_values == values
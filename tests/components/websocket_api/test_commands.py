@@ -17,6 +17,10 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import (
+    ALL_STATES_JSON_CACHE,
+    DOMAIN_SERVICE_DESCRIPTIONS_JSON_CACHE,
+)
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -692,6 +696,29 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_states_shared_payload(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states shares the payload until the states change."""
+    hass.states.async_set("greeting.hello", "world")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == [hass.states.get("greeting.hello").as_dict()]
+    cached = hass.data[ALL_STATES_JSON_CACHE]["as_dict_json"]
+
+    await websocket_client.send_json({"id": 6, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == [hass.states.get("greeting.hello").as_dict()]
+    assert hass.data[ALL_STATES_JSON_CACHE]["as_dict_json"] is cached
+
+    hass.states.async_set("greeting.hello", "universe")
+    await websocket_client.send_json({"id": 7, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == [hass.states.get("greeting.hello").as_dict()]
+    assert msg["result"][0]["state"] == "universe"
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -706,6 +733,86 @@ async def test_get_services(
         assert msg["result"].keys() == hass.services.async_services().keys()
 
 
+async def test_get_services_domain_fragments(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_services reuses the JSON of domains that did not change."""
+    hass.services.async_register("domain_1", "service_1", lambda call: None)
+    await websocket_client.send_json({"id": 5, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    fragments = hass.data[DOMAIN_SERVICE_DESCRIPTIONS_JSON_CACHE]
+    domain_1_fragment = fragments["domain_1"]
+
+    hass.services.async_register("domain_2", "service_1", lambda call: None)
+    await websocket_client.send_json({"id": 6, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["domain_1"] == {
+        "service_1": {"name": "", "description": "", "fields": {}}
+    }
+    assert "domain_2" in msg["result"]
+    assert fragments["domain_1"] is domain_1_fragment
+
+    hass.services.async_remove("domain_2", "service_1")
+    await websocket_client.send_json({"id": 7, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert "domain_2" not in msg["result"]
+    assert "domain_2" not in fragments
+
+
+async def test_subscribe_services(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_services only sends the domains that changed."""
+    hass.services.async_register("domain_1", "service_1", lambda call: None)
+    with patch(
+        "homeassistant.components.websocket_api.commands.SERVICES_CHANGED_COOLDOWN",
+        0,
+    ):
+        await websocket_client.send_json({"id": 5, "type": "subscribe_services"})
+        msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    assert msg["event"]["a"].keys() == hass.services.async_services().keys()
+    assert "r" not in msg["event"]
+
+    hass.services.async_register("domain_2", "service_1", lambda call: None)
+    hass.services.async_register("domain_2", "service_2", lambda call: None)
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {
+            "domain_2": {
+                "service_1": {"name": "", "description": "", "fields": {}},
+                "service_2": {"name": "", "description": "", "fields": {}},
+            }
+        }
+    }
+
+    hass.services.async_remove("domain_2", "service_1")
+    hass.services.async_remove("domain_2", "service_2")
+    hass.services.async_remove("domain_1", "service_1")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["domain_1", "domain_2"]}
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.services.async_register("domain_3", "service_1", lambda call: None)
+    await hass.async_block_till_done()
+    await websocket_client.send_json({"id": 7, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "pong"
+
+
 async def test_get_config(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -1198,6 +1305,66 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_resume_from_cursor(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test resuming subscribe entities from a cursor."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.porch", "off")
+    hass.states.async_set("light.garage", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "cursor": None}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"light.kitchen", "light.porch", "light.garage"}
+    assert "resumed" not in msg
+    init_cursor = msg["cursor"]
+
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"c": {"light.kitchen": {"+": ANY}}}
+    cursor = msg["cursor"]
+    assert cursor != init_cursor
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    # Changes while the client is away
+    hass.states.async_set("light.porch", "on")
+    hass.states.async_remove("light.garage")
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "subscribe_entities", "cursor": cursor}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["resumed"] is True
+    assert msg["event"] == {
+        "a": {"light.porch": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "r": ["light.garage"],
+    }
+    assert msg["cursor"] != cursor
+
+    # An unknown cursor gets all states
+    await websocket_client.send_json(
+        {"id": 10, "type": "subscribe_entities", "cursor": "unknown:1"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 10
+    assert "resumed" not in msg
+    assert msg["event"]["a"].keys() == {"light.kitchen", "light.porch"}
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -0,0 +1,145 @@
+"""Test Websocket API entity subscriptions module."""
+
+from collections.abc import Callable, Hashable
+from unittest.mock import ANY
+
+from homeassistant.components.websocket_api.entity_subscriptions import (
+    EntitySubscription,
+    async_get_entity_subscriptions,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.json import json_loads
+
+from tests.common import MockUser
+
+
+def _collect(
+    messages: list[bytes],
+) -> Callable[[Hashable, bytes, Callable[[], bytes], bool], None]:
+    """Return a send_coalesced_message that collects the messages."""
+
+    def send_coalesced_message(
+        key: Hashable,
+        message: bytes,
+        latest_message: Callable[[], bytes],
+        low_priority: bool,
+    ) -> None:
+        messages.append(message)
+
+    return send_coalesced_message
+
+
+async def test_entity_subscriptions(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test state changes are forwarded to the subscriptions that want them."""
+    owner = MockUser(is_owner=True)
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.kitchen": True}}})
+    assert not hass_admin_user.is_admin
+
+    all_messages: list[bytes] = []
+    kitchen_messages: list[bytes] = []
+    restricted_messages: list[bytes] = []
+    filtered_messages: list[bytes] = []
+    subscriptions = async_get_entity_subscriptions(hass)
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    unsubs = [
+        subscriptions.async_add(
+            EntitySubscription(_collect(all_messages), owner, b"1", None, None)
+        ),
+        subscriptions.async_add(
+            EntitySubscription(
+                _collect(kitchen_messages), owner, b"2", {"light.kitchen"}, None
+            )
+        ),
+        subscriptions.async_add(
+            EntitySubscription(
+                _collect(restricted_messages), hass_admin_user, b"3", None, None
+            )
+        ),
+        subscriptions.async_add(
+            EntitySubscription(
+                _collect(filtered_messages),
+                owner,
+                b"4",
+                None,
+                lambda entity_id: entity_id.startswith("switch."),
+            )
+        ),
+    ]
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("switch.porch", "on")
+
+    assert [json_loads(msg)["id"] for msg in all_messages] == [1, 1]
+    assert [json_loads(msg)["id"] for msg in kitchen_messages] == [2]
+    assert [json_loads(msg)["id"] for msg in restricted_messages] == [3]
+    assert [json_loads(msg)["id"] for msg in filtered_messages] == [4]
+    # The serialized diff is shared, only the message id differs
+    assert kitchen_messages[0] == all_messages[0].replace(b'"id":1}', b'"id":2}')
+    assert json_loads(kitchen_messages[0])["event"] == {
+        "a": {"light.kitchen": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
+    }
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+    hass.states.async_set("light.kitchen", "off")
+    assert len(all_messages) == 2
+    assert len(kitchen_messages) == 1
+
+
+async def test_entity_subscriptions_coalesced_message(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test state changes can be replaced by the full state of the entity."""
+    sent: list[tuple[Hashable, bytes, Callable[[], bytes], bool]] = []
+
+    @callback
+    def send_coalesced_message(
+        key: Hashable,
+        message: bytes,
+        latest_message: Callable[[], bytes],
+        low_priority: bool,
+    ) -> None:
+        sent.append((key, message, latest_message, low_priority))
+
+    hass.states.async_set("light.kitchen", "off", {"color": "red"})
+    unsub = async_get_entity_subscriptions(hass).async_add(
+        EntitySubscription(
+            send_coalesced_message, hass_admin_user, b"5", None, None, True
+        )
+    )
+    hass.states.async_set("light.kitchen", "on", {"color": "red"})
+    hass.states.async_remove("light.kitchen")
+    unsub()
+
+    assert len(sent) == 2
+    key, message, latest_message, low_priority = sent[0]
+    assert key == (b"5", "light.kitchen")
+    assert low_priority is True
+    assert json_loads(message)["event"] == {
+        "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+    assert json_loads(latest_message()) == {
+        "id": 5,
+        "type": "event",
+        "event": {
+            "a": {
+                "light.kitchen": {
+                    "a": {"color": "red"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "s": "on",
+                }
+            }
+        },
+    }
+    key, message, latest_message, low_priority = sent[1]
+    assert key == (b"5", "light.kitchen")
+    assert json_loads(latest_message())["event"] == {"r": ["light.kitchen"]}
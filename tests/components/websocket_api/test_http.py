@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+from functools import partial
 from typing import Any, cast
 from unittest.mock import patch
 
@@ -16,6 +17,7 @@ from homeassistant.components.websocket_api import (
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -345,6 +347,113 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_coalesced_messages(
+    hass: HomeAssistant,
+    mock_low_peak,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test pending messages with the same key are replaced by the latest."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    with patch("homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE", 2):
+        # Below the coalesce threshold messages are queued as is
+        for idx in range(2):
+            instance._send_coalesced_message(
+                "light.kitchen",
+                json_bytes({"diff": idx}),
+                partial(json_bytes, {"latest": idx}),
+                False,
+            )
+        # A client that falls behind only gets the latest message per key
+        for idx in range(2, 20):
+            instance._send_coalesced_message(
+                "light.kitchen",
+                json_bytes({"diff": idx}),
+                partial(json_bytes, {"latest": idx}),
+                False,
+            )
+            instance._send_coalesced_message(
+                "light.porch",
+                json_bytes({"diff": idx}),
+                partial(json_bytes, {"porch": idx}),
+                False,
+            )
+        # Low priority messages are always coalesced
+        instance._send_coalesced_message(
+            "switch.pump", b"{}", partial(json_bytes, {"pump": 1}), True
+        )
+
+    # Replaced messages are dropped from the queue as they pile up
+    assert len(instance._message_queue) < 10
+    assert len(instance._message_queue) - instance._replaced_messages == 5
+    for expected in (
+        {"diff": 0},
+        {"diff": 1},
+        {"latest": 19},
+        {"porch": 19},
+        {"pump": 1},
+    ):
+        assert await websocket_client.receive_json() == expected
+
+    assert not instance._coalesced_messages
+    assert instance._replaced_messages == 0
+    assert "Client unable to keep up with pending messages" not in caplog.text
+
+
+async def test_coalesced_message_moves_to_end_of_queue(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test a replaced message is not sent ahead of messages queued before it."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    for key, cursor in (
+        ("light.kitchen", 1),
+        ("light.porch", 2),
+        ("light.kitchen", 3),
+    ):
+        instance._send_coalesced_message(
+            key, b"{}", partial(json_bytes, {key: cursor}), True
+        )
+    instance._send_message(json_bytes({"diff": 4}))
+
+    for expected in (
+        {"light.porch": 2},
+        {"light.kitchen": 3},
+        {"diff": 4},
+    ):
+        assert await websocket_client.receive_json() == expected
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
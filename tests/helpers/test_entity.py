@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -44,6 +45,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -2665,3 +2667,99 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_async_batch_write_ha_state(hass: HomeAssistant) -> None:
+    """Test state writes are collected and written in one batch."""
+    entities: list[entity.Entity] = []
+    for number in range(3):
+        ent = entity.Entity()
+        ent.entity_id = f"test.batch_{number}"
+        ent.hass = hass
+        ent.platform = MockEntityPlatform(hass, domain="test")
+        entities.append(ent)
+    context = Context()
+    entities[2].async_set_context(context)
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with entity.async_batch_write_ha_state(hass):
+        for ent in entities:
+            ent._attr_state = "first"
+            ent.async_write_ha_state()
+        with entity.async_batch_write_ha_state(hass):
+            entities[0]._attr_state = "second"
+            entities[0].async_write_ha_state()
+        assert not hass.states.async_all()
+
+    assert [
+        (event.data["entity_id"], event.data["new_state"].state)
+        for event in state_changes
+    ] == [
+        ("test.batch_0", "second"),
+        ("test.batch_1", "first"),
+        ("test.batch_2", "first"),
+    ]
+    states = [hass.states.get(ent.entity_id) for ent in entities]
+    assert (
+        states[0].last_updated_timestamp
+        == states[1].last_updated_timestamp
+        == states[2].last_updated_timestamp
+    )
+    assert states[0].context is states[1].context
+    assert states[2].context is context
+
+
+async def test_async_batch_write_ha_state_exception(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the collected states are written when the batch exits with an exception."""
+    ent = entity.Entity()
+    ent.entity_id = "test.batch"
+    ent.hass = hass
+    ent.platform = MockEntityPlatform(hass, domain="test")
+
+    def _write_and_fail() -> None:
+        with entity.async_batch_write_ha_state(hass):
+            ent.async_write_ha_state()
+            raise ValueError("listener failed")
+
+    ent._attr_state = "first"
+    with pytest.raises(ValueError, match="listener failed"):
+        _write_and_fail()
+    assert hass.states.get("test.batch").state == "first"
+
+    # An error writing the states does not replace the exception
+    ent._attr_state = "second"
+    with (
+        patch.object(
+            entity, "async_write_ha_states", side_effect=RuntimeError("write failed")
+        ),
+        pytest.raises(ValueError, match="listener failed"),
+    ):
+        _write_and_fail()
+    assert "Error writing the states of a failed batch" in caplog.text
+    assert "write failed" in caplog.text
+
+    # The next batch is written
+    with entity.async_batch_write_ha_state(hass):
+        ent.async_write_ha_state()
+    assert hass.states.get("test.batch").state == "second"
+
+
+async def test_async_write_ha_states_invalid_state(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an invalid state falls back to unknown in a batch."""
+    ent = entity.Entity()
+    ent.entity_id = "test.invalid"
+    ent.hass = hass
+    ent.platform = MockEntityPlatform(hass, domain="test")
+    ent._attr_state = "x" * 256
+    ent._attr_extra_state_attributes = {"key": "value"}
+
+    entity.async_write_ha_states(hass, [ent])
+
+    state = hass.states.get("test.invalid")
+    assert state.state == STATE_UNKNOWN
+    assert state.attributes == {}
+    assert "Failed to set state for test.invalid, fall back to unknown" in caplog.text
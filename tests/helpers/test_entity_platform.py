@@ -182,6 +182,32 @@ async def test_update_state_adds_entities(hass: HomeAssistant) -> None:
     assert len(hass.states.async_entity_ids()) == 2
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the states of the entities of a platform in one batch."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    await component.async_setup({})
+
+    ent1 = MockEntity(entity_id="test_domain.one")
+    ent2 = MockEntity(entity_id="test_domain.two")
+    await component.async_add_entities([ent1, ent2])
+    platform = ent1.platform
+
+    ent1._attr_state = "on"
+    ent2._values["extra_state_attributes"] = {"key": "value"}
+    platform.async_write_ha_states()
+
+    state1 = hass.states.get("test_domain.one")
+    state2 = hass.states.get("test_domain.two")
+    assert state1.state == "on"
+    assert state2.attributes["key"] == "value"
+    assert state1.last_updated_timestamp == state2.last_updated_timestamp
+
+    ent2._attr_state = "off"
+    platform.async_write_ha_states([ent2])
+    assert hass.states.get("test_domain.one") is state1
+    assert hass.states.get("test_domain.two").state == "off"
+
+
 async def test_update_state_adds_entities_with_update_before_add_true(
     hass: HomeAssistant,
 ) -> None:
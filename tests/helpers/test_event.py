@@ -13,7 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import (
     Event,
@@ -537,6 +537,66 @@ async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     unsub_throws()
 
 
+async def test_async_track_state_change_filtered_update_entities(
+    hass: HomeAssistant,
+) -> None:
+    """Test updating the entities of async_track_state_change_filtered."""
+    entity_ids = []
+
+    @ha.callback
+    def run_callback(event: Event[EventStateChangedData]) -> None:
+        entity_ids.append(event.data["entity_id"])
+
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    track = async_track_state_change_filtered(
+        hass, TrackStates(False, {"light.one", "light.two"}, None), run_callback
+    )
+    track.async_update_listeners(TrackStates(False, {"light.two", "light.three"}, None))
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.three", "on")
+    await hass.async_block_till_done()
+    assert entity_ids == ["light.two", "light.three"]
+
+    track.async_remove()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+    hass.states.async_set("light.two", "off")
+    await hass.async_block_till_done()
+    assert entity_ids == ["light.two", "light.three"]
+
+
+async def test_async_track_state_change_event_dispatch_order(
+    hass: HomeAssistant,
+) -> None:
+    """Test state changes are dispatched in order after the current iteration."""
+    calls = []
+
+    @ha.callback
+    def run_callback(event: Event[EventStateChangedData]) -> None:
+        calls.append((event.data["entity_id"], event.data["new_state"].state))
+        if event.data["entity_id"] == "light.bowl":
+            hass.states.async_set("switch.kitchen", event.data["new_state"].state)
+
+    unsub = async_track_state_change_event(
+        hass, ["light.bowl", "switch.kitchen"], run_callback
+    )
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.bowl", "off")
+    assert calls == []
+
+    await hass.async_block_till_done()
+    assert calls == [
+        ("light.bowl", "on"),
+        ("light.bowl", "off"),
+        ("switch.kitchen", "on"),
+        ("switch.kitchen", "off"),
+    ]
+    unsub()
+
+
 async def test_async_track_state_change_event_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
@@ -1067,6 +1127,97 @@ async def test_track_template_result(hass: HomeAssistant) -> None:
     assert len(wildercard_runs) == 4
 
 
+async def test_track_template_result_shares_identical_renders(
+    hass: HomeAssistant,
+) -> None:
+    """Test identical templates are rendered once per state change."""
+    hass.states.async_set("sensor.test", "1")
+    runs = []
+
+    @ha.callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    for _ in range(3):
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template("{{ states.sensor.test.state }}", hass), None)],
+            run_callback,
+        )
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template("{{ states.sensor.test.state }}{{ suffix }}", hass),
+                {"suffix": "x"},
+            )
+        ],
+        run_callback,
+    )
+    await hass.async_block_till_done()
+
+    render_calls = []
+    original_render = Template.async_render
+
+    def _record_async_render(self, *args, **kwargs):
+        render_calls.append(self.template)
+        return original_render(self, *args, **kwargs)
+
+    with patch.object(Template, "async_render", _record_async_render):
+        hass.states.async_set("sensor.test", "2")
+        await hass.async_block_till_done()
+
+    assert runs == [2, 2, 2, "2x"]
+    assert len(render_calls) == 2
+
+    # State changes are dispatched in the next loop iteration, so the
+    # renders for both changes see the same state and are shared
+    with patch.object(Template, "async_render", _record_async_render):
+        hass.states.async_set("sensor.test", "3")
+        hass.states.async_set("sensor.test", "4")
+        await hass.async_block_till_done()
+
+    assert runs[4:] == [4, 4, 4, "4x"]
+    assert len(render_calls) == 4
+
+
+async def test_track_template_result_shared_render_sees_state_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test a shared render is not reused after the state machine changes."""
+    hass.states.async_set("sensor.test", "1")
+    runs_1 = []
+    runs_2 = []
+    template = "{{ states.sensor.test.state }}"
+
+    info_1 = async_track_template_result(
+        hass,
+        [TrackTemplate(Template(template, hass), None)],
+        lambda event, updates: runs_1.append(updates.pop().result),
+    )
+    info_2 = async_track_template_result(
+        hass,
+        [TrackTemplate(Template(template, hass), None)],
+        lambda event, updates: runs_2.append(updates.pop().result),
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.test", "2")
+    info_1.async_refresh()
+    hass.states.async_set("sensor.test", "3")
+    info_2.async_refresh()
+
+    assert runs_1 == [2]
+    assert runs_2 == [3]
+
+    await hass.async_block_till_done()
+    assert runs_1 == [2, 3]
+    assert runs_2 == [3]
+
+
 async def test_track_template_result_none(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
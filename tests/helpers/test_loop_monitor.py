@@ -0,0 +1,104 @@
+"""Test the loop monitor helper."""
+
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import loop_monitor
+from homeassistant.helpers.loop_monitor import (
+    EXECUTOR_QUEUE,
+    LOOP_LAG,
+    READY_QUEUE,
+    Histogram,
+    async_get_loop_monitor,
+)
+
+
+def test_histogram() -> None:
+    """Test samples are counted in the bucket of their upper bound."""
+    histogram = Histogram((1, 5, 10))
+    for value in (0, 1, 2, 5, 11, 20):
+        histogram.add(value)
+
+    assert histogram.as_dict() == {
+        "bounds": (1, 5, 10),
+        "buckets": [2, 2, 0, 2],
+        "count": 6,
+        "max": 20,
+        "total": 39,
+    }
+
+
+async def test_loop_monitor(hass: HomeAssistant) -> None:
+    """Test sampling the event loop."""
+    monitor = async_get_loop_monitor(hass)
+    assert async_get_loop_monitor(hass) is monitor
+    assert monitor.async_recent_max(LOOP_LAG) is None
+    assert monitor._timer is None
+
+    samples = []
+
+    @callback
+    def _sampled() -> None:
+        samples.append(monitor.as_dict())
+
+    unsub = monitor.async_add_listener(_sampled)
+
+    monitor._async_sample()
+    assert len(samples) == 1
+    assert samples[0]["histograms"][LOOP_LAG]["count"] == 1
+    assert samples[0]["latest"][EXECUTOR_QUEUE] is not None
+    assert monitor.async_recent_max(READY_QUEUE) is not None
+
+    # A sample that runs late is counted as a long running callback
+    monitor._expected = hass.loop.time() - loop_monitor.LONG_CALLBACK_THRESHOLD * 2
+    monitor._async_sample()
+    assert monitor.long_callbacks == 1
+    assert monitor.async_recent_max(LOOP_LAG) > loop_monitor.LONG_CALLBACK_THRESHOLD
+    assert len(samples) == 2
+
+    unsub()
+    assert monitor._timer is None
+    monitor._async_sample()
+    assert len(samples) == 2
+    # A sample taken while stopped does not start sampling
+    assert monitor._timer is None
+
+    release = monitor.async_hold()
+    assert monitor._timer is not None
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+    assert monitor._timer is None
+    release()
+
+
+async def test_loop_monitor_hold(hass: HomeAssistant) -> None:
+    """Test sampling runs while the monitor is held."""
+    monitor = async_get_loop_monitor(hass)
+
+    release_1 = monitor.async_hold()
+    release_2 = monitor.async_hold()
+    assert monitor._timer is not None
+
+    release_1()
+    release_1()
+    assert monitor._timer is not None
+
+    release_2()
+    assert monitor._timer is None
+
+
+async def test_loop_monitor_listener_error(hass: HomeAssistant) -> None:
+    """Test an error in a listener does not stop sampling."""
+    monitor = async_get_loop_monitor(hass)
+
+    @callback
+    def _broken() -> None:
+        raise ValueError
+
+    monitor.async_add_listener(_broken)
+    with patch.object(loop_monitor._LOGGER, "exception") as mock_exception:
+        monitor._async_sample()
+
+    assert mock_exception.called
+    assert monitor._timer is not None
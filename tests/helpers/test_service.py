@@ -934,6 +934,43 @@ async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     assert await service.async_get_all_descriptions(hass) is descriptions
 
 
+async def test_async_get_all_descriptions_reuses_unchanged_domains(
+    hass: HomeAssistant,
+) -> None:
+    """Test the descriptions of unchanged domains are kept when rebuilding."""
+    hass.services.async_register("domain_1", "service_1", lambda call: None)
+    hass.services.async_register("domain_2", "service_1", lambda call: None)
+    service.async_set_service_schema(
+        hass, "domain_1", "service_1", {"description": "Service 1"}
+    )
+    service.async_set_service_schema(
+        hass, "domain_2", "service_1", {"description": "Service 1"}
+    )
+    descriptions = await service.async_get_all_descriptions(hass)
+
+    hass.services.async_register("domain_2", "service_2", lambda call: None)
+    service.async_set_service_schema(
+        hass, "domain_2", "service_2", {"description": "Service 2"}
+    )
+    new_descriptions = await service.async_get_all_descriptions(hass)
+    assert new_descriptions is not descriptions
+    assert new_descriptions["domain_1"] is descriptions["domain_1"]
+    assert new_descriptions["domain_2"] is not descriptions["domain_2"]
+    assert new_descriptions["domain_2"].keys() == {"service_1", "service_2"}
+
+    service.async_set_service_schema(
+        hass, "domain_1", "service_1", {"description": "Updated service 1"}
+    )
+    updated_descriptions = await service.async_get_all_descriptions(hass)
+    assert updated_descriptions is not new_descriptions
+    assert updated_descriptions["domain_1"] is not new_descriptions["domain_1"]
+    assert (
+        updated_descriptions["domain_1"]["service_1"]["description"]
+        == "Updated service 1"
+    )
+    assert updated_descriptions["domain_2"] is new_descriptions["domain_2"]
+
+
 async def test_async_get_all_descriptions_dot_keys(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions with keys starting with a period."""
     service_descriptions = """
@@ -0,0 +1,89 @@
+"""Test the state aggregate helper."""
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers.state_aggregate import (
+    DomainStateAggregate,
+    async_get_state_aggregates,
+)
+
+
+def test_domain_state_aggregate() -> None:
+    """Test the aggregate is updated by adding and removing states."""
+    aggregate = DomainStateAggregate()
+    assert aggregate.count() == 0
+    assert aggregate.total() == 0
+    assert aggregate.minimum() is None
+    assert aggregate.maximum() is None
+
+    aggregate.add("sensor.one", "0.1")
+    aggregate.add("sensor.two", "0.2")
+    aggregate.add("sensor.three", "unavailable")
+    aggregate.add("sensor.four", "nan")
+    assert aggregate.count() == 4
+    assert aggregate.count("0.1") == 1
+    assert aggregate.count("unavailable") == 1
+    assert aggregate.count("on") == 0
+    assert aggregate.minimum() == 0.1
+    assert aggregate.maximum() == 0.2
+
+    aggregate.add("sensor.five", "5")
+    assert aggregate.maximum() == 5
+    aggregate.remove("sensor.five", "5")
+    aggregate.remove("sensor.one", "0.1")
+    assert aggregate.count() == 3
+    assert aggregate.count("0.1") == 0
+    # The sum does not accumulate rounding errors
+    assert aggregate.total() == 0.2
+    assert aggregate.minimum() == 0.2
+    assert aggregate.maximum() == 0.2
+
+
+async def test_state_aggregates(hass: HomeAssistant) -> None:
+    """Test aggregates follow state changes of their domain."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bed", "off")
+    aggregates = async_get_state_aggregates(hass)
+
+    lights = aggregates.async_get("light")
+    assert aggregates.async_get("light") is lights
+    assert lights.count("on") == 1
+
+    hass.states.async_set("light.bed", "on")
+    hass.states.async_set("light.porch", "on")
+    hass.states.async_set("switch.fan", "on")
+    assert lights.count() == 3
+    assert lights.count("on") == 3
+    assert lights.count("off") == 0
+
+    hass.states.async_remove("light.kitchen")
+    assert lights.count() == 2
+    assert aggregates.async_get("switch").count("on") == 1
+
+
+async def test_state_aggregates_created_during_dispatch(hass: HomeAssistant) -> None:
+    """Test an aggregate calculated while a change is dispatched counts it once."""
+    hass.states.async_set("light.kitchen", "off")
+    aggregates: list[DomainStateAggregate] = []
+
+    @callback
+    def _listener(event: Event[EventStateChangedData]) -> None:
+        if not aggregates:
+            aggregates.append(async_get_state_aggregates(hass).async_get("light"))
+            # A change made by a listener of this change is counted
+            hass.states.async_set("light.porch", "on")
+
+    # Listen before the aggregates so they see the change after being seeded
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _listener)
+    async_get_state_aggregates(hass)
+    hass.states.async_set("light.kitchen", "on")
+
+    lights = aggregates[0]
+    assert lights.count() == 2
+    assert lights.count("on") == 2
+    assert lights.count("off") == 0
+
+    hass.states.async_set("light.kitchen", "off")
+    assert lights.count() == 2
+    assert lights.count("on") == 1
+    assert lights.count("off") == 1
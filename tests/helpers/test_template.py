@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import base64
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
 import random
 from types import MappingProxyType
@@ -13,6 +15,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from jinja2.sandbox import ImmutableSandboxedEnvironment
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -22,6 +25,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfArea,
@@ -283,6 +287,98 @@ def test_iterating_domain_states(hass: HomeAssistant) -> None:
     )
 
 
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled template code is kept across restarts."""
+    source = "{{ states('sensor.bytecode') }}"
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(source, hass).async_render() == "unknown"
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    data = hass_storage[template.BYTECODE_STORAGE_KEY]["data"]
+    assert data["version"] == template.BYTECODE_CACHE_VERSION
+    assert len(data["code"]) == 1
+
+    # Simulate a restart by dropping the cache and environment
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch(
+        "jinja2.sandbox.ImmutableSandboxedEnvironment.compile",
+        side_effect=AssertionError("template should not be compiled"),
+    ):
+        assert template.Template(source, hass).async_render() == "unknown"
+
+    # Code is not shared with environments of another kind
+    with patch(
+        "jinja2.sandbox.ImmutableSandboxedEnvironment.compile",
+        wraps=ImmutableSandboxedEnvironment.compile,
+        autospec=True,
+    ) as compile_mock:
+        assert template.Template(source, hass).async_render(strict=True) == "unknown"
+    assert compile_mock.call_count == 1
+
+    # Code that is not a compiled template is ignored
+    key = next(iter(data["code"]))
+    data["code"][key] = base64.b64encode(
+        marshal.dumps(compile("result = 1", "<template>", "exec"))
+    ).decode()
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    assert hass.data[template._BYTECODE_CACHE].get(key) is None
+
+    # Cache from another version is ignored
+    data["version"] = "old"
+    await template.async_load_bytecode_cache(hass)
+    assert hass.data[template._BYTECODE_CACHE].get(key) is None
+
+
+async def test_identical_templates_share_compiled_template(
+    hass: HomeAssistant,
+) -> None:
+    """Test identical templates share one compiled template."""
+    first = template.Template("{{ 1 + 1 }}", hass)
+    second = template.Template("{{ 1 + 1 }}", hass)
+    assert first.async_render() == second.async_render() == 2
+    assert first._compiled is second._compiled
+    limited = template.Template("{{ 1 + 1 }}", hass)
+    assert limited.async_render(limited=True) == 2
+    assert limited._compiled is not first._compiled
+
+
+async def test_states_aggregates(hass: HomeAssistant) -> None:
+    """Test the aggregate functions over the states of a domain."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bed", "off")
+    hass.states.async_set("sensor.one", "1.5")
+    hass.states.async_set("sensor.two", "3")
+    hass.states.async_set("sensor.three", "unknown")
+
+    info = render_to_info(hass, "{{ states_count('light', 'on') }}")
+    assert_result_info(info, 1, [], ["light"])
+    assert info.rate_limit == template.DOMAIN_STATES_RATE_LIMIT
+    assert render(hass, "{{ 'light' | states_count }}") == 2
+    assert render(hass, "{{ states_sum('sensor') }}") == 4.5
+    assert render(hass, "{{ states_min('sensor') }}") == 1.5
+    assert render(hass, "{{ states_max('sensor') }}") == 3
+    assert render(hass, "{{ states_max('switch') }}") is None
+
+    hass.states.async_set("light.bed", "on")
+    hass.states.async_set("sensor.one", "10")
+    assert render(hass, "{{ states_count('light', 'on') }}") == 2
+    assert render(hass, "{{ states_sum('sensor') }}") == 13
+    assert render(hass, "{{ states_min('sensor') }}") == 3
+
+    with pytest.raises(TemplateError):
+        render(hass, "{{ states_count('not a domain') }}")
+
+    with pytest.raises(TemplateError):
+        template.Template("{{ states_count('light') }}", hass).async_render(
+            limited=True
+        )
+
+
 async def test_import(hass: HomeAssistant) -> None:
     """Test that imports work from the config/custom_templates folder."""
     await template.async_load_custom_templates(hass)
@@ -4876,6 +4972,51 @@ def test_generate_select(hass: HomeAssistant) -> None:
     assert info.domains_lifecycle == {"sensor"}
 
 
+async def test_async_render_to_info_shared(hass: HomeAssistant) -> None:
+    """Test identical renders are shared until the state machine changes."""
+    hass.states.async_set("light.kitchen", "on")
+    info = template.Template(
+        "{{ states('light.kitchen') }}", hass
+    ).async_render_to_info_shared()
+    assert info.result() == "on"
+    assert (
+        template.Template(
+            "{{ states('light.kitchen') }}", hass
+        ).async_render_to_info_shared()
+        is info
+    )
+
+    tpl = template.Template("{{ states('light.kitchen') }}{{ x }}", hass)
+    assert tpl.async_render_to_info_shared(
+        {"x": 1}
+    ) is not tpl.async_render_to_info_shared({"x": 2})
+    # Variables that can not be hashed are rendered every time
+    assert tpl.async_render_to_info_shared({"x": [1]}) is not (
+        tpl.async_render_to_info_shared({"x": [1]})
+    )
+    # Variables that are equal but render differently are not shared
+    assert [
+        tpl.async_render_to_info_shared({"x": value}).result()
+        for value in (1, 1.0, True)
+    ] == ["on1", "on1.0", "onTrue"]
+
+    hass.states.async_set("light.kitchen", "off")
+    changed_info = template.Template(
+        "{{ states('light.kitchen') }}", hass
+    ).async_render_to_info_shared()
+    assert changed_info is not info
+    assert changed_info.result() == "off"
+
+    # The shared renders are released in the next event loop iteration
+    await hass.async_block_till_done()
+    assert (
+        template.Template(
+            "{{ states('light.kitchen') }}", hass
+        ).async_render_to_info_shared()
+        is not changed_info
+    )
+
+
 async def test_async_render_to_info_in_conditional(hass: HomeAssistant) -> None:
     """Test extract entities function with none entities stuff."""
     template_str = """
@@ -21,7 +21,7 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import frame, update_coordinator
 from homeassistant.util.dt import utcnow
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, MockEntityPlatform, async_fire_time_changed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -492,6 +492,76 @@ async def test_async_set_updated_data(
     remove_callbacks()
 
 
+async def test_async_update_listeners_writes_states_right_away(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the states written by coordinator entities are not batched by default."""
+    entity = update_coordinator.CoordinatorEntity(crd)
+    entity.entity_id = "sensor.coordinator_0"
+    entity.hass = hass
+    entity.platform = MockEntityPlatform(hass, domain="sensor")
+    crd.async_add_listener(entity._handle_coordinator_update)
+
+    written_during_update = []
+
+    @callback
+    def update_callback() -> None:
+        written_during_update.append(hass.states.get("sensor.coordinator_0"))
+
+    remove_callback = crd.async_add_listener(update_callback)
+
+    crd.async_set_updated_data(100)
+
+    assert written_during_update == [hass.states.get("sensor.coordinator_0")]
+    assert written_during_update[0].state == "unknown"
+
+    remove_callback()
+    await crd.async_shutdown()
+
+
+async def test_async_update_listeners_batches_state_writes(
+    hass: HomeAssistant,
+) -> None:
+    """Test the states written by coordinator entities are written in one batch."""
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        batch_state_writes=True,
+    )
+    entities = []
+    for number in range(2):
+        entity = update_coordinator.CoordinatorEntity(crd)
+        entity.entity_id = f"sensor.coordinator_{number}"
+        entity.hass = hass
+        entity.platform = MockEntityPlatform(hass, domain="sensor")
+        entities.append(entity)
+        crd.async_add_listener(entity._handle_coordinator_update)
+
+    written_during_update = []
+
+    @callback
+    def update_callback() -> None:
+        written_during_update.append(hass.states.get("sensor.coordinator_0"))
+
+    remove_callback = crd.async_add_listener(update_callback)
+
+    crd.async_set_updated_data(100)
+
+    assert written_during_update == [None]
+    state_0 = hass.states.get("sensor.coordinator_0")
+    state_1 = hass.states.get("sensor.coordinator_1")
+    assert state_0.state == state_1.state == "unknown"
+    assert state_0.last_updated_timestamp == state_1.last_updated_timestamp
+    assert state_0.context is state_1.context
+
+    remove_callback()
+    await crd.async_shutdown()
+
+
 async def test_stop_refresh_on_ha_stop(
     hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
 ) -> None:
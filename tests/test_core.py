@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import array
 import asyncio
+from collections import deque
 from datetime import datetime, timedelta
 import functools
 import gc
@@ -1165,6 +1166,179 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_dispatch_rebuilt_on_listen(hass: HomeAssistant) -> None:
+    """Test listeners added or removed are used on the next fire."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(("specific", event))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        calls.append(("match_all", event))
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == []
+
+    unsub = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert [kind for kind, _ in calls] == ["specific"]
+
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert [kind for kind, _ in calls] == ["specific", "specific", "match_all"]
+
+    calls.clear()
+    unsub()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert [kind for kind, _ in calls] == ["match_all"]
+
+    calls.clear()
+    unsub_match_all()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == []
+
+
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listening for events by a value of their event data."""
+    old_count = hass.bus.async_listeners().get("test", 0)
+    calls = []
+    other_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock other listener."""
+        other_calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ("light.kitchen", "light.bed"), listener
+    )
+    unsub_other = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen"], other_listener
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bed"})
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bed",
+    ]
+    assert [event.data["entity_id"] for event in other_calls] == ["light.kitchen"]
+
+    unsub()
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert len(other_calls) == 2
+
+    unsub_other()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(other_calls) == 2
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "entity_id", ["light.bed"], listener)
+
+
+async def test_eventbus_profile(hass: HomeAssistant) -> None:
+    """Test profiling the time spent dispatching events."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return event_data["entity_id"] == "light.kitchen"
+
+    hass.bus.async_listen("test", listener, event_filter=mock_filter)
+    hass.bus.async_listen_keyed("test", "entity_id", ["light.bed"], listener)
+    assert hass.bus.async_profile() is None
+    assert hass.bus.async_stop_profile() is None
+
+    hass.bus.async_start_profile()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bed"})
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    profile = hass.bus.async_profile()
+    assert profile == hass.bus.async_stop_profile()
+    assert hass.bus.async_profile() is None
+    test_event_type = next(
+        stats for stats in profile["event_types"] if stats["event_type"] == "test"
+    )
+    assert test_event_type["count"] == 3
+    assert test_event_type["max"] <= test_event_type["total"]
+    test_listeners = sorted(
+        (stats for stats in profile["listeners"] if stats["event_type"] == "test"),
+        key=lambda stats: stats["filtered"],
+    )
+    assert [stats["count"] for stats in test_listeners] == [1, 1]
+    assert [stats["filtered"] for stats in test_listeners] == [0, 2]
+    assert test_listeners[0]["name"] == "listen test by entity_id"
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener of another callable."""
+
+    # Listeners are grouped by their callable
+    hass.bus.async_start_profile()
+    unsub_other = hass.bus.async_listen("other", other_listener)
+    for _ in range(3):
+        unsub = hass.bus.async_listen("other", listener)
+        hass.bus.async_fire("other", {})
+        unsub()
+    unsub_other()
+    profile = hass.bus.async_stop_profile()
+    assert sorted(
+        (stats["name"], stats["target"], stats["count"])
+        for stats in profile["listeners"]
+        if stats["event_type"] == "other"
+    ) == [
+        (
+            "listen other",
+            f"{__name__}.test_eventbus_profile.<locals>.listener",
+            3,
+        ),
+        (
+            "listen other",
+            f"{__name__}.test_eventbus_profile.<locals>.other_listener",
+            3,
+        ),
+    ]
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1508,6 +1682,67 @@ async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     assert hass.states.get("light.bowl").state == "on"
 
 
+async def test_statemachine_entity_ids_changed_since(hass: HomeAssistant) -> None:
+    """Test looking up the entities that changed since a version."""
+    version = hass.states.version
+    assert hass.states.async_entity_ids_changed_since(version) == set()
+    assert hass.states.async_entity_ids_changed_since(version + 1) is None
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.porch", "on")
+    # Reported states without changes don't count
+    hass.states.async_set("light.porch", "on")
+    assert hass.states.version == version + 2
+    hass.states.async_remove("light.kitchen")
+
+    assert hass.states.async_entity_ids_changed_since(version) == {
+        "light.kitchen",
+        "light.porch",
+    }
+    assert hass.states.async_entity_ids_changed_since(version + 2) == {"light.kitchen"}
+    assert hass.states.async_entity_ids_changed_since(version + 3) == set()
+
+    # Versions older than the remembered changes are unknown
+    with patch.object(hass.states, "_recent_changes", deque(maxlen=2)):
+        for idx in range(3):
+            hass.states.async_set("light.porch", str(idx))
+        current = hass.states.version
+        assert hass.states.async_entity_ids_changed_since(current - 2) == {
+            "light.porch"
+        }
+        assert hass.states.async_entity_ids_changed_since(current - 3) is None
+
+
+async def test_statemachine_dispatched_version(hass: HomeAssistant) -> None:
+    """Test the dispatched version is behind while state changes are dispatched."""
+    dispatched_versions: list[tuple[str, int, int, int | None]] = []
+
+    @ha.callback
+    def _listener(event: ha.Event[ha.EventStateChangedData]) -> None:
+        dispatched_versions.append(
+            (
+                event.data["entity_id"],
+                hass.states.version,
+                hass.states.dispatched_version,
+                hass.states.dispatching_version,
+            )
+        )
+        if event.data["entity_id"] == "light.kitchen":
+            hass.states.async_set("light.porch", "on")
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _listener)
+    version = hass.states.version
+    hass.states.async_set("light.kitchen", "on")
+
+    assert dispatched_versions == [
+        ("light.kitchen", version + 1, version, version + 1),
+        # The kitchen change is still being dispatched
+        ("light.porch", version + 2, version, version + 2),
+    ]
+    assert hass.states.dispatched_version == version + 2
+    assert hass.states.dispatching_version is None
+
+
 async def test_statemachine_last_changed_not_updated_on_same_state(
     hass: HomeAssistant,
 ) -> None:
@@ -1560,6 +1795,124 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting the states of multiple entities in one batch."""
+    hass.states.async_set("light.bowl", "on", {})
+    changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported_events: list[ha.Event] = []
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return True
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        reported_events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_REPORTED, listener, event_filter=mock_filter)
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", None),
+            ("light.Kitchen", 1, {"brightness": 255}),
+            ("light.porch", "off", None),
+        ],
+        timestamp=1234567.0,
+    )
+    await hass.async_block_till_done()
+
+    assert len(reported_events) == 1
+    assert [event.data["entity_id"] for event in changed_events] == [
+        "light.kitchen",
+        "light.porch",
+    ]
+    kitchen = hass.states.get("light.kitchen")
+    porch = hass.states.get("light.porch")
+    assert kitchen.state == "1"
+    assert kitchen.attributes == {"brightness": 255}
+    assert porch.attributes == {}
+    assert kitchen.last_updated_timestamp == porch.last_updated_timestamp == 1234567.0
+    assert kitchen.last_updated == porch.last_updated
+    assert kitchen.context is porch.context
+    assert reported_events[0].context is kitchen.context
+    assert hass.states.get("light.bowl").last_reported_timestamp == 1234567.0
+
+    hass.states.async_set_many([("light.bowl", "on", None)], force_update=True)
+    await hass.async_block_till_done()
+    assert len(changed_events) == 3
+
+
+async def test_statemachine_async_set_many_internal_context(
+    hass: HomeAssistant,
+) -> None:
+    """Test states with a context of their own keep it in a batch."""
+    context = ha.Context()
+    batch_context = ha.Context()
+    hass.states.async_set_many_internal(
+        [
+            ("light.bowl", "on", {}, False, context, None),
+            ("light.kitchen", "on", {}, False, None, None),
+        ],
+        batch_context,
+        time.time(),
+    )
+    assert hass.states.get("light.bowl").context is context
+    assert hass.states.get("light.kitchen").context is batch_context
+
+
+async def test_statemachine_shares_attributes(hass: HomeAssistant) -> None:
+    """Test async_set shares static attribute values between states."""
+    prefix = "Pow"
+    for entity_id in ("sensor.power_1", "sensor.power_2"):
+        # Build the values at runtime so they are not the same objects
+        hass.states.async_set(
+            entity_id,
+            "1",
+            {"friendly_name": f"{prefix}er", "other": f"{prefix}er", "min": 1.5},
+        )
+    state_1 = hass.states.get("sensor.power_1")
+    state_2 = hass.states.get("sensor.power_2")
+    assert state_1.attributes is not state_2.attributes
+    assert isinstance(state_1.attributes, ReadOnlyDict)
+    assert state_1.attributes == {
+        "friendly_name": "Power",
+        "other": "Power",
+        "min": 1.5,
+    }
+    assert state_1.attributes["friendly_name"] is state_2.attributes["friendly_name"]
+    # Only the values of static attributes are shared
+    assert state_1.attributes["other"] is not state_2.attributes["other"]
+
+    hass.states.async_set("sensor.power_1", "4", {})
+    hass.states.async_set("sensor.power_2", "4")
+    assert (
+        hass.states.get("sensor.power_1").attributes
+        is hass.states.get("sensor.power_2").attributes
+    )
+
+
+async def test_statemachine_shared_attributes_are_bounded(
+    hass: HomeAssistant,
+) -> None:
+    """Test the least recently used shared attribute values are dropped."""
+    hass.states._interned_attributes.set_size(2)
+    prefix = "Pow"
+    hass.states.async_set("sensor.power", "1", {"friendly_name": f"{prefix}er"})
+    for idx in range(3):
+        hass.states.async_set(f"sensor.other_{idx}", "1", {"icon": f"mdi:{idx}"})
+    hass.states.async_set("sensor.power_2", "1", {"friendly_name": f"{prefix}er"})
+    assert (
+        hass.states.get("sensor.power").attributes["friendly_name"]
+        is not hass.states.get("sensor.power_2").attributes["friendly_name"]
+    )
+    hass.states.async_set("sensor.power_3", "1", {"friendly_name": f"{prefix}er"})
+    assert (
+        hass.states.get("sensor.power_2").attributes["friendly_name"]
+        is hass.states.get("sensor.power_3").attributes["friendly_name"]
+    )
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")